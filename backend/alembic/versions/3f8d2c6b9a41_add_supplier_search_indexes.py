@@ -0,0 +1,78 @@
+"""add supplier search indexes (pg_trgm / sqlite fts5)
+
+Revision ID: 3f8d2c6b9a41
+Revises: 5a91c07e3d28
+Create Date: 2026-10-19 12:58:09.771342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8d2c6b9a41'
+down_revision: Union[str, Sequence[str], None] = '5a91c07e3d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_COLUMNS = ['normalized_name', 'industry', 'country', 'address', 'naics_code']
+
+FTS_COLUMNS = 'normalized_name, industry, country, address, naics_code'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in TRIGRAM_COLUMNS:
+            op.create_index(
+                f'ix_suppliers_{column}_trgm',
+                'suppliers',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+    elif dialect == 'sqlite':
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS suppliers_fts USING fts5("
+            f"{FTS_COLUMNS}, content='suppliers', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS suppliers_fts_ai AFTER INSERT ON suppliers BEGIN "
+            f"INSERT INTO suppliers_fts(rowid, {FTS_COLUMNS}) "
+            f"VALUES (new.id, new.normalized_name, new.industry, new.country, new.address, new.naics_code); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS suppliers_fts_ad AFTER DELETE ON suppliers BEGIN "
+            f"INSERT INTO suppliers_fts(suppliers_fts, rowid, {FTS_COLUMNS}) "
+            f"VALUES ('delete', old.id, old.normalized_name, old.industry, old.country, old.address, old.naics_code); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS suppliers_fts_au AFTER UPDATE ON suppliers BEGIN "
+            f"INSERT INTO suppliers_fts(suppliers_fts, rowid, {FTS_COLUMNS}) "
+            f"VALUES ('delete', old.id, old.normalized_name, old.industry, old.country, old.address, old.naics_code); "
+            f"INSERT INTO suppliers_fts(rowid, {FTS_COLUMNS}) "
+            f"VALUES (new.id, new.normalized_name, new.industry, new.country, new.address, new.naics_code); END"
+        )
+        op.execute("INSERT INTO suppliers_fts(suppliers_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        for column in TRIGRAM_COLUMNS:
+            op.drop_index(f'ix_suppliers_{column}_trgm', table_name='suppliers')
+
+    elif dialect == 'sqlite':
+        for trigger in ('suppliers_fts_ai', 'suppliers_fts_ad', 'suppliers_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS suppliers_fts')
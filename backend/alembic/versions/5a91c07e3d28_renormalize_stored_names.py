@@ -0,0 +1,81 @@
+"""renormalize stored names with the shared normalizer
+
+Revision ID: 5a91c07e3d28
+Revises: 8b6e2d0f4a17
+Create Date: 2026-10-19 12:21:36.604187
+
+"""
+import re
+import string
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a91c07e3d28'
+down_revision: Union[str, Sequence[str], None] = '8b6e2d0f4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of app.core.normalization.normalize as of this revision:
+# later changes to the shared normalizer must not rewrite this migration.
+_ASCII_TABLE = str.maketrans("", "", string.punctuation.replace("_", ""))
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalize(name: str) -> str:
+    if not name:
+        return ""
+
+    text = unicodedata.normalize("NFKD", name)
+    if not text.isascii():
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold()
+
+    if text.isascii():
+        text = text.translate(_ASCII_TABLE)
+    else:
+        text = _NON_WORD.sub("", text)
+
+    return " ".join(text.split())
+
+
+def _renormalize(table: str, source: str, target: str, unique_with: tuple = ()):
+    bind = op.get_bind()
+    columns = ", ".join(("id", source, target) + unique_with)
+    rows = bind.execute(sa.text(f"SELECT {columns} FROM {table}")).fetchall()
+
+    # Skip rows whose new form would collide with a unique constraint
+    taken = {(row[2],) + tuple(row[3:]) for row in rows}
+
+    for row in rows:
+        new_value = normalize(row[1])
+        if new_value == row[2]:
+            continue
+
+        key = (new_value,) + tuple(row[3:])
+        if unique_with and key in taken:
+            continue
+
+        taken.add(key)
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {target} = :value WHERE id = :id"),
+            {"value": new_value, "id": row[0]},
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _renormalize('global_entities', 'canonical_name', 'normalized_name')
+    _renormalize('global_entity_aliases', 'alias', 'normalized_alias')
+    _renormalize('suppliers', 'name', 'normalized_name', unique_with=('organization_id', 'country'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Old normalized forms are not recoverable; the new ones stay valid
+    pass
@@ -0,0 +1,37 @@
+"""add tenant scope indexes
+
+Revision ID: 6d4b8a1e2c95
+Revises: 9c2e7b4d1f53
+Create Date: 2026-10-19 15:02:11.487205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d4b8a1e2c95'
+down_revision: Union[str, Sequence[str], None] = '9c2e7b4d1f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_suppliers_org_id', 'suppliers', ['organization_id', 'id'], unique=False)
+    op.create_index(
+        'ix_suppliers_global_id',
+        'suppliers',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_global'),
+        sqlite_where=sa.text('is_global = 1'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_suppliers_global_id', table_name='suppliers')
+    op.drop_index('ix_suppliers_org_id', table_name='suppliers')
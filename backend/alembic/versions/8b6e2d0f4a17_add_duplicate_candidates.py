@@ -0,0 +1,42 @@
+"""add duplicate candidates
+
+Revision ID: 8b6e2d0f4a17
+Revises: d7a3f19c5e62
+Create Date: 2026-10-19 11:40:53.917264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b6e2d0f4a17'
+down_revision: Union[str, Sequence[str], None] = 'd7a3f19c5e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('duplicate_candidates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('record_type', sa.String(), nullable=False),
+    sa.Column('keep_id', sa.Integer(), nullable=False),
+    sa.Column('duplicate_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('blocking_key', sa.String(), nullable=True),
+    sa.Column('proposed_alias', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('record_type', 'keep_id', 'duplicate_id', name='uq_duplicate_candidate_pair')
+    )
+    op.create_index(op.f('ix_duplicate_candidates_status'), 'duplicate_candidates', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_duplicate_candidates_status'), table_name='duplicate_candidates')
+    op.drop_table('duplicate_candidates')
@@ -0,0 +1,30 @@
+"""add keyset pagination indexes
+
+Revision ID: 9c2e7b4d1f53
+Revises: 3f8d2c6b9a41
+Create Date: 2026-10-19 13:34:50.118462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e7b4d1f53'
+down_revision: Union[str, Sequence[str], None] = '3f8d2c6b9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_assessment_history_supplier_created', 'assessment_history', ['supplier_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_logs_timestamp_id', table_name='audit_logs')
+    op.drop_index('ix_assessment_history_supplier_created', table_name='assessment_history')
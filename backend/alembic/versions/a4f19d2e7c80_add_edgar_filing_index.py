@@ -0,0 +1,64 @@
+"""add edgar filing index
+
+Revision ID: a4f19d2e7c80
+Revises: e2a7c5f81b36
+Create Date: 2026-10-19 17:10:42.335917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f19d2e7c80'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c5f81b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('edgar_companies',
+    sa.Column('cik', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('normalized_name', sa.String(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('cik')
+    )
+    op.create_index(op.f('ix_edgar_companies_normalized_name'), 'edgar_companies', ['normalized_name'], unique=False)
+    op.create_table('edgar_filings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cik', sa.String(), nullable=False),
+    sa.Column('form_type', sa.String(), nullable=False),
+    sa.Column('date_filed', sa.Date(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('cik', 'filename', 'form_type', name='uq_edgar_filing')
+    )
+    op.create_index('ix_edgar_filings_cik_date', 'edgar_filings', ['cik', 'date_filed'], unique=False)
+    op.create_index(op.f('ix_edgar_filings_date_filed'), 'edgar_filings', ['date_filed'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_edgar_companies_normalized_name_trgm',
+            'edgar_companies',
+            ['normalized_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'normalized_name': 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_edgar_companies_normalized_name_trgm', table_name='edgar_companies')
+
+    op.drop_index(op.f('ix_edgar_filings_date_filed'), table_name='edgar_filings')
+    op.drop_index('ix_edgar_filings_cik_date', table_name='edgar_filings')
+    op.drop_table('edgar_filings')
+    op.drop_index(op.f('ix_edgar_companies_normalized_name'), table_name='edgar_companies')
+    op.drop_table('edgar_companies')
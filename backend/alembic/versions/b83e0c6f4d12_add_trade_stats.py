@@ -0,0 +1,41 @@
+"""add trade stats
+
+Revision ID: b83e0c6f4d12
+Revises: a4f19d2e7c80
+Create Date: 2026-10-19 17:48:05.614370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83e0c6f4d12'
+down_revision: Union[str, Sequence[str], None] = 'a4f19d2e7c80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('trade_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country_code', sa.String(), nullable=True),
+    sa.Column('country_name', sa.String(), nullable=False),
+    sa.Column('hs_chapter', sa.String(), nullable=False),
+    sa.Column('period', sa.String(), nullable=False),
+    sa.Column('general_value', sa.BigInteger(), nullable=True),
+    sa.Column('consumption_value', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('country_name', 'hs_chapter', 'period', name='uq_trade_stat')
+    )
+    op.create_index('ix_trade_stats_country_period', 'trade_stats', ['country_name', 'period'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_trade_stats_country_period', table_name='trade_stats')
+    op.drop_table('trade_stats')
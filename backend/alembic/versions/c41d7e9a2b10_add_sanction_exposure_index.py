@@ -0,0 +1,39 @@
+"""add sanction exposure index
+
+Revision ID: c41d7e9a2b10
+Revises: 2f5c8e259bd0
+Create Date: 2026-10-19 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2b10'
+down_revision: Union[str, Sequence[str], None] = '2f5c8e259bd0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sanction_exposure_index',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('supplier_name', sa.String(), nullable=False),
+    sa.Column('sanctioned_entity', sa.String(), nullable=False),
+    sa.Column('distance', sa.Integer(), nullable=False),
+    sa.Column('path', sa.JSON(), nullable=False),
+    sa.Column('strongest_relation', sa.String(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sanction_exposure_index_supplier_name'), 'sanction_exposure_index', ['supplier_name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sanction_exposure_index_supplier_name'), table_name='sanction_exposure_index')
+    op.drop_table('sanction_exposure_index')
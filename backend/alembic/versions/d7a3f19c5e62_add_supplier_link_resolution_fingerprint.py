@@ -0,0 +1,30 @@
+"""add supplier link resolution fingerprint
+
+Revision ID: d7a3f19c5e62
+Revises: c41d7e9a2b10
+Create Date: 2026-10-19 11:02:17.284906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f19c5e62'
+down_revision: Union[str, Sequence[str], None] = 'c41d7e9a2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('supplier_entity_links', sa.Column('resolution_fingerprint', sa.String(), nullable=True))
+    op.create_index(op.f('ix_supplier_entity_links_supplier_id'), 'supplier_entity_links', ['supplier_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_supplier_entity_links_supplier_id'), table_name='supplier_entity_links')
+    op.drop_column('supplier_entity_links', 'resolution_fingerprint')
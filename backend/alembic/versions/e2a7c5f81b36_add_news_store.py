@@ -0,0 +1,56 @@
+"""add news store
+
+Revision ID: e2a7c5f81b36
+Revises: 6d4b8a1e2c95
+Create Date: 2026-10-19 16:21:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c5f81b36'
+down_revision: Union[str, Sequence[str], None] = '6d4b8a1e2c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('news_articles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('supplier_id', sa.Integer(), nullable=False),
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('source_name', sa.String(), nullable=True),
+    sa.Column('image', sa.String(), nullable=True),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.Column('risk_keywords', sa.JSON(), nullable=True),
+    sa.Column('risk_score', sa.Integer(), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('supplier_id', 'url', name='uq_news_article_supplier_url')
+    )
+    op.create_index('ix_news_articles_supplier_published', 'news_articles', ['supplier_id', 'published_at'], unique=False)
+    op.create_table('supplier_news_state',
+    sa.Column('supplier_id', sa.Integer(), nullable=False),
+    sa.Column('last_published_at', sa.DateTime(), nullable=True),
+    sa.Column('last_checked_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
+    sa.PrimaryKeyConstraint('supplier_id')
+    )
+    op.create_index(op.f('ix_supplier_news_state_last_checked_at'), 'supplier_news_state', ['last_checked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_supplier_news_state_last_checked_at'), table_name='supplier_news_state')
+    op.drop_table('supplier_news_state')
+    op.drop_index('ix_news_articles_supplier_published', table_name='news_articles')
+    op.drop_table('news_articles')
@@ -0,0 +1,28 @@
+"""add user token version
+
+Revision ID: f5b2c8d09e17
+Revises: b83e0c6f4d12
+Create Date: 2026-10-19 16:40:52.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b2c8d09e17'
+down_revision: Union[str, Sequence[str], None] = 'b83e0c6f4d12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
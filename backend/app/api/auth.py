@@ -11,6 +11,10 @@ from app.core.security import (
     verify_token,
     hash_password,
     verify_password,
+    user_claims,
+    refresh_claims,
+    check_refresh_token,
+    get_current_user,
 )
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -78,13 +82,9 @@ def login(
             detail="Invalid credentials"
         )
 
-    access_token = create_access_token(
-        {"sub": user.username, "role": user.role}
-    )
+    access_token = create_access_token(user_claims(user))
 
-    refresh_token = create_refresh_token(
-        {"sub": user.username, "role": user.role}
-    )
+    refresh_token = create_refresh_token(refresh_claims(user))
 
     # Access Token Cookie
     response.set_cookie(
@@ -115,33 +115,7 @@ def login(
 # GET CURRENT USER (READ FROM COOKIE)
 # =====================================================
 @router.get("/me")
-def get_me(
-    request: Request,
-    db: Session = Depends(get_db)
-):
-    access_token = request.cookies.get("access_token")
-
-    if not access_token:
-        raise HTTPException(
-            status_code=401,
-            detail="Not authenticated"
-        )
-
-    payload = verify_token(access_token, "access")
-
-    username = payload.get("sub")
-
-    user = db.query(User).filter(
-        User.username == username
-    ).first()
-
-    if not user:
-        print(f"Auth Endpoint: User {username} not found in DB")
-        raise HTTPException(
-            status_code=401,
-            detail="User not found"
-        )
-
+def get_me(user=Depends(get_current_user)):
     return {
         "id": user.id,
         "username": user.username,
@@ -157,6 +131,7 @@ def get_me(
 def refresh(
     request: Request,
     response: Response,
+    db: Session = Depends(get_db),
 ):
     refresh_token = request.cookies.get("refresh_token")
 
@@ -168,12 +143,10 @@ def refresh(
 
     payload = verify_token(refresh_token, "refresh")
 
-    new_access_token = create_access_token(
-        {
-            "sub": payload["sub"],
-            "role": payload.get("role"),
-        }
-    )
+    # Rejected once the user's tokens are revoked; otherwise fresh claims
+    user = check_refresh_token(db, payload)
+
+    new_access_token = create_access_token(user_claims(user))
 
     response.set_cookie(
         key="access_token",
@@ -0,0 +1,11 @@
+import os
+
+
+# =====================================================
+# SHARED OUTBOUND SETTINGS
+# =====================================================
+# Settings read by more than one layer (services, NLP). Kept here so
+# neither layer imports the other just for a constant.
+
+# SEC asks every automated client to identify itself (name + contact)
+SEC_EDGAR_UA = os.getenv("SEC_EDGAR_USER_AGENT", "VDashboard admin@example.com")
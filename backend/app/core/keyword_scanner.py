@@ -0,0 +1,122 @@
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# =====================================================
+# WEIGHTED RISK KEYWORD SCANNER
+# =====================================================
+# Every keyword of every set is compiled into ONE case-insensitive regex
+# (word-bounded alternation, longest first), so a text is scanned once
+# regardless of how many keywords are configured.
+#
+# Keyword syntax: "bankruptcy" matches the word; a trailing "*" matches
+# any word starting with it ("sanction*" -> sanctions, sanctioned).
+
+DEFAULT_RISK_KEYWORDS = {
+    "sanctions": {
+        "sanction*": 1.5,
+        "embargo*": 1.5,
+    },
+    "financial_crime": {
+        "fraud*": 1.5,
+        "money laundering": 1.5,
+        "bribe*": 1.5,
+        "corruption": 1.5,
+    },
+    "legal": {
+        "indict*": 1.5,
+        "lawsuit*": 1.0,
+        "violation*": 1.0,
+        "penalty": 1.0,
+        "penalties": 1.0,
+        "investigation*": 1.0,
+        "seizure*": 1.0,
+        "fined": 1.0,
+        "fine": 0.5,
+    },
+    "financial_distress": {
+        "bankrupt*": 1.0,
+        "default*": 0.5,
+    },
+}
+
+# Optional JSON file with the same {category: {keyword: weight}} shape
+RISK_KEYWORDS_FILE = os.getenv("RISK_KEYWORDS_FILE")
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    keyword: str
+    category: str
+    weight: float
+    start: int
+    end: int
+
+
+class KeywordScanner:
+    def __init__(self, keyword_sets: dict):
+        self.entries = []
+        alternatives = []
+
+        keywords = [
+            (keyword.strip().lower(), category, float(weight))
+            for category, weighted in keyword_sets.items()
+            for keyword, weight in weighted.items()
+            if keyword.strip()
+        ]
+
+        # Longest first: "money laundering" wins over any shorter overlap
+        keywords.sort(key=lambda k: -len(k[0]))
+
+        for index, (keyword, category, weight) in enumerate(keywords):
+            prefix = keyword.endswith("*")
+            literal = keyword.rstrip("*")
+
+            pattern = r"\s+".join(re.escape(word) for word in literal.split())
+            pattern += r"\w*" if prefix else r"\b"
+
+            alternatives.append(f"(?P<k{index}>{pattern})")
+            self.entries.append((literal, category, weight))
+
+        self.pattern = (
+            re.compile(r"\b(?:" + "|".join(alternatives) + ")", re.IGNORECASE)
+            if alternatives else None
+        )
+
+    def scan(self, text: str) -> list:
+        """All keyword hits in one pass, in text order."""
+        if not text or self.pattern is None:
+            return []
+
+        hits = []
+        for match in self.pattern.finditer(text):
+            keyword, category, weight = self.entries[int(match.lastgroup[1:])]
+            hits.append(KeywordHit(keyword, category, weight, match.start(), match.end()))
+
+        return hits
+
+    def matched_keywords(self, text: str) -> list:
+        """Distinct keywords found, in first-seen order."""
+        return list(dict.fromkeys(hit.keyword for hit in self.scan(text)))
+
+    def score(self, text: str) -> float:
+        """Sum of weights of the distinct keywords found."""
+        weights = {hit.keyword: hit.weight for hit in self.scan(text)}
+        return sum(weights.values())
+
+
+@lru_cache(maxsize=1)
+def get_risk_scanner() -> KeywordScanner:
+    keyword_sets = DEFAULT_RISK_KEYWORDS
+
+    if RISK_KEYWORDS_FILE:
+        try:
+            with open(RISK_KEYWORDS_FILE, encoding="utf-8") as f:
+                keyword_sets = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load {RISK_KEYWORDS_FILE}, using default risk keywords: {e}")
+
+    return KeywordScanner(keyword_sets)
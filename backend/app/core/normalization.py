@@ -0,0 +1,69 @@
+import re
+import string
+import unicodedata
+from functools import lru_cache
+
+
+# =====================================================
+# NAME NORMALIZATION (SHARED BY ALL SERVICES)
+# =====================================================
+# One definition of "the same name" for entity resolution, sanctions
+# screening, list ingestion and search. Stored normalized_name /
+# normalized_alias columns must be produced by this module.
+
+NORMALIZE_CACHE_SIZE = 100_000
+
+# ASCII fast path: drop punctuation ("_" is a word character, kept)
+_ASCII_PUNCTUATION = string.punctuation.replace("_", "")
+_ASCII_TABLE = str.maketrans("", "", _ASCII_PUNCTUATION)
+
+# Non-ASCII path: same rule as the ASCII table for every script
+_NON_WORD = re.compile(r"[^\w\s]")
+
+LEGAL_SUFFIXES = frozenset({
+    "co", "company", "corp", "corporation", "inc", "incorporated",
+    "ltd", "limited", "llc", "lp", "llp", "plc", "gmbh", "ag", "kg",
+    "sa", "sarl", "sas", "srl", "spa", "bv", "nv", "oy", "oyj", "ab",
+    "as", "asa", "kk", "pte", "pty", "bhd", "sdn", "jsc", "pjsc",
+})
+
+
+def _fold(text: str) -> str:
+    """Unicode compatibility folding: "Ｓｏｃｉéｔé" -> "societe"."""
+    text = unicodedata.normalize("NFKD", text)
+    if not text.isascii():
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return text.casefold()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(name: str) -> str:
+    text = _fold(name)
+
+    if text.isascii():
+        text = text.translate(_ASCII_TABLE)
+    else:
+        text = _NON_WORD.sub("", text)
+
+    return " ".join(text.split())
+
+
+def normalize(name: str) -> str:
+    """Folded, lower-case, punctuation-free, single-spaced name."""
+    if not name:
+        return ""
+    return _normalize_cached(name)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def core_name(normalized: str) -> str:
+    """Normalized name without trailing legal-form tokens ("co", "ltd", ...)."""
+    tokens = normalized.split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def normalize_core(name: str) -> str:
+    """normalize() + legal-suffix stripping, for fuzzy comparison."""
+    return core_name(normalize(name))
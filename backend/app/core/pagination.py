@@ -0,0 +1,88 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+
+# =====================================================
+# KEYSET (CURSOR) PAGINATION
+# =====================================================
+# Cursors are opaque base64 tokens over the last row's (sort_key, id).
+# Every page is a range seek on that pair, so page 1000 costs the same
+# as page 1 (no OFFSET scan-and-discard).
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        payload = {"t": "dt", "v": sort_value.isoformat(), "id": row_id}
+    else:
+        payload = {"t": "raw", "v": sort_value, "id": row_id}
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+        value = payload["v"]
+        if payload["t"] == "dt":
+            value = datetime.fromisoformat(value)
+
+        return value, int(payload["id"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_size(limit: int) -> int:
+    return max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+
+def keyset_page(
+    query,
+    sort_expr,
+    id_column,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = True,
+    row_entity=lambda row: row,
+    sort_value=None,
+):
+    """
+    Apply (sort_expr, id) ordering + cursor seek to `query` and fetch one
+    page. Returns (rows, next_cursor); next_cursor is None on the last page.
+
+    row_entity: maps a result row to the object carrying the id.
+    sort_value: maps a result row to its sort key (defaults to the
+    attribute named like sort_expr on the entity).
+    """
+    limit = page_size(limit)
+    key = tuple_(sort_expr, id_column)
+
+    if cursor:
+        last_value, last_id = decode_cursor(cursor)
+        bound = tuple_(last_value, last_id)
+        query = query.filter(key < bound if descending else key > bound)
+
+    if descending:
+        query = query.order_by(sort_expr.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_expr.asc(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        value = sort_value(last) if sort_value else getattr(row_entity(last), sort_expr.key)
+        next_cursor = encode_cursor(value, row_entity(last).id)
+
+    return rows, next_cursor
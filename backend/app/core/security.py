@@ -1,4 +1,5 @@
 from jose import JWTError, jwt
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from fastapi import Request, HTTPException, Depends, status
 from sqlalchemy.orm import Session
@@ -18,6 +19,11 @@ ALGORITHM = "HS256"
 ACCESS_EXPIRE_MINUTES = 15
 REFRESH_EXPIRE_DAYS = 7
 
+# users.token_version mirrored in Redis, read on every request. Bumps
+# write through; a version changed straight in SQL shows up within this TTL
+TOKEN_VERSION_KEY = "auth:token_version:{user_id}"
+TOKEN_VERSION_CACHE_SECONDS = int(os.getenv("AUTH_TOKEN_VERSION_CACHE_SECONDS", "300"))
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -25,11 +31,33 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # TOKEN CREATION
 # =====================================================
 
+def user_claims(user) -> dict:
+    """Claims that let get_current_user authorize without a DB query."""
+    return {
+        "sub": user.username,
+        "user_id": user.id,
+        "organization_id": user.organization_id,
+        "role": user.role,
+        "ver": user.token_version or 0,
+    }
+
+
+def refresh_claims(user) -> dict:
+    """Refresh tokens carry the token version too: revocation covers them."""
+    return {
+        "sub": user.username,
+        "user_id": user.id,
+        "ver": user.token_version or 0,
+    }
+
+
 def create_access_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_EXPIRE_MINUTES)
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=ACCESS_EXPIRE_MINUTES)
     to_encode.update({
         "exp": expire,
+        "iat": now,
         "type": "access"
     })
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -71,6 +99,138 @@ def verify_token(token: str, expected_type: str):
         )
 
 
+# =====================================================
+# AUTHENTICATED USER + TOKEN VERSIONS
+# =====================================================
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """What routes need from the caller; built from token claims."""
+    id: int
+    username: str
+    role: str
+    organization_id: int
+
+
+def _as_authenticated(user: User) -> AuthenticatedUser:
+    return AuthenticatedUser(
+        id=user.id,
+        username=user.username,
+        role=user.role,
+        organization_id=user.organization_id,
+    )
+
+
+def _token_version(db: Session, user_id: int):
+    """Current users.token_version (None for a deleted user)."""
+    key = TOKEN_VERSION_KEY.format(user_id=user_id)
+
+    try:
+        from app.worker.celery_app import redis_client
+        cached = redis_client.get(key)
+    except Exception:
+        # Redis down: read the column directly
+        cached = None
+
+    if cached is not None:
+        return int(cached) if cached else None
+
+    row = db.query(User.token_version).filter(User.id == user_id).first()
+    version = (row[0] or 0) if row else None
+
+    try:
+        from app.worker.celery_app import redis_client
+        # NX: never overwrite a version a concurrent bump just published
+        redis_client.set(
+            key,
+            "" if version is None else version,
+            ex=TOKEN_VERSION_CACHE_SECONDS,
+            nx=True,
+        )
+    except Exception:
+        pass
+
+    return version
+
+
+def revoke_user_tokens(db: Session, user: User):
+    """
+    Invalidate every access and refresh token issued to `user` so far:
+    call on role / organization / password changes and before deleting a
+    user. Commits.
+    """
+    db.query(User).filter(User.id == user.id).update(
+        {User.token_version: User.token_version + 1},
+        synchronize_session=False,
+    )
+    db.commit()
+    db.refresh(user)
+
+    try:
+        from app.worker.celery_app import redis_client
+        redis_client.set(
+            TOKEN_VERSION_KEY.format(user_id=user.id),
+            user.token_version,
+            ex=TOKEN_VERSION_CACHE_SECONDS,
+        )
+    except Exception as e:
+        # The cached value ages out within TOKEN_VERSION_CACHE_SECONDS
+        print(f"⚠️ Token version publish failed: {e}")
+
+
+def update_user_access(db: Session, user: User, role: str = None,
+                       organization_id: int = None, password: str = None):
+    """
+    Change what a user may access and revoke their tokens in the same
+    step. Every role / organization / password change goes through here.
+    Commits.
+    """
+    changed = False
+
+    if role is not None and role != user.role:
+        user.role = role
+        changed = True
+
+    if organization_id is not None and organization_id != user.organization_id:
+        user.organization_id = organization_id
+        changed = True
+
+    if password is not None:
+        user.hashed_password = hash_password(password)
+        changed = True
+
+    if changed:
+        revoke_user_tokens(db, user)
+
+    return changed
+
+
+def check_refresh_token(db: Session, payload: dict) -> User:
+    """The user a refresh token belongs to, if it has not been revoked."""
+    user_id = payload.get("user_id")
+
+    if user_id is not None:
+        user = db.get(User, user_id)
+    else:
+        # Refresh token issued before identity claims
+        user = db.query(User).filter(User.username == payload.get("sub")).first()
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+
+    # Read from the row, not the cache: refreshes are rare
+    if payload.get("ver", 0) != (user.token_version or 0):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revoked"
+        )
+
+    return user
+
+
 # =====================================================
 # CURRENT USER (COOKIE BASED)
 # =====================================================
@@ -97,15 +257,40 @@ def get_current_user(
             detail="Invalid token payload"
         )
 
-    user = db.query(User).filter(User.username == username).first()
+    user_id = payload.get("user_id")
 
-    if not user:
+    if user_id is None:
+        # Legacy token without identity claims
+        db_user = db.query(User).filter(User.username == username).first()
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        return _as_authenticated(db_user)
+
+    version = _token_version(db, user_id)
+
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
 
-    return user
+    if payload.get("ver", 0) != version:
+        # Role / org / password changed since issue: the client refreshes
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revoked"
+        )
+
+    # Hot path: claims are current, no database round-trip
+    return AuthenticatedUser(
+        id=user_id,
+        username=username,
+        role=payload.get("role"),
+        organization_id=payload.get("organization_id"),
+    )
 
 
 # =====================================================
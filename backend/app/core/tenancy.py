@@ -0,0 +1,43 @@
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from app.models import Supplier
+
+
+# =====================================================
+# TENANT SCOPE (ORG ROWS + GLOBAL CATALOG)
+# =====================================================
+# `organization_id = :org OR is_global` defeats most indexes. Instead,
+# visible suppliers are a UNION ALL of two index-friendly branches:
+#   - the tenant's rows        -> ix_suppliers_org_id (organization_id, id)
+#   - global rows it doesn't own -> ix_suppliers_global_id (id) WHERE is_global
+# Postgres pushes filters / ORDER BY id LIMIT n into both branches.
+
+
+def tenant_suppliers(organization_id):
+    """Aliased Supplier entity over the tenant's visible suppliers."""
+    tenant_rows = select(Supplier).where(Supplier.organization_id == organization_id)
+
+    global_rows = select(Supplier).where(
+        Supplier.is_global == True,
+        Supplier.organization_id.is_distinct_from(organization_id),
+    )
+
+    return aliased(
+        Supplier,
+        union_all(tenant_rows, global_rows).subquery("tenant_suppliers"),
+    )
+
+
+def is_visible(supplier: Supplier, organization_id) -> bool:
+    return supplier.is_global or supplier.organization_id == organization_id
+
+
+def get_visible_supplier(db: Session, supplier_id: int, organization_id):
+    """Primary-key fetch + scope check in Python (no OR predicate)."""
+    supplier = db.get(Supplier, supplier_id)
+
+    if supplier is None or not is_visible(supplier, organization_id):
+        return None
+
+    return supplier
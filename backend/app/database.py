@@ -32,6 +32,18 @@ if "postgresql" in DATABASE_URL:
         conn.commit()
 
 
+# -----------------------------------------------------
+# DIALECT INSERT (ON CONFLICT UPSERTS FOR BULK LOADERS)
+# -----------------------------------------------------
+def dialect_insert(db):
+    """insert() of the session's dialect (postgres / sqlite both support ON CONFLICT)."""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
 def get_db():
     db = SessionLocal()
     try:
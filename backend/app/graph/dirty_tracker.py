@@ -0,0 +1,183 @@
+import json
+import os
+import uuid
+from contextlib import contextmanager
+
+from app.worker.celery_app import redis_client
+
+
+# =====================================================
+# KEYS
+# =====================================================
+
+DIRTY_EVENTS_KEY = "graph:dirty_events"
+PROCESSING_EVENTS_KEY = "graph:dirty_events:processing"
+FULL_PROPAGATION_KEY = "graph:propagation:last_full"
+PROPAGATION_LOCK_KEY = "graph:propagation:lock"
+
+# Longer than a whole-graph run; a crashed holder frees it after this
+PROPAGATION_LOCK_SECONDS = int(os.getenv("GRAPH_PROPAGATION_LOCK_SECONDS", "3600"))
+
+GRAPH_VIEW_TTL_SECONDS = 3600
+
+
+def assessment_cache_key(supplier_id: int) -> str:
+    return f"assessment:cached:{supplier_id}"
+
+
+def graph_view_cache_key(supplier_name: str) -> str:
+    return f"graph_view:{supplier_name}"
+
+
+# =====================================================
+# DIRTY-SET RECORDING
+# =====================================================
+
+def _push_event(event: dict):
+    # Never let the tracker break a graph write
+    try:
+        redis_client.rpush(DIRTY_EVENTS_KEY, json.dumps(event))
+    except Exception as e:
+        print(f"⚠️ Graph dirty-set write failed: {e}")
+
+
+def record_edge_change(
+    subject_entity: str,
+    object_entity: str,
+    relationship_type: str,
+    previous_confidence,
+    confidence: float,
+):
+    _push_event({
+        "kind": "edge",
+        "source": subject_entity,
+        "target": object_entity,
+        "type": relationship_type,
+        "previous_confidence": previous_confidence,
+        "confidence": confidence,
+    })
+
+
+def record_sanction_change(entity_name: str):
+    _push_event({
+        "kind": "sanction",
+        "entity": entity_name,
+    })
+
+
+def record_supplier_link(supplier_name: str):
+    _push_event({
+        "kind": "supplier",
+        "supplier": supplier_name,
+    })
+
+
+# =====================================================
+# DIRTY-SET CONSUMPTION
+# =====================================================
+
+def claim_events(limit: int = 1000):
+    """
+    Move up to `limit` pending events onto the processing list and return
+    (raw count, events) for everything on it, including events left there
+    by a run that died before acknowledging them.
+    """
+    pending = min(redis_client.llen(DIRTY_EVENTS_KEY), limit)
+
+    pipe = redis_client.pipeline()
+    for _ in range(pending):
+        pipe.lmove(DIRTY_EVENTS_KEY, PROCESSING_EVENTS_KEY, "LEFT", "RIGHT")
+    pipe.lrange(PROCESSING_EVENTS_KEY, 0, -1)
+    raw_events = pipe.execute()[-1]
+
+    events = []
+    for raw in raw_events:
+        try:
+            events.append(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+    return len(raw_events), events
+
+
+def ack_events(count: int):
+    """Drop the first `count` processing entries once they are applied."""
+    if count:
+        redis_client.ltrim(PROCESSING_EVENTS_KEY, count, -1)
+
+
+def release_events(count: int):
+    """Hand the first `count` processing entries back to the pending queue."""
+    pipe = redis_client.pipeline()
+    for _ in range(count):
+        pipe.lmove(PROCESSING_EVENTS_KEY, DIRTY_EVENTS_KEY, "LEFT", "LEFT")
+    pipe.execute()
+
+
+def pending_event_count() -> int:
+    return redis_client.llen(DIRTY_EVENTS_KEY)
+
+
+def drop_events(count: int):
+    """
+    Drop the first `count` pending events and anything left on the
+    processing list: a full propagation that started after they were
+    recorded covers them. Later events stay queued.
+    """
+    pipe = redis_client.pipeline()
+    if count:
+        pipe.ltrim(DIRTY_EVENTS_KEY, count, -1)
+    pipe.delete(PROCESSING_EVENTS_KEY)
+    pipe.execute()
+
+
+# =====================================================
+# PROPAGATION LOCK (BATCH + INCREMENTAL)
+# =====================================================
+
+@contextmanager
+def propagation_lock():
+    """
+    Yields True while holding the lock shared by the whole-graph and
+    incremental propagation runs, False if another run holds it.
+    """
+    token = uuid.uuid4().hex
+    try:
+        acquired = bool(redis_client.set(PROPAGATION_LOCK_KEY, token, ex=PROPAGATION_LOCK_SECONDS, nx=True))
+    except Exception as e:
+        # No Redis means no queue to race on either
+        print(f"⚠️ Graph propagation lock unavailable, running unlocked: {e}")
+        yield True
+        return
+
+    try:
+        yield acquired
+    finally:
+        # Never release a lock that expired and was taken by another run
+        if acquired and redis_client.get(PROPAGATION_LOCK_KEY) == token:
+            redis_client.delete(PROPAGATION_LOCK_KEY)
+
+
+# =====================================================
+# FULL PROPAGATION MARKER
+# =====================================================
+
+def mark_full_propagation(timestamp: float):
+    redis_client.set(FULL_PROPAGATION_KEY, timestamp)
+
+
+def has_full_propagation() -> bool:
+    return bool(redis_client.exists(FULL_PROPAGATION_KEY))
+
+
+# =====================================================
+# CACHE INVALIDATION
+# =====================================================
+
+def invalidate_supplier_caches(supplier_ids, supplier_names):
+    keys = [assessment_cache_key(sid) for sid in supplier_ids]
+    keys += [graph_view_cache_key(name) for name in supplier_names]
+
+    if keys:
+        redis_client.delete(*keys)
+
+    return len(keys)
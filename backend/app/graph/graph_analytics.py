@@ -0,0 +1,155 @@
+import numpy as np
+from scipy import sparse
+
+from app.graph.graph_engine import RelationGraph
+from app.graph.supplier_graph_service import RELATION_WEIGHTS, MAX_DEPTH
+
+
+# =====================================================
+# OFFLINE GRAPH ANALYTICS
+# =====================================================
+# Same answers as the Cypher in supplier_graph_service /
+# enterprise_trust_engine / supplier_comparison_service, computed on an
+# in-memory RelationGraph (live export or snapshot) instead of Neo4j.
+
+
+def _edge_counts(graph: RelationGraph) -> sparse.csr_matrix:
+    n = graph.node_count
+    return sparse.csr_matrix(
+        (np.ones(graph.edge_count), (graph.edge_src, graph.edge_dst)),
+        shape=(n, n),
+    )
+
+
+# =====================================================
+# TRUST SCORE
+# =====================================================
+
+def trust_score(
+    graph: RelationGraph,
+    entity_name: str,
+    relationship_weights: dict = RELATION_WEIGHTS,
+    depth_limit: int = 4,
+    decay_factor: float = 1.0,
+    sanction_boost: float = 1.5,
+):
+    """
+    Path-sum trust score of calculate_enterprise_trust_score without
+    enumerating paths: per depth, track the number of paths ending at
+    each node and the sum of their edge weights. Identical on acyclic
+    neighbourhoods; a cycle shorter than depth_limit is walked again
+    where Cypher would stop at the repeated relationship. Breakdown keys
+    match the live path, with one entry per depth instead of per path.
+    """
+    if entity_name not in graph.index:
+        return {"score": 0.0, "breakdown": []}
+
+    counts_t = _edge_counts(graph).T.tocsr()
+    weights_t = graph.weighted_adjacency(relationship_weights).T.tocsr()
+
+    path_count = np.zeros(graph.node_count)
+    path_count[graph.index[entity_name]] = 1.0
+    path_weight = np.zeros(graph.node_count)
+
+    total_risk = 0.0
+    breakdown = []
+
+    for depth in range(1, depth_limit + 1):
+        path_weight = counts_t @ path_weight + weights_t @ path_count
+        path_count = counts_t @ path_count
+
+        paths = path_count.sum()
+        if paths == 0:
+            break
+
+        depth_risk = path_weight.sum() / ((depth + 1) * decay_factor)
+        total_risk += depth_risk
+
+        breakdown.append({
+            "depth": depth,
+            "path_score": round(float(depth_risk), 4),
+        })
+
+    if graph.sanctioned[graph.index[entity_name]]:
+        total_risk += sanction_boost
+        breakdown.append({"sanction_boost": sanction_boost})
+
+    return {
+        "score": min(round(total_risk * 20, 2), 100),
+        "breakdown": breakdown,
+    }
+
+
+# =====================================================
+# SANCTION PATH SEARCH
+# =====================================================
+
+def sanction_paths(graph: RelationGraph, supplier_name: str, depth: int = MAX_DEPTH):
+    """
+    Entity-name paths from a supplier to sanctioned entities, counting
+    the RESOLVES_TO hop, like build_supply_chain_graph's sanction query.
+    """
+    supplier_idx = graph.supplier_index.get(supplier_name)
+    if supplier_idx is None:
+        return []
+
+    counts = _edge_counts(graph)
+    indptr, indices = counts.indptr, counts.indices
+
+    roots = graph.resolves_entity[graph.resolves_supplier == supplier_idx]
+
+    found = []
+    seen = set()
+
+    def walk(path):
+        node = path[-1]
+        if graph.sanctioned[node]:
+            names = tuple(graph.names[i] for i in path)
+            if names not in seen:
+                seen.add(names)
+                found.append(list(names))
+
+        # `path` holds the entities after the RESOLVES_TO hop
+        if len(path) >= depth:
+            return
+
+        for nxt in indices[indptr[node]:indptr[node + 1]]:
+            if nxt not in path:
+                walk(path + [int(nxt)])
+
+    for root in set(roots.tolist()):
+        walk([root])
+
+    return found
+
+
+# =====================================================
+# COMPARISON GRAPH EXPOSURE
+# =====================================================
+
+def graph_exposure(graph: RelationGraph, supplier_name: str) -> int:
+    """
+    Distinct nodes + relationships within two undirected hops of a
+    supplier node (get_graph_exposure in supplier_comparison_service).
+    """
+    supplier_idx = graph.supplier_index.get(supplier_name)
+    if supplier_idx is None:
+        return 0
+
+    # Suppliers are appended after entities in one node id space
+    offset = graph.node_count
+    src = np.concatenate([graph.edge_src, graph.resolves_supplier + offset])
+    dst = np.concatenate([graph.edge_dst, graph.resolves_entity])
+
+    start = supplier_idx + offset
+    first_hop = set(dst[src == start].tolist()) | set(src[dst == start].tolist())
+    first_hop.discard(start)
+
+    frontier = np.fromiter(first_hop, dtype=np.int64, count=len(first_hop))
+    touches_first = np.isin(src, frontier) | np.isin(dst, frontier)
+    second_hop = (set(dst[touches_first].tolist()) | set(src[touches_first].tolist())) - {start}
+
+    relationships = int(np.count_nonzero(touches_first | (src == start) | (dst == start)))
+    nodes = len(first_hop | second_hop)
+
+    return nodes + relationships
@@ -1,53 +1,210 @@
-from neo4j import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable
+from neo4j import GraphDatabase, READ_ACCESS, WRITE_ACCESS
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from contextlib import contextmanager
 import os
+import threading
+import time
 
 # =====================================================
 # ENV CONFIGURATION
 # =====================================================
 
+# Use a neo4j:// URI against a cluster so READ sessions are routed to
+# read replicas; bolt:// pins everything to a single server.
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE") or None
+
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+NEO4J_ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "10"))
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+NEO4J_CONNECTION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "5"))
+NEO4J_MAX_RETRY_TIME = float(os.getenv("NEO4J_MAX_TRANSACTION_RETRY_TIME", "15"))
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("NEO4J_BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_RESET_SECONDS = float(os.getenv("NEO4J_BREAKER_RESET_SECONDS", "30"))
+
 
 # =====================================================
-# DRIVER INITIALIZATION
+# CIRCUIT BREAKER
+# =====================================================
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive connection failures and
+    lets a single trial call through once `reset_seconds` have passed.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_seconds:
+                # Half-open: the next call decides
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+
+breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
+
+
+# =====================================================
+# DRIVER INITIALIZATION (LAZY)
 # =====================================================
 
 driver = None
+_driver_lock = threading.Lock()
 
 
 def init_driver():
+    """
+    Create the driver on first use. Nothing connects at import time, so
+    API startup never blocks on the graph.
+    """
     global driver
 
-    if driver is None:
-        driver = GraphDatabase.driver(
+    if driver is not None:
+        return driver
+
+    if not breaker.allow():
+        return None
+
+    with _driver_lock:
+        if driver is not None:
+            return driver
+
+        candidate = GraphDatabase.driver(
             NEO4J_URI,
             auth=(NEO4J_USER, NEO4J_PASSWORD),
+            max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
+            max_connection_lifetime=NEO4J_MAX_CONNECTION_LIFETIME,
+            connection_timeout=NEO4J_CONNECTION_TIMEOUT,
+            max_transaction_retry_time=NEO4J_MAX_RETRY_TIME,
         )
 
-        # Optional: verify connectivity at startup
         try:
-            driver.verify_connectivity()
-            print("Neo4j connection established.")
-        except ServiceUnavailable as e:
+            candidate.verify_connectivity()
+        except Exception as e:
             print("Neo4j connection failed:", e)
+            candidate.close()
+            breaker.record_failure()
+
+            if isinstance(e, (ServiceUnavailable, OSError)):
+                return None
+            # Auth / configuration errors surface as themselves
+            raise
+
+        # Reaching the server is not enough: sessions decide when the
+        # breaker closes again
+        print("Neo4j connection established.")
+        driver = candidate
+        return driver
+
+
+def reset_driver():
+    """Drop a broken driver so the next call reconnects."""
+    global driver
+
+    with _driver_lock:
+        if driver is not None:
+            try:
+                driver.close()
+            except Exception:
+                pass
             driver = None
 
 
-# Initialize on import
-init_driver()
+def get_driver():
+    current = driver or init_driver()
+
+    if current is None:
+        state = "circuit open" if breaker.is_open else "connection failed"
+        raise RuntimeError(f"Neo4j driver is not available ({state}).")
+
+    return current
 
 
 # =====================================================
-# SESSION HELPER
+# SESSION HELPERS
 # =====================================================
 
-def get_session():
-    if driver is None:
-        raise RuntimeError("Neo4j driver is not initialized.")
+@contextmanager
+def get_session(access_mode: str = WRITE_ACCESS):
+    """
+    Session that reports to the circuit breaker: losing the cluster
+    (after the driver's own retries) counts a failure and drops the
+    driver, a clean exit closes the breaker again.
+    """
+    try:
+        with get_driver().session(
+            default_access_mode=access_mode,
+            database=NEO4J_DATABASE,
+        ) as session:
+            yield session
+    except (ServiceUnavailable, SessionExpired):
+        breaker.record_failure()
+        reset_driver()
+        raise
+
+    breaker.record_success()
 
-    return driver.session()
+
+def get_read_session():
+    """Session routed to read replicas / followers on a cluster."""
+    return get_session(READ_ACCESS)
+
+
+# =====================================================
+# MANAGED TRANSACTIONS (AUTOMATIC RETRY)
+# =====================================================
+
+def _run_managed(access_mode: str, work, *args, **kwargs):
+    with get_session(access_mode) as session:
+        if access_mode == READ_ACCESS:
+            return session.execute_read(work, *args, **kwargs)
+        return session.execute_write(work, *args, **kwargs)
+
+
+def execute_read(work, *args, **kwargs):
+    return _run_managed(READ_ACCESS, work, *args, **kwargs)
+
+
+def execute_write(work, *args, **kwargs):
+    return _run_managed(WRITE_ACCESS, work, *args, **kwargs)
+
+
+def read_query(query: str, **params):
+    """Run a read-only query in a retried transaction and return its records."""
+    return execute_read(lambda tx: list(tx.run(query, **params)))
+
+
+def write_query(query: str, **params):
+    return execute_write(lambda tx: list(tx.run(query, **params)))
 
 
 # =====================================================
@@ -55,7 +212,4 @@ def get_session():
 # =====================================================
 
 def close_driver():
-    global driver
-    if driver:
-        driver.close()
-        driver = None
+    reset_driver()
@@ -0,0 +1,393 @@
+import numpy as np
+from scipy import sparse
+
+from app.graph.graph_client import get_read_session
+from app.graph.supplier_graph_service import RELATION_WEIGHTS, MAX_DEPTH
+
+
+# =====================================================
+# ENGINE CONFIG
+# =====================================================
+
+DEFAULT_RELATION_WEIGHT = 0.3
+DEFAULT_CONFIDENCE = 0.5
+
+
+def relation_weight(relation_type: str, confidence) -> float:
+    """Same edge weighting used by calculate_enterprise_trust_score."""
+    if confidence is None:
+        confidence = DEFAULT_CONFIDENCE
+    return RELATION_WEIGHTS.get(relation_type, DEFAULT_RELATION_WEIGHT) * confidence
+
+
+# =====================================================
+# IN-MEMORY RELATION GRAPH (CSR)
+# =====================================================
+
+class RelationGraph:
+    """
+    GlobalEntity / RELATION graph held in NumPy arrays.
+
+    Row i of `adjacency` holds the weighted outgoing RELATION edges of
+    entity i, so `adjacency @ x` pulls a value from every entity one hop
+    downstream of each row. Supplier RESOLVES_TO edges and entity
+    attributes are optional and only loaded for snapshots.
+    """
+
+    def __init__(
+        self,
+        names,
+        sanctioned,
+        edge_src,
+        edge_dst,
+        edge_types,
+        edge_confidence,
+        entity_types=None,
+        countries=None,
+        risk_scores=None,
+        supplier_names=None,
+        resolves_supplier=None,
+        resolves_entity=None,
+        resolves_confidence=None,
+    ):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.sanctioned = np.asarray(sanctioned, dtype=bool)
+
+        n = len(self.names)
+        self.entity_types = list(entity_types) if entity_types is not None else ["COMPANY"] * n
+        self.countries = list(countries) if countries is not None else [""] * n
+        self.risk_scores = (
+            np.asarray(risk_scores, dtype=np.float64)
+            if risk_scores is not None
+            else np.zeros(n)
+        )
+
+        self.edge_src = np.asarray(edge_src, dtype=np.int64)
+        self.edge_dst = np.asarray(edge_dst, dtype=np.int64)
+        self.edge_types = list(edge_types)
+        self.edge_confidence = np.asarray(edge_confidence, dtype=np.float64)
+
+        self.supplier_names = list(supplier_names or [])
+        self.supplier_index = {name: i for i, name in enumerate(self.supplier_names)}
+        self.resolves_supplier = np.asarray(
+            resolves_supplier if resolves_supplier is not None else [], dtype=np.int64
+        )
+        self.resolves_entity = np.asarray(
+            resolves_entity if resolves_entity is not None else [], dtype=np.int64
+        )
+        self.resolves_confidence = np.asarray(
+            resolves_confidence if resolves_confidence is not None else [], dtype=np.float64
+        )
+
+        self.adjacency = self.weighted_adjacency(RELATION_WEIGHTS)
+
+    def weighted_adjacency(self, relationship_weights: dict, default_weight: float = DEFAULT_RELATION_WEIGHT):
+        weights = np.fromiter(
+            (
+                relationship_weights.get(rel_type, default_weight) * conf
+                for rel_type, conf in zip(self.edge_types, self.edge_confidence)
+            ),
+            dtype=np.float64,
+            count=len(self.edge_types),
+        )
+
+        n = len(self.names)
+        return sparse.csr_matrix(
+            (weights, (self.edge_src, self.edge_dst)),
+            shape=(n, n),
+        )
+
+    def outgoing_edges(self, node: int) -> np.ndarray:
+        """Indices into the edge arrays of the RELATION edges leaving `node`."""
+        if not hasattr(self, "_out_order"):
+            self._out_order = np.argsort(self.edge_src, kind="stable")
+            self._out_indptr = np.searchsorted(
+                self.edge_src[self._out_order], np.arange(len(self.names) + 1)
+            )
+        return self._out_order[self._out_indptr[node]:self._out_indptr[node + 1]]
+
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_types)
+
+
+# =====================================================
+# GRAPH EXPORT (ONE PASS OVER NEO4J)
+# =====================================================
+
+def load_relation_graph(session=None, include_suppliers: bool = False) -> RelationGraph:
+    """
+    Export every GlobalEntity and RELATION edge in two streaming queries
+    (a third one for Supplier RESOLVES_TO edges when requested).
+    """
+
+    if session is None:
+        with get_read_session() as own_session:
+            return load_relation_graph(own_session, include_suppliers)
+
+    names = []
+    sanctioned = []
+    entity_types = []
+    countries = []
+    risk_scores = []
+
+    node_result = session.run(
+        """
+        MATCH (e:GlobalEntity)
+        WHERE e.canonical_name IS NOT NULL
+        RETURN e.canonical_name AS name,
+               coalesce(e.sanctioned, false) AS sanctioned,
+               coalesce(e.entity_type, 'COMPANY') AS entity_type,
+               coalesce(e.country, '') AS country,
+               coalesce(e.enterprise_risk_score, 0) AS risk_score
+        """
+    )
+
+    for record in node_result:
+        names.append(record["name"])
+        sanctioned.append(bool(record["sanctioned"]))
+        entity_types.append(record["entity_type"])
+        countries.append(record["country"])
+        risk_scores.append(record["risk_score"])
+
+    index = {name: i for i, name in enumerate(names)}
+
+    edge_src = []
+    edge_dst = []
+    edge_types = []
+    edge_confidence = []
+
+    edge_result = session.run(
+        """
+        MATCH (a:GlobalEntity)-[r:RELATION]->(b:GlobalEntity)
+        RETURN a.canonical_name AS source,
+               b.canonical_name AS target,
+               r.type AS type,
+               r.confidence AS confidence
+        """
+    )
+
+    for record in edge_result:
+        src = index.get(record["source"])
+        dst = index.get(record["target"])
+        if src is None or dst is None:
+            continue
+
+        confidence = record["confidence"]
+        edge_src.append(src)
+        edge_dst.append(dst)
+        edge_types.append(record["type"] or "ASSOCIATED_WITH")
+        edge_confidence.append(DEFAULT_CONFIDENCE if confidence is None else confidence)
+
+    supplier_names = []
+    resolves_supplier = []
+    resolves_entity = []
+    resolves_confidence = []
+
+    if include_suppliers:
+        supplier_index = {}
+
+        resolve_result = session.run(
+            """
+            MATCH (s:Supplier)-[r:RESOLVES_TO]->(g:GlobalEntity)
+            RETURN s.name AS supplier,
+                   g.canonical_name AS entity,
+                   r.confidence AS confidence
+            """
+        )
+
+        for record in resolve_result:
+            dst = index.get(record["entity"])
+            if dst is None or record["supplier"] is None:
+                continue
+
+            if record["supplier"] not in supplier_index:
+                supplier_index[record["supplier"]] = len(supplier_names)
+                supplier_names.append(record["supplier"])
+
+            confidence = record["confidence"]
+            resolves_supplier.append(supplier_index[record["supplier"]])
+            resolves_entity.append(dst)
+            resolves_confidence.append(1.0 if confidence is None else confidence)
+
+    return RelationGraph(
+        names,
+        sanctioned,
+        edge_src,
+        edge_dst,
+        edge_types,
+        edge_confidence,
+        entity_types=entity_types,
+        countries=countries,
+        risk_scores=risk_scores,
+        supplier_names=supplier_names,
+        resolves_supplier=resolves_supplier,
+        resolves_entity=resolves_entity,
+        resolves_confidence=resolves_confidence,
+    )
+
+
+# =====================================================
+# WEIGHTED, DECAYED PROPAGATION
+# =====================================================
+
+def propagate_exposure(graph: RelationGraph, depth: int = MAX_DEPTH) -> np.ndarray:
+    """
+    Raw sanction exposure for every entity.
+
+    Sanctioned entities seed 1.0; each hop multiplies by the relation
+    weight and applies the 1 / (hops + 1) depth decay, so the whole graph
+    is scored with `depth` sparse matrix-vector products.
+    """
+    frontier = graph.sanctioned.astype(np.float64)
+    exposure = frontier.copy()
+
+    for hop in range(1, depth + 1):
+        frontier = graph.adjacency @ frontier
+        if not frontier.any():
+            break
+        exposure += frontier / (hop + 1)
+
+    return exposure
+
+
+def exposure_to_score(exposure: np.ndarray) -> np.ndarray:
+    """Map raw exposure onto the 0-100 enterprise_risk_score scale."""
+    return np.minimum(np.round(exposure * 100, 2), 100.0)
+
+
+# =====================================================
+# K-HOP NEIGHBOURHOOD EXPORT (INCREMENTAL UPDATES)
+# =====================================================
+
+def upstream_entity_names(session, entity_names, depth: int) -> set:
+    """
+    Entities with a RELATION path of at most `depth` hops into any of
+    `entity_names` (those entities themselves included).
+    """
+    if not entity_names:
+        return set()
+
+    result = session.run(
+        f"""
+        UNWIND $names AS name
+        MATCH (x:GlobalEntity)-[:RELATION*0..{depth}]->(t:GlobalEntity {{canonical_name: name}})
+        RETURN DISTINCT x.canonical_name AS name
+        """,
+        names=list(entity_names),
+    )
+
+    return {record["name"] for record in result}
+
+
+def load_downstream_ball(session, entity_names, depth: int) -> RelationGraph:
+    """
+    Export every entity within `depth` RELATION hops downstream of any of
+    `entity_names`, together with every RELATION edge between them: all
+    that a walk of at most `depth` hops from those entities can touch.
+    """
+    if not entity_names:
+        return _graph_from_rows([], [])
+
+    result = session.run(
+        f"""
+        UNWIND $names AS name
+        MATCH (t:GlobalEntity {{canonical_name: name}})-[:RELATION*0..{depth}]->(x:GlobalEntity)
+        WITH collect(DISTINCT x) AS ball
+        UNWIND ball AS n
+        OPTIONAL MATCH (n)-[r:RELATION]->(m:GlobalEntity)
+        WHERE m IN ball
+        RETURN n.canonical_name AS source,
+               coalesce(n.sanctioned, false) AS sanctioned,
+               m.canonical_name AS target,
+               r.type AS type,
+               r.confidence AS confidence
+        """,
+        names=list(entity_names),
+    )
+
+    return _graph_from_rows(result, [])
+
+
+def load_supplier_neighbourhood(session, supplier_name: str, depth: int) -> RelationGraph:
+    """
+    Export a supplier, its resolved entities and everything within
+    `depth` RELATION hops downstream of them.
+    """
+    result = session.run(
+        f"""
+        MATCH (s:Supplier {{name: $name}})-[:RESOLVES_TO]->(g:GlobalEntity)
+        WITH collect(DISTINCT g) AS roots
+        UNWIND roots AS g
+        MATCH (g)-[:RELATION*0..{depth}]->(x:GlobalEntity)
+        WITH roots, collect(DISTINCT x) AS ball
+        UNWIND ball AS n
+        OPTIONAL MATCH (n)-[r:RELATION]->(m:GlobalEntity)
+        WHERE m IN ball
+        RETURN [root IN roots | root.canonical_name] AS roots,
+               n.canonical_name AS source,
+               coalesce(n.sanctioned, false) AS sanctioned,
+               m.canonical_name AS target,
+               r.type AS type,
+               r.confidence AS confidence
+        """,
+        name=supplier_name,
+    )
+
+    records = list(result)
+    roots = records[0]["roots"] if records else []
+    graph = _graph_from_rows(records, [])
+
+    return RelationGraph(
+        graph.names,
+        graph.sanctioned,
+        graph.edge_src,
+        graph.edge_dst,
+        graph.edge_types,
+        graph.edge_confidence,
+        supplier_names=[supplier_name],
+        resolves_supplier=[0] * len(roots),
+        resolves_entity=[graph.index[root] for root in roots],
+        resolves_confidence=[1.0] * len(roots),
+    )
+
+
+def _graph_from_rows(rows, seed_names) -> RelationGraph:
+    index = {}
+    names = []
+    sanctioned = []
+    edges = []
+
+    def node_id(name, is_sanctioned=None):
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+            sanctioned.append(False)
+        if is_sanctioned is not None:
+            sanctioned[index[name]] = bool(is_sanctioned)
+        return index[name]
+
+    for name in seed_names:
+        node_id(name)
+
+    for record in rows:
+        src = node_id(record["source"], record["sanctioned"])
+        if record["target"] is None:
+            continue
+        dst = node_id(record["target"])
+        edges.append((src, dst, record["type"] or "ASSOCIATED_WITH", record["confidence"]))
+
+    return RelationGraph(
+        names,
+        sanctioned,
+        [e[0] for e in edges],
+        [e[1] for e in edges],
+        [e[2] for e in edges],
+        [DEFAULT_CONFIDENCE if e[3] is None else e[3] for e in edges],
+    )
+
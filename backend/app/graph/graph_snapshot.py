@@ -0,0 +1,215 @@
+import os
+import time
+
+import numpy as np
+
+from app.graph.graph_client import get_session
+from app.graph.graph_engine import RelationGraph, load_relation_graph
+
+
+# =====================================================
+# SNAPSHOT FORMAT
+# =====================================================
+# Compressed NumPy .npz, one column per array:
+#   entity_*    node columns (name, sanctioned, type, country, risk score)
+#   relation_*  RELATION edges (src/dst entity index, type code, confidence)
+#   supplier_*  Supplier names
+#   resolves_*  RESOLVES_TO edges (supplier index, entity index, confidence)
+# Relation types are dictionary-encoded against `relation_type_codes`.
+
+SNAPSHOT_FORMAT_VERSION = 1
+GRAPH_SNAPSHOT_PATH = os.getenv("GRAPH_SNAPSHOT_PATH", "")
+
+RESTORE_BATCH_SIZE = 5000
+
+
+def _str_column(values) -> np.ndarray:
+    return np.array([v or "" for v in values], dtype=np.str_)
+
+
+# =====================================================
+# EXPORT
+# =====================================================
+
+def save_snapshot(graph: RelationGraph, path: str):
+    relation_type_codes = sorted(set(graph.edge_types))
+    type_lookup = {t: i for i, t in enumerate(relation_type_codes)}
+
+    np.savez_compressed(
+        path,
+        format_version=np.array(SNAPSHOT_FORMAT_VERSION),
+        exported_at=np.array(time.time()),
+        entity_name=_str_column(graph.names),
+        entity_sanctioned=graph.sanctioned,
+        entity_type=_str_column(graph.entity_types),
+        entity_country=_str_column(graph.countries),
+        entity_risk_score=graph.risk_scores.astype(np.float32),
+        relation_type_codes=_str_column(relation_type_codes),
+        relation_src=graph.edge_src.astype(np.int32),
+        relation_dst=graph.edge_dst.astype(np.int32),
+        relation_type=np.array([type_lookup[t] for t in graph.edge_types], dtype=np.int16),
+        relation_confidence=graph.edge_confidence.astype(np.float32),
+        supplier_name=_str_column(graph.supplier_names),
+        resolves_supplier=graph.resolves_supplier.astype(np.int32),
+        resolves_entity=graph.resolves_entity.astype(np.int32),
+        resolves_confidence=graph.resolves_confidence.astype(np.float32),
+    )
+
+
+def export_snapshot(path: str):
+    """Dump the live supplier graph to a snapshot file."""
+    graph = load_relation_graph(include_suppliers=True)
+    save_snapshot(graph, path)
+
+    return {
+        "path": path,
+        "entities": graph.node_count,
+        "relations": graph.edge_count,
+        "suppliers": len(graph.supplier_names),
+    }
+
+
+# =====================================================
+# IMPORT
+# =====================================================
+
+def load_snapshot(path: str) -> RelationGraph:
+    """Rebuild the in-memory graph from a snapshot; no Neo4j needed."""
+    with np.load(path, allow_pickle=False) as data:
+        version = int(data["format_version"])
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph snapshot version: {version}")
+
+        relation_type_codes = data["relation_type_codes"].tolist()
+
+        return RelationGraph(
+            data["entity_name"].tolist(),
+            data["entity_sanctioned"],
+            data["relation_src"],
+            data["relation_dst"],
+            [relation_type_codes[code] for code in data["relation_type"]],
+            data["relation_confidence"],
+            entity_types=data["entity_type"].tolist(),
+            countries=data["entity_country"].tolist(),
+            risk_scores=data["entity_risk_score"],
+            supplier_names=data["supplier_name"].tolist(),
+            resolves_supplier=data["resolves_supplier"],
+            resolves_entity=data["resolves_entity"],
+            resolves_confidence=data["resolves_confidence"],
+        )
+
+
+_snapshot_cache = {"path": None, "mtime": None, "graph": None}
+
+
+def active_snapshot():
+    """
+    Graph loaded from GRAPH_SNAPSHOT_PATH, reloaded when the file changes.
+    Returns None when no snapshot is configured.
+    """
+    if not GRAPH_SNAPSHOT_PATH or not os.path.exists(GRAPH_SNAPSHOT_PATH):
+        return None
+
+    mtime = os.path.getmtime(GRAPH_SNAPSHOT_PATH)
+    if (
+        _snapshot_cache["graph"] is None
+        or _snapshot_cache["path"] != GRAPH_SNAPSHOT_PATH
+        or _snapshot_cache["mtime"] != mtime
+    ):
+        _snapshot_cache["graph"] = load_snapshot(GRAPH_SNAPSHOT_PATH)
+        _snapshot_cache["path"] = GRAPH_SNAPSHOT_PATH
+        _snapshot_cache["mtime"] = mtime
+
+    return _snapshot_cache["graph"]
+
+
+# =====================================================
+# RESTORE INTO NEO4J (BENCHMARK / STAGING GRAPHS)
+# =====================================================
+
+def restore_snapshot(path: str):
+    graph = load_snapshot(path)
+
+    entity_rows = [
+        {
+            "name": name,
+            "sanctioned": bool(graph.sanctioned[i]),
+            "type": graph.entity_types[i],
+            "country": graph.countries[i] or None,
+            "score": float(graph.risk_scores[i]),
+        }
+        for i, name in enumerate(graph.names)
+    ]
+
+    relation_rows = [
+        {
+            "source": graph.names[src],
+            "target": graph.names[dst],
+            "type": rel_type,
+            "confidence": float(conf),
+        }
+        for src, dst, rel_type, conf in zip(
+            graph.edge_src, graph.edge_dst, graph.edge_types, graph.edge_confidence
+        )
+    ]
+
+    resolve_rows = [
+        {
+            "supplier": graph.supplier_names[sup],
+            "entity": graph.names[ent],
+            "confidence": float(conf),
+        }
+        for sup, ent, conf in zip(
+            graph.resolves_supplier, graph.resolves_entity, graph.resolves_confidence
+        )
+    ]
+
+    with get_session() as session:
+        for start in range(0, len(entity_rows), RESTORE_BATCH_SIZE):
+            session.run(
+                """
+                UNWIND $rows AS row
+                MERGE (e:GlobalEntity {canonical_name: row.name})
+                SET e.entity_type = row.type,
+                    e.country = row.country,
+                    e.sanctioned = row.sanctioned,
+                    e.enterprise_risk_score = row.score,
+                    e.updated_at = timestamp()
+                """,
+                rows=entity_rows[start:start + RESTORE_BATCH_SIZE],
+            )
+
+        for start in range(0, len(relation_rows), RESTORE_BATCH_SIZE):
+            session.run(
+                """
+                UNWIND $rows AS row
+                MATCH (a:GlobalEntity {canonical_name: row.source})
+                MATCH (b:GlobalEntity {canonical_name: row.target})
+                MERGE (a)-[r:RELATION {type: row.type}]->(b)
+                SET r.confidence = row.confidence,
+                    r.weight = row.confidence * 10,
+                    r.updated_at = timestamp()
+                """,
+                rows=relation_rows[start:start + RESTORE_BATCH_SIZE],
+            )
+
+        for start in range(0, len(resolve_rows), RESTORE_BATCH_SIZE):
+            session.run(
+                """
+                UNWIND $rows AS row
+                MERGE (s:Supplier {name: row.supplier})
+                WITH s, row
+                MATCH (e:GlobalEntity {canonical_name: row.entity})
+                MERGE (s)-[r:RESOLVES_TO]->(e)
+                SET r.confidence = row.confidence,
+                    r.method = 'SNAPSHOT',
+                    r.updated_at = timestamp()
+                """,
+                rows=resolve_rows[start:start + RESTORE_BATCH_SIZE],
+            )
+
+    return {
+        "entities": len(entity_rows),
+        "relations": len(relation_rows),
+        "resolutions": len(resolve_rows),
+    }
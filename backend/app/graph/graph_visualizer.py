@@ -1,6 +1,6 @@
-from app.graph.graph_client import get_session
+from app.graph.graph_client import get_read_session
 def get_graph_data(entity_name: str, depth: int = 2):
-    with get_session() as session:
+    with get_read_session() as session:
         result = session.run(
             f"""
             MATCH path = (e:Entity {{name: $name}})-[r*1..{depth}]-(connected)
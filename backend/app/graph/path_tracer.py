@@ -1,7 +1,7 @@
-from app.graph.graph_client import get_session
+from app.graph.graph_client import get_read_session
 
 def trace_risk_paths(entity_name: str):
-    with get_session() as session:
+    with get_read_session() as session:
         result = session.run(
             """
             MATCH path = (e:Entity {name: $name})-[:RELATION*1..3]->(r)
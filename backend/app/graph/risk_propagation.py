@@ -1,16 +1,275 @@
-from app.graph.graph_client import get_session
+import time
+
+from app.database import SessionLocal
+from app.models import Supplier
+from app.graph.graph_client import get_session, get_read_session, read_query
+from app.graph.graph_engine import (
+    load_relation_graph,
+    upstream_entity_names,
+    load_downstream_ball,
+    propagate_exposure,
+    exposure_to_score,
+)
+from app.graph.supplier_graph_service import MAX_DEPTH
+from app.graph.sanction_exposure_index import refresh_supplier_exposure
+from app.graph.dirty_tracker import (
+    claim_events,
+    ack_events,
+    release_events,
+    pending_event_count,
+    drop_events,
+    propagation_lock,
+    mark_full_propagation,
+    has_full_propagation,
+    invalidate_supplier_caches,
+)
+
+
+# =====================================================
+# PROPAGATION CONFIG
+# =====================================================
+
+MAX_GRAPH_RISK_POINTS = 50
+WRITE_BATCH_SIZE = 5000
+
+
+# =====================================================
+# SUPPLIER GRAPH RISK (ASSESSMENT INPUT)
+# =====================================================
+
+def propagate_risk(supplier_name: str) -> float:
+    """
+    Graph risk points for a supplier, read from the enterprise_risk_score
+    precomputed by run_batch_risk_propagation on its resolved entities.
+    """
+    records = read_query(
+        """
+        MATCH (s:Supplier {name: $name})-[:RESOLVES_TO]->(g:GlobalEntity)
+        RETURN max(coalesce(g.enterprise_risk_score, 0)) AS score
+        """,
+        name=supplier_name
+    )
+
+    score = records[0]["score"] if records and records[0]["score"] else 0
+
+    return min(int(round(score / 2)), MAX_GRAPH_RISK_POINTS)
+
+
+# =====================================================
+# WRITE-BACK (BATCHED UNWIND)
+# =====================================================
+
+def write_risk_scores(session, rows: list[dict]):
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (e:GlobalEntity {canonical_name: row.name})
+            SET e.risk_exposure = row.exposure,
+                e.enterprise_risk_score = row.score,
+                e.updated_at = timestamp()
+            """,
+            rows=rows[start:start + WRITE_BATCH_SIZE],
+        )
+
+
+# =====================================================
+# WHOLE-GRAPH BATCH JOB
+# =====================================================
+
+def run_batch_risk_propagation(include_suppliers: bool = False, with_graph=None):
+    """
+    Score every GlobalEntity in one pass: export the RELATION graph once,
+    propagate sanction exposure with sparse mat-vec iterations, then write
+    enterprise_risk_score back in UNWIND batches.
+
+    Runs under the propagation lock (never alongside an incremental run).
+    `with_graph` is called with the export inside the lock, so other batch
+    jobs (the exposure index) can share it.
+    """
+    with propagation_lock() as acquired:
+        if not acquired:
+            print("Graph risk propagation skipped: another propagation run is active")
+            return {"skipped": "propagation running"}
+
+        return _run_batch(include_suppliers, with_graph)
+
+
+def _run_batch(include_suppliers: bool, with_graph):
+    started = time.perf_counter()
+
+    # Events queued before the export are in it; anything recorded from
+    # here on stays queued for the incremental job
+    try:
+        covered_events = pending_event_count()
+    except Exception as e:
+        print(f"⚠️ Could not read graph dirty-set: {e}")
+        covered_events = 0
+
+    # Export from a read replica, write back through the leader
+    with get_read_session() as session:
+        graph = load_relation_graph(session, include_suppliers)
+
+    exposure = propagate_exposure(graph)
+    scores = exposure_to_score(exposure)
+
+    rows = [
+        {
+            "name": name,
+            "exposure": float(exposure[i]),
+            "score": float(scores[i]),
+        }
+        for i, name in enumerate(graph.names)
+    ]
 
-def propagate_risk(entity_name: str) -> float:
     with get_session() as session:
-        result = session.run(
+        write_risk_scores(session, rows)
+
+    if with_graph is not None:
+        with_graph(graph)
+
+    try:
+        drop_events(covered_events)
+        mark_full_propagation(time.time())
+    except Exception as e:
+        print(f"⚠️ Could not record full propagation: {e}")
+
+    elapsed = round(time.perf_counter() - started, 2)
+    print(
+        f"Graph risk propagation complete: {graph.node_count} entities, "
+        f"{graph.edge_count} relations in {elapsed}s"
+    )
+
+    return {
+        "entities": graph.node_count,
+        "relations": graph.edge_count,
+        "elapsed_seconds": elapsed,
+    }
+
+
+# =====================================================
+# INCREMENTAL PROPAGATION
+# =====================================================
+# Exposure is recomputed exactly for the entities a batch of changes can
+# reach, never summed onto stored values: the live graph already holds
+# every queued change, so per-event deltas would count walks through two
+# changes of the same batch twice.
+
+def _affected_entities(session, events: list[dict]) -> set:
+    """
+    Entities whose exposure the batch can move: those within MAX_DEPTH
+    hops upstream of a newly sanctioned entity, or MAX_DEPTH - 1 hops
+    upstream of the source of a new / re-weighted edge.
+    """
+    sanctioned = {event["entity"] for event in events if event.get("kind") == "sanction"}
+    sources = {event["source"] for event in events if event.get("kind") == "edge"}
+
+    return (
+        upstream_entity_names(session, sanctioned, MAX_DEPTH)
+        | upstream_entity_names(session, sources, MAX_DEPTH - 1)
+    )
+
+
+def _recompute_exposure(session, entity_names: set) -> list[dict]:
+    """
+    Exposure and score of `entity_names`, propagated over the ball their
+    MAX_DEPTH-hop walks can reach (same result as the whole-graph job).
+    """
+    ball = load_downstream_ball(session, entity_names, MAX_DEPTH)
+    exposure = propagate_exposure(ball)
+    scores = exposure_to_score(exposure)
+
+    return [
+        {
+            "name": name,
+            "exposure": float(exposure[ball.index[name]]),
+            "score": float(scores[ball.index[name]]),
+        }
+        for name in entity_names
+        if name in ball.index
+    ]
+
+
+def _affected_supplier_names(session, entity_names: set):
+    return [
+        record["name"]
+        for record in session.run(
             """
-            MATCH (e:Entity {name: $name})-[:RELATION*1..3]->(r)
-            RETURN count(r) as connections
+            MATCH (s:Supplier)-[:RESOLVES_TO]->(g:GlobalEntity)
+            WHERE g.canonical_name IN $names
+            RETURN DISTINCT s.name AS name
             """,
-            name=entity_name
+            names=list(entity_names),
         )
+    ]
+
+
+def _refresh_affected_suppliers(supplier_names: set):
+    """Refresh the sanction exposure index and drop cached views."""
+    if not supplier_names:
+        return 0
+
+    db = SessionLocal()
+    try:
+        refresh_supplier_exposure(db, supplier_names)
+
+        supplier_ids = [
+            row.id
+            for row in db.query(Supplier.id).filter(Supplier.name.in_(list(supplier_names)))
+        ]
+    finally:
+        db.close()
+
+    invalidate_supplier_caches(supplier_ids, supplier_names)
+    return len(supplier_names)
+
+
+def apply_incremental_propagation(max_events: int = 1000):
+    """
+    Fold pending RELATION / sanction changes into enterprise_risk_score by
+    rescoring only the entities within MAX_DEPTH hops upstream of them.
+    Requires a prior full run; until then the next batch job covers it.
+    """
+    if not has_full_propagation():
+        return {"events": 0, "skipped": "no full propagation yet"}
+
+    with propagation_lock() as acquired:
+        if not acquired:
+            return {"events": 0, "skipped": "propagation running"}
+
+        return _apply_incremental(max_events)
+
+
+def _apply_incremental(max_events: int):
+    claimed, events = claim_events(max_events)
+    if not claimed:
+        return {"events": 0}
+
+    affected_suppliers = {
+        event["supplier"] for event in events if event.get("kind") == "supplier"
+    }
+
+    # Events stay on the processing list until every write has landed
+    try:
+        with get_session() as session:
+            affected = _affected_entities(session, events)
+            rows = _recompute_exposure(session, affected)
+            write_risk_scores(session, rows)
+            affected_suppliers.update(_affected_supplier_names(session, affected))
+
+        suppliers = _refresh_affected_suppliers(affected_suppliers)
+    except Exception:
+        try:
+            release_events(claimed)
+        except Exception as e:
+            # Still on the processing list: the next claim picks them up
+            print(f"⚠️ Could not requeue graph dirty events: {e}")
+        raise
 
-        record = result.single()
-        connections = record["connections"] if record else 0
+    ack_events(claimed)
 
-        return min(connections * 10, 50)
+    return {
+        "events": len(events),
+        "entities_rescored": len(rows),
+        "suppliers_invalidated": suppliers,
+    }
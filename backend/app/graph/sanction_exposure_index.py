@@ -0,0 +1,179 @@
+from collections import deque
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.models import SanctionExposure
+from app.graph.graph_client import get_read_session
+from app.graph.graph_engine import (
+    RelationGraph,
+    load_relation_graph,
+    load_supplier_neighbourhood,
+)
+from app.graph.supplier_graph_service import RELATION_WEIGHTS, MAX_DEPTH
+
+
+# =====================================================
+# INDEX CONFIG
+# =====================================================
+
+EXPOSURE_DEPTH = MAX_DEPTH
+MAX_EXPOSURES_PER_SUPPLIER = 10
+
+
+# =====================================================
+# NEAREST SANCTIONED ENTITIES (BFS)
+# =====================================================
+
+def nearest_sanctioned(graph: RelationGraph, supplier_name: str, depth: int = EXPOSURE_DEPTH):
+    """
+    Sanctioned entities within `depth` hops of a supplier (the
+    RESOLVES_TO hop counts as 1), each with its shortest path and the
+    strongest relation type on that path.
+    """
+    supplier_idx = graph.supplier_index.get(supplier_name)
+    if supplier_idx is None:
+        return []
+
+    roots = graph.resolves_entity[graph.resolves_supplier == supplier_idx]
+
+    distance = {}
+    parent = {}
+    queue = deque()
+
+    for root in set(roots.tolist()):
+        distance[root] = 1
+        parent[root] = (None, None)
+        queue.append(root)
+
+    while queue:
+        node = queue.popleft()
+        if distance[node] >= depth:
+            continue
+
+        for edge in graph.outgoing_edges(node):
+            nxt = int(graph.edge_dst[edge])
+            if nxt in distance:
+                continue
+            distance[nxt] = distance[node] + 1
+            parent[nxt] = (node, int(edge))
+            queue.append(nxt)
+
+    exposures = []
+
+    for node, hops in distance.items():
+        if not graph.sanctioned[node]:
+            continue
+
+        path = []
+        relations = []
+        current = node
+
+        while current is not None:
+            path.append(graph.names[current])
+            previous, edge = parent[current]
+            if edge is not None:
+                relations.append(graph.edge_types[edge])
+            current = previous
+
+        path.reverse()
+
+        strongest = (
+            max(relations, key=lambda rel: RELATION_WEIGHTS.get(rel, 0.0))
+            if relations
+            else "RESOLVES_TO"
+        )
+
+        exposures.append({
+            "sanctioned_entity": graph.names[node],
+            "distance": hops,
+            "path": path,
+            "strongest_relation": strongest,
+        })
+
+    exposures.sort(key=lambda e: (e["distance"], e["sanctioned_entity"]))
+    return exposures[:MAX_EXPOSURES_PER_SUPPLIER]
+
+
+def _index_rows(supplier_name: str, exposures: list[dict], now: datetime):
+    return [
+        {
+            "supplier_name": supplier_name,
+            "updated_at": now,
+            **exposure,
+        }
+        for exposure in exposures
+    ]
+
+
+# =====================================================
+# FULL REBUILD (BATCH)
+# =====================================================
+
+def rebuild_exposure_index(db: Session, graph: RelationGraph = None):
+    if graph is None or not graph.supplier_names:
+        graph = load_relation_graph(include_suppliers=True)
+
+    now = datetime.utcnow()
+    rows = []
+
+    for supplier_name in graph.supplier_names:
+        rows.extend(_index_rows(supplier_name, nearest_sanctioned(graph, supplier_name), now))
+
+    db.query(SanctionExposure).delete(synchronize_session=False)
+    db.bulk_insert_mappings(SanctionExposure, rows)
+    db.commit()
+
+    return {"suppliers": len(graph.supplier_names), "exposures": len(rows)}
+
+
+# =====================================================
+# TARGETED REFRESH (INCREMENTAL)
+# =====================================================
+
+def refresh_supplier_exposure(db: Session, supplier_names):
+    """Recompute the index entries of specific suppliers only."""
+    supplier_names = list(set(supplier_names))
+    if not supplier_names:
+        return 0
+
+    now = datetime.utcnow()
+    rows = []
+
+    with get_read_session() as session:
+        for supplier_name in supplier_names:
+            graph = load_supplier_neighbourhood(session, supplier_name, EXPOSURE_DEPTH - 1)
+            rows.extend(_index_rows(supplier_name, nearest_sanctioned(graph, supplier_name), now))
+
+    (
+        db.query(SanctionExposure)
+        .filter(SanctionExposure.supplier_name.in_(supplier_names))
+        .delete(synchronize_session=False)
+    )
+    db.bulk_insert_mappings(SanctionExposure, rows)
+    db.commit()
+
+    return len(rows)
+
+
+# =====================================================
+# O(1) READS
+# =====================================================
+
+def get_supplier_exposure(db: Session, supplier_name: str):
+    entries = (
+        db.query(SanctionExposure)
+        .filter(SanctionExposure.supplier_name == supplier_name)
+        .order_by(SanctionExposure.distance, SanctionExposure.sanctioned_entity)
+        .all()
+    )
+
+    return [
+        {
+            "sanctioned_entity": e.sanctioned_entity,
+            "distance": e.distance,
+            "path": e.path,
+            "strongest_relation": e.strongest_relation,
+        }
+        for e in entries
+    ]
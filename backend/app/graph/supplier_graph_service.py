@@ -1,4 +1,9 @@
-from app.graph.graph_client import get_session
+from app.graph.graph_client import get_session, get_read_session, write_query
+from app.graph.dirty_tracker import (
+    record_edge_change,
+    record_sanction_change,
+    record_supplier_link,
+)
 import math
 
 
@@ -21,14 +26,13 @@ RELATION_WEIGHTS = {
 # =====================================================
 
 def create_supplier_node(supplier_name: str, organization_id: int = None):
-    with get_session() as session:
-        session.run(
-            """
-            MERGE (s:Supplier {name: $name})
-            SET s.updated_at = timestamp()
-            """,
-            name=supplier_name,
-        )
+    write_query(
+        """
+        MERGE (s:Supplier {name: $name})
+        SET s.updated_at = timestamp()
+        """,
+        name=supplier_name,
+    )
 
 
 def create_global_entity_node(
@@ -36,18 +40,17 @@ def create_global_entity_node(
     entity_type: str = "COMPANY",
     country: str = None,
 ):
-    with get_session() as session:
-        session.run(
-            """
-            MERGE (e:GlobalEntity {canonical_name: $name})
-            SET e.entity_type = $type,
-                e.country = $country,
-                e.updated_at = timestamp()
-            """,
-            name=canonical_name,
-            type=entity_type,
-            country=country,
-        )
+    write_query(
+        """
+        MERGE (e:GlobalEntity {canonical_name: $name})
+        SET e.entity_type = $type,
+            e.country = $country,
+            e.updated_at = timestamp()
+        """,
+        name=canonical_name,
+        type=entity_type,
+        country=country,
+    )
 
 
 # =====================================================
@@ -60,21 +63,28 @@ def link_supplier_to_entity(
     confidence_score: float = 1.0,
     resolution_method: str = "AUTO",
 ):
-    with get_session() as session:
-        session.run(
-            """
-            MERGE (s:Supplier {name: $supplier})
-            MERGE (e:GlobalEntity {canonical_name: $entity})
-            MERGE (s)-[r:RESOLVES_TO]->(e)
-            SET r.confidence = $confidence,
-                r.method = $method,
-                r.updated_at = timestamp()
-            """,
-            supplier=supplier_name,
-            entity=canonical_name,
-            confidence=confidence_score,
-            method=resolution_method,
-        )
+    records = write_query(
+        """
+        MERGE (s:Supplier {name: $supplier})
+        MERGE (e:GlobalEntity {canonical_name: $entity})
+        WITH s, e
+        OPTIONAL MATCH (s)-[existing:RESOLVES_TO]->(e)
+        WITH s, e, existing IS NULL AS is_new
+        MERGE (s)-[r:RESOLVES_TO]->(e)
+        SET r.confidence = $confidence,
+            r.method = $method,
+            r.updated_at = timestamp()
+        RETURN is_new
+        """,
+        supplier=supplier_name,
+        entity=canonical_name,
+        confidence=confidence_score,
+        method=resolution_method,
+    )
+
+    # A new link can put the supplier next to sanctioned entities
+    if records and records[0]["is_new"]:
+        record_supplier_link(supplier_name)
 
 
 # =====================================================
@@ -87,40 +97,146 @@ def create_entity_relationship(
     relationship_type: str,
     confidence: float = 0.8,
 ):
-    with get_session() as session:
-        session.run(
+    relation = relationship_type.upper()
+
+    records = write_query(
+        """
+        MERGE (a:GlobalEntity {canonical_name: $subject})
+        MERGE (b:GlobalEntity {canonical_name: $object})
+        MERGE (a)-[r:RELATION {type: $relation}]->(b)
+        WITH r, r.confidence AS previous_confidence
+        SET r.confidence = $confidence,
+            r.weight = $confidence * 10,
+            r.updated_at = timestamp()
+        RETURN previous_confidence
+        """,
+        subject=subject_entity,
+        object=object_entity,
+        relation=relation,
+        confidence=confidence,
+    )
+
+    previous_confidence = records[0]["previous_confidence"] if records else None
+
+    # Only new or re-weighted edges change downstream risk
+    if previous_confidence != confidence:
+        record_edge_change(
+            subject_entity,
+            object_entity,
+            relation,
+            previous_confidence,
+            confidence,
+        )
+
+
+# =====================================================
+# BULK WRITES (UNWIND)
+# =====================================================
+
+GRAPH_WRITE_BATCH_SIZE = 1000
+
+
+def _batches(rows: list):
+    for start in range(0, len(rows), GRAPH_WRITE_BATCH_SIZE):
+        yield rows[start:start + GRAPH_WRITE_BATCH_SIZE]
+
+
+def create_global_entity_nodes(rows: list[dict]):
+    """rows: {canonical_name, entity_type, country}"""
+    for batch in _batches(rows):
+        write_query(
             """
-            MERGE (a:GlobalEntity {canonical_name: $subject})
-            MERGE (b:GlobalEntity {canonical_name: $object})
-            MERGE (a)-[r:RELATION {type: $relation}]->(b)
-            SET r.confidence = $confidence,
-                r.weight = $confidence * 10,
+            UNWIND $rows AS row
+            MERGE (e:GlobalEntity {canonical_name: row.canonical_name})
+            SET e.entity_type = row.entity_type,
+                e.country = row.country,
+                e.updated_at = timestamp()
+            """,
+            rows=batch,
+        )
+
+
+def link_suppliers_to_entities(rows: list[dict]):
+    """rows: {supplier_name, canonical_name, confidence_score, resolution_method}"""
+    for batch in _batches(rows):
+        records = write_query(
+            """
+            UNWIND $rows AS row
+            MERGE (s:Supplier {name: row.supplier_name})
+            MERGE (e:GlobalEntity {canonical_name: row.canonical_name})
+            WITH s, e, row
+            OPTIONAL MATCH (s)-[existing:RESOLVES_TO]->(e)
+            WITH s, e, row, existing IS NULL AS is_new
+            MERGE (s)-[r:RESOLVES_TO]->(e)
+            SET r.confidence = row.confidence_score,
+                r.method = row.resolution_method,
+                r.updated_at = timestamp()
+            RETURN row.supplier_name AS supplier_name, is_new
+            """,
+            rows=batch,
+        )
+
+        for record in records:
+            if record["is_new"]:
+                record_supplier_link(record["supplier_name"])
+
+
+def create_entity_relationships(rows: list[dict]):
+    """rows: {subject_entity, object_entity, relationship_type, confidence}"""
+    rows = [
+        {**row, "relationship_type": row["relationship_type"].upper()}
+        for row in rows
+    ]
+
+    for batch in _batches(rows):
+        records = write_query(
+            """
+            UNWIND $rows AS row
+            MERGE (a:GlobalEntity {canonical_name: row.subject_entity})
+            MERGE (b:GlobalEntity {canonical_name: row.object_entity})
+            MERGE (a)-[r:RELATION {type: row.relationship_type}]->(b)
+            WITH r, row, r.confidence AS previous_confidence
+            SET r.confidence = row.confidence,
+                r.weight = row.confidence * 10,
                 r.updated_at = timestamp()
+            RETURN row, previous_confidence
             """,
-            subject=subject_entity,
-            object=object_entity,
-            relation=relationship_type.upper(),
-            confidence=confidence,
+            rows=batch,
         )
 
+        for record in records:
+            row = record["row"]
+            if record["previous_confidence"] != row["confidence"]:
+                record_edge_change(
+                    row["subject_entity"],
+                    row["object_entity"],
+                    row["relationship_type"],
+                    record["previous_confidence"],
+                    row["confidence"],
+                )
+
 
 # =====================================================
 # SANCTION MARKING
 # =====================================================
 
 def mark_entity_as_sanctioned(entity_name: str, source: str):
-    with get_session() as session:
-        session.run(
-            """
-            MERGE (e:GlobalEntity {canonical_name: $name})
-            SET e.sanctioned = true,
-                e.sanction_source = $source,
-                e.enterprise_risk_score = 100,
-                e.updated_at = timestamp()
-            """,
-            name=entity_name,
-            source=source,
-        )
+    records = write_query(
+        """
+        MERGE (e:GlobalEntity {canonical_name: $name})
+        WITH e, coalesce(e.sanctioned, false) AS was_sanctioned
+        SET e.sanctioned = true,
+            e.sanction_source = $source,
+            e.enterprise_risk_score = 100,
+            e.updated_at = timestamp()
+        RETURN was_sanctioned
+        """,
+        name=entity_name,
+        source=source,
+    )
+
+    if records and not records[0]["was_sanctioned"]:
+        record_sanction_change(entity_name)
 
 
 # =====================================================
@@ -225,13 +341,13 @@ def classify_risk(score: float, sanctioned: bool):
 # MULTI-TIER SUPPLY CHAIN GRAPH
 # =====================================================
 
-def build_supply_chain_graph(supplier_name: str, depth: int = MAX_DEPTH):
+def build_supply_chain_graph(supplier_name: str, depth: int = MAX_DEPTH, db=None):
 
     nodes = {}
     links = {}
     sanction_paths = []
 
-    with get_session() as session:
+    with get_read_session() as session:
 
         # -------------------------------------------------
         # Tier 0 + Tier 1 (Always include)
@@ -329,26 +445,37 @@ def build_supply_chain_graph(supplier_name: str, depth: int = MAX_DEPTH):
                         "type": rel.get("type"),
                     }
 
-        # -------------------------------------------------
-        # Sanction Path Detection
-        # -------------------------------------------------
-        sanction_query = f"""
-        MATCH path =
-            (s:Supplier {{name: $name}})
-            -[:RESOLVES_TO|RELATION*1..{depth}]->
-            (g:GlobalEntity {{sanctioned: true}})
-        RETURN path
-        """
+    # -------------------------------------------------
+    # Sanction Path Detection
+    # -------------------------------------------------
+    if db is not None:
+        # Precomputed nearest-sanctioned index (O(1) read)
+        from app.graph.sanction_exposure_index import get_supplier_exposure
+
+        sanction_paths = [
+            exposure["path"]
+            for exposure in get_supplier_exposure(db, supplier_name)
+            if exposure["distance"] <= depth
+        ]
+    else:
+        with get_read_session() as session:
+            sanction_query = f"""
+            MATCH path =
+                (s:Supplier {{name: $name}})
+                -[:RESOLVES_TO|RELATION*1..{depth}]->
+                (g:GlobalEntity {{sanctioned: true}})
+            RETURN path
+            """
 
-        sanction_result = session.run(sanction_query, name=supplier_name)
+            sanction_result = session.run(sanction_query, name=supplier_name)
 
-        for record in sanction_result:
-            path = record["path"]
-            sanction_paths.append([
-                node.get("canonical_name")
-                for node in path.nodes
-                if node.get("canonical_name")
-            ])
+            for record in sanction_result:
+                path = record["path"]
+                sanction_paths.append([
+                    node.get("canonical_name")
+                    for node in path.nodes
+                    if node.get("canonical_name")
+                ])
 
     # -------------------------------------------------
     # Enforce Caps
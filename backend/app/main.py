@@ -10,8 +10,9 @@ from app import models
 
 from app.services.sanctions_loader import load_sanctions
 from app.services.covered_loader import load_covered_entities
+from app.services.supplier_search import ensure_search_index
 
-from app.routes import graph
+from app.routes import graph, entity
 
 
 app = FastAPI(title="Supplier Risk Intelligence Platform")
@@ -42,6 +43,7 @@ app.include_router(health.router)
 app.include_router(supplier.router)
 app.include_router(audit.router)
 app.include_router(graph.router)
+app.include_router(entity.router)
 
 # =====================================================
 # ROOT
@@ -58,6 +60,7 @@ def root():
 def startup_event():
 
     Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
 
     db = SessionLocal()
 
@@ -81,3 +84,13 @@ def startup_event():
     # START BACKGROUND SCHEDULER
     from app.services.scheduler_service import start_scheduler
     start_scheduler()
+
+
+# =====================================================
+# SHUTDOWN
+# =====================================================
+@app.on_event("shutdown")
+def shutdown_event():
+    # Neo4j is connected lazily on first use; close the pool if it was opened
+    from app.graph.graph_client import close_driver
+    close_driver()
@@ -3,13 +3,16 @@ from sqlalchemy import (
     Integer,
     String,
     DateTime,
+    Date,
     ForeignKey,
     Boolean,
     JSON,
     UniqueConstraint,
     BigInteger,
     Float,
+    Index,
 )
+from sqlalchemy import text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -40,6 +43,9 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     role = Column(String, default="VIEWER")
 
+    # Bumped by revoke_user_tokens; access tokens carry it as "ver"
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -92,6 +98,14 @@ class Supplier(Base):
             "country",
             name="uq_supplier_org_normalized",
         ),
+        # Tenant scope = UNION ALL of these two (see app/core/tenancy.py)
+        Index("ix_suppliers_org_id", "organization_id", "id"),
+        Index(
+            "ix_suppliers_global_id",
+            "id",
+            postgresql_where=text("is_global"),
+            sqlite_where=text("is_global = 1"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -140,12 +154,15 @@ class SupplierEntityLink(Base):
     __tablename__ = "supplier_entity_links"
 
     id = Column(Integer, primary_key=True)
-    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False, index=True)
     entity_id = Column(Integer, ForeignKey("global_entities.id"), nullable=False)
 
     confidence_score = Column(Float, nullable=False)
     resolution_method = Column(String, default="AUTO")  # AUTO | MANUAL
 
+    # sha1(normalized name | country | resolver version) at link time
+    resolution_fingerprint = Column(String, nullable=True)
+
     supplier = relationship("Supplier", back_populates="entity_links")
     entity = relationship("GlobalEntity", back_populates="supplier_links")
 
@@ -189,6 +206,11 @@ class CoveredEntity(Base):
 class AssessmentHistory(Base):
     __tablename__ = "assessment_history"
 
+    __table_args__ = (
+        # Keyset pagination of a supplier's history (newest first)
+        Index("ix_assessment_history_supplier_created", "supplier_id", "created_at", "id"),
+    )
+
     id = Column(Integer, primary_key=True)
 
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
@@ -237,6 +259,11 @@ class ScoringConfig(Base):
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
+    __table_args__ = (
+        # Keyset pagination of the audit log (newest first)
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+    )
+
     id = Column(Integer, primary_key=True)
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -307,3 +334,161 @@ class TrustScoreHistory(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+
+# =====================================================
+# SANCTION EXPOSURE INDEX (NEAREST SANCTIONED ENTITIES)
+# =====================================================
+
+class SanctionExposure(Base):
+    __tablename__ = "sanction_exposure_index"
+
+    id = Column(Integer, primary_key=True)
+
+    # Graph Supplier nodes are keyed by name
+    supplier_name = Column(String, index=True, nullable=False)
+
+    sanctioned_entity = Column(String, nullable=False)
+    distance = Column(Integer, nullable=False)  # hops incl. RESOLVES_TO
+    path = Column(JSON, nullable=False)
+    strongest_relation = Column(String, nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+# =====================================================
+# DUPLICATE CANDIDATES (BLOCKING-KEY DEDUP JOB)
+# =====================================================
+
+class DuplicateCandidate(Base):
+    __tablename__ = "duplicate_candidates"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "record_type",
+            "keep_id",
+            "duplicate_id",
+            name="uq_duplicate_candidate_pair",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    record_type = Column(String, nullable=False)  # SUPPLIER | ENTITY
+    keep_id = Column(Integer, nullable=False)
+    duplicate_id = Column(Integer, nullable=False)
+
+    score = Column(Float, nullable=False)
+    blocking_key = Column(String, nullable=True)
+
+    # Alias the kept entity would gain if the merge is accepted
+    proposed_alias = Column(String, nullable=True)
+
+    status = Column(String, default="PENDING", index=True)  # PENDING | ACCEPTED | REJECTED
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# =====================================================
+# NEWS STORE (INCREMENTAL GNEWS INGESTION)
+# =====================================================
+
+class NewsArticle(Base):
+    __tablename__ = "news_articles"
+
+    __table_args__ = (
+        UniqueConstraint("supplier_id", "url", name="uq_news_article_supplier_url"),
+        # Latest-articles reads for news signals / profile views
+        Index("ix_news_articles_supplier_published", "supplier_id", "published_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+
+    url = Column(String, nullable=False)
+    title = Column(String, nullable=True)
+    description = Column(String, nullable=True)
+    source_name = Column(String, nullable=True)
+    image = Column(String, nullable=True)
+
+    published_at = Column(DateTime, nullable=True)
+
+    # Keyword annotations computed at ingestion time
+    risk_keywords = Column(JSON, nullable=True)
+    risk_score = Column(Integer, default=0)
+
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SupplierNewsState(Base):
+    """Watched suppliers and their incremental fetch cursor."""
+    __tablename__ = "supplier_news_state"
+
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), primary_key=True)
+
+    # Next fetch asks only for articles newer than this
+    last_published_at = Column(DateTime, nullable=True)
+    last_checked_at = Column(DateTime, nullable=True, index=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# =====================================================
+# SEC EDGAR LOCAL INDEX (QUARTERLY form.idx INGESTION)
+# =====================================================
+
+class EdgarCompany(Base):
+    __tablename__ = "edgar_companies"
+
+    cik = Column(String, primary_key=True)
+
+    name = Column(String, nullable=False)
+    # Trigram-indexed on postgres (fuzzy company lookup)
+    normalized_name = Column(String, index=True, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class EdgarFiling(Base):
+    __tablename__ = "edgar_filings"
+
+    __table_args__ = (
+        UniqueConstraint("cik", "filename", "form_type", name="uq_edgar_filing"),
+        # Recent filings of a matched company
+        Index("ix_edgar_filings_cik_date", "cik", "date_filed"),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    cik = Column(String, nullable=False)
+    form_type = Column(String, nullable=False)
+    date_filed = Column(Date, nullable=False, index=True)
+
+    # Path under https://www.sec.gov/Archives/
+    filename = Column(String, nullable=False)
+
+
+# =====================================================
+# CENSUS TRADE STATISTICS (MONTHLY HS2 IMPORTS BY COUNTRY)
+# =====================================================
+
+class TradeStat(Base):
+    __tablename__ = "trade_stats"
+
+    __table_args__ = (
+        UniqueConstraint("country_name", "hs_chapter", "period", name="uq_trade_stat"),
+        # Window lookups for one country
+        Index("ix_trade_stats_country_period", "country_name", "period"),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    country_code = Column(String, nullable=True)   # Census CTY_CODE
+    country_name = Column(String, nullable=False)  # upper-case, as published
+    hs_chapter = Column(String, nullable=False)    # 2-digit HS code
+    period = Column(String, nullable=False)        # YYYY-MM
+
+    general_value = Column(BigInteger, default=0)
+    consumption_value = Column(BigInteger, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
@@ -1,5 +1,11 @@
+import codecs
+import os
 import re
-from typing import List
+from typing import Iterable, Iterator, List
+
+import requests
+
+from app.core.config import SEC_EDGAR_UA
 
 def clean_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text)
@@ -7,3 +13,124 @@ def clean_text(text: str) -> str:
 
 def split_into_sentences(text: str) -> List[str]:
     return re.split(r'(?<=[.!?]) +', text)
+
+
+# =====================================================
+# STREAMING CONFIG
+# =====================================================
+
+# Read size for files / HTTP bodies
+CHUNK_CHARS = int(os.getenv("DOCUMENT_CHUNK_CHARS", "262144"))
+
+# Text handed to spaCy per Doc (far below nlp.max_length)
+WINDOW_CHARS = int(os.getenv("DOCUMENT_WINDOW_CHARS", "20000"))
+
+# Sentences repeated at the start of the next window, so relations
+# spanning a window boundary are still seen in one Doc
+OVERLAP_SENTENCES = int(os.getenv("DOCUMENT_OVERLAP_SENTENCES", "2"))
+
+# Runs without sentence punctuation (tables, exhibits) are cut here
+MAX_SENTENCE_CHARS = 5000
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+# =====================================================
+# SOURCES (CHUNKED READS)
+# =====================================================
+
+def iter_file_chunks(path: str, chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_url_chunks(url: str, chunk_bytes: int = CHUNK_CHARS, headers: dict | None = None,
+                    timeout: int = 30) -> Iterator[str]:
+    headers = headers or {"User-Agent": SEC_EDGAR_UA}
+
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as resp:
+        resp.raise_for_status()
+
+        # Incremental decoder: multi-byte characters can straddle chunks
+        decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+
+        for block in resp.iter_content(chunk_size=chunk_bytes):
+            text = decoder.decode(block)
+            if text:
+                yield text
+
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+# =====================================================
+# SENTENCES + OVERLAPPING WINDOWS
+# =====================================================
+
+def iter_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """Sentences from a chunk stream; only the unfinished tail is buffered."""
+    buffer = ""
+
+    for chunk in chunks:
+        parts = _SENTENCE_BOUNDARY.split(buffer + chunk)
+        buffer = parts.pop()
+
+        for sentence in parts:
+            sentence = clean_text(sentence)
+            if sentence:
+                yield sentence
+
+        while len(buffer) > MAX_SENTENCE_CHARS:
+            cut = buffer.rfind(" ", 0, MAX_SENTENCE_CHARS)
+            if cut <= 0:
+                cut = MAX_SENTENCE_CHARS
+
+            sentence = clean_text(buffer[:cut])
+            if sentence:
+                yield sentence
+            buffer = buffer[cut:]
+
+    tail = clean_text(buffer)
+    if tail:
+        yield tail
+
+
+def sentence_windows(sentences: Iterable[str], window_chars: int = WINDOW_CHARS,
+                     overlap_sentences: int = OVERLAP_SENTENCES) -> Iterator[str]:
+    window = []
+    size = 0
+    fresh = 0
+
+    for sentence in sentences:
+        window.append(sentence)
+        size += len(sentence) + 1
+        fresh += 1
+
+        if size >= window_chars:
+            yield " ".join(window)
+
+            window = window[-overlap_sentences:] if overlap_sentences > 0 else []
+            size = sum(len(s) + 1 for s in window)
+            fresh = 0
+
+    if fresh:
+        yield " ".join(window)
+
+
+def stream_document(source: str, window_chars: int = WINDOW_CHARS,
+                    overlap_sentences: int = OVERLAP_SENTENCES) -> Iterator[str]:
+    """
+    Bounded-memory text windows from a file path or http(s) URL,
+    ready for nlp_entity_pipeline.process_documents.
+    """
+    if source.startswith(("http://", "https://")):
+        chunks = iter_url_chunks(source)
+    else:
+        chunks = iter_file_chunks(source)
+
+    return sentence_windows(iter_sentences(chunks), window_chars, overlap_sentences)
@@ -1,15 +1,15 @@
-import spacy
 from typing import List, Dict
 
-nlp = spacy.load("en_core_web_sm")
+from app.nlp.model_registry import parse
+
+ENTITY_LABELS = ["ORG", "PERSON", "GPE"]
 
-def extract_entities(text: str) -> List[Dict]:
-    doc = nlp(text)
 
+def entities_from_doc(doc) -> List[Dict]:
     entities = []
 
     for ent in doc.ents:
-        if ent.label_ in ["ORG", "PERSON", "GPE"]:
+        if ent.label_ in ENTITY_LABELS:
             entities.append({
                 "text": ent.text,
                 "label": ent.label_,
@@ -18,3 +18,7 @@ def extract_entities(text: str) -> List[Dict]:
             })
 
     return entities
+
+
+def extract_entities(text: str) -> List[Dict]:
+    return entities_from_doc(parse(text, task="ner"))
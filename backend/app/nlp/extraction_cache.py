@@ -0,0 +1,59 @@
+import hashlib
+import json
+import os
+
+from app.nlp.model_registry import DEFAULT_MODEL, model_version
+
+
+# =====================================================
+# EXTRACTION CACHE (CONTENT-ADDRESSED)
+# =====================================================
+# Same normalized text + same model + same extractor code = same
+# entities/relations, so re-ingested or syndicated articles skip spaCy.
+# Bump EXTRACTOR_VERSION whenever the extraction output changes shape.
+
+EXTRACTOR_VERSION = "2"
+KEY_PREFIX = "nlp:extract"
+EXTRACTION_CACHE_TTL_SECONDS = int(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", str(30 * 86400)))
+
+
+def extraction_key(normalized_text: str, model: str = DEFAULT_MODEL) -> str:
+    digest = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{model}:{model_version(model)}:{EXTRACTOR_VERSION}:{digest}"
+
+
+def get_cached_extractions(keys: list) -> list:
+    """One MGET; a miss (or Redis being down) comes back as None."""
+    if not keys:
+        return []
+
+    try:
+        from app.worker.celery_app import redis_client
+        values = redis_client.mget(keys)
+    except Exception as e:
+        print(f"⚠️ Extraction cache read failed: {e}")
+        return [None] * len(keys)
+
+    results = []
+    for value in values:
+        try:
+            results.append(json.loads(value) if value else None)
+        except json.JSONDecodeError:
+            results.append(None)
+
+    return results
+
+
+def store_extractions(results: dict):
+    """results: {key: extraction}"""
+    if not results:
+        return
+
+    try:
+        from app.worker.celery_app import redis_client
+        pipe = redis_client.pipeline(transaction=False)
+        for key, extraction in results.items():
+            pipe.setex(key, EXTRACTION_CACHE_TTL_SECONDS, json.dumps(extraction))
+        pipe.execute()
+    except Exception as e:
+        print(f"⚠️ Extraction cache write failed: {e}")
@@ -0,0 +1,70 @@
+import gc
+import os
+import threading
+from functools import lru_cache
+from importlib import metadata
+
+
+# =====================================================
+# SPACY MODEL REGISTRY
+# =====================================================
+# One copy of each model per process, loaded on first use. Tasks don't
+# load their own pipelines; they run the shared one with only the
+# components they need (passed as `disable=`, which is thread-safe).
+# Celery preloads in the parent at worker_init so prefork children share
+# the model pages copy-on-write.
+
+DEFAULT_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+TASK_PIPES = {
+    "ner": {"tok2vec", "ner"},
+    "parser": {"tok2vec", "tagger", "attribute_ruler", "parser"},
+    "full": {"tok2vec", "tagger", "attribute_ruler", "parser", "ner"},
+}
+
+_models: dict = {}
+_lock = threading.Lock()
+
+
+def get_model(name: str = DEFAULT_MODEL):
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        if name not in _models:
+            import spacy
+            _models[name] = spacy.load(name)
+        return _models[name]
+
+
+@lru_cache(maxsize=None)
+def model_version(name: str = DEFAULT_MODEL) -> str:
+    """Installed package version of a model, without loading it."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def disabled_pipes(task: str, name: str = DEFAULT_MODEL) -> list:
+    """Components of the model that `task` does not use."""
+    required = TASK_PIPES[task]
+    return [pipe for pipe in get_model(name).pipe_names if pipe not in required]
+
+
+def parse(text: str, task: str = "full", name: str = DEFAULT_MODEL):
+    return get_model(name)(text, disable=disabled_pipes(task, name))
+
+
+def pipe(texts, task: str = "full", name: str = DEFAULT_MODEL, **kwargs):
+    return get_model(name).pipe(texts, disable=disabled_pipes(task, name), **kwargs)
+
+
+def preload_models(names=None):
+    """Load models up front (pre-fork) and move them out of GC tracking."""
+    for name in names or [DEFAULT_MODEL]:
+        get_model(name)
+
+    # Keep the collector from touching (and un-sharing) the model's pages
+    gc.freeze()
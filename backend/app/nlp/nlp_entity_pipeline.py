@@ -1,38 +1,140 @@
+import os
+from itertools import islice
+from typing import Iterable
+
 from sqlalchemy.orm import Session
 
-from app.nlp.entity_extractor import extract_entities
-from app.nlp.relationship_extractor import extract_relationships
-from app.services.entity_resolution_service import resolve_or_create_entity
-from app.graph.supplier_graph_service import create_entity_relationship
+from app.nlp import model_registry
+from app.nlp.document_processor import clean_text, stream_document
+from app.nlp.entity_extractor import entities_from_doc
+from app.nlp.extraction_cache import extraction_key, get_cached_extractions, store_extractions
+from app.nlp.relationship_extractor import relationships_from_doc
+from app.services.entity_resolution_service import resolve_entities_bulk
+from app.graph.supplier_graph_service import create_entity_relationships
+
+
+# =====================================================
+# BATCH CONFIG
+# =====================================================
+
+NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", "64"))
+
+# spaCy worker processes for nlp.pipe. Keep 1 inside Celery prefork
+# children (daemonic processes cannot start their own pool).
+NLP_PROCESSES = int(os.getenv("NLP_PROCESSES", "1"))
+
+# Resolve + write to the graph every N documents (flat memory on big feeds)
+DOCUMENTS_PER_FLUSH = int(os.getenv("NLP_DOCUMENTS_PER_FLUSH", "500"))
+
+# =====================================================
+# PARSING (ONE PASS PER DOCUMENT)
+# =====================================================
+
+def parse_documents(texts: Iterable[str], batch_size: int = NLP_BATCH_SIZE, n_process: int = NLP_PROCESSES):
+    """Stream Docs from nlp.pipe; NER + parser on, everything else off."""
+    return model_registry.pipe(texts, task="full", batch_size=batch_size, n_process=n_process)
+
+
+def extract_documents(texts: list) -> list:
+    """
+    {entities, relationships} per text. Texts already seen (same
+    normalized content + model) come from the cache; only misses are parsed.
+    """
+    texts = [clean_text(text) for text in texts]
+    keys = [extraction_key(text) for text in texts]
+    extractions = get_cached_extractions(keys)
+
+    misses = [i for i, extraction in enumerate(extractions) if extraction is None]
+    fresh = {}
+
+    if misses:
+        docs = parse_documents(texts[i] for i in misses)
+
+        for i, doc in zip(misses, docs):
+            extractions[i] = {
+                "entities": entities_from_doc(doc),
+                "relationships": relationships_from_doc(doc),
+            }
+            fresh[keys[i]] = extractions[i]
+
+    store_extractions(fresh)
+    return extractions
+
+
+# =====================================================
+# BULK RESOLUTION + GRAPH WRITES
+# =====================================================
+
+def _flush(extractions, db: Session):
+    """Resolve every entity of a document batch at once, then UNWIND the edges."""
+    labels = {}
+    for extraction in extractions:
+        for ent in extraction["entities"]:
+            labels.setdefault(ent["text"], ent["label"])
+
+    if not labels:
+        return 0, 0
+
+    resolved = resolve_entities_bulk(
+        [{"name": name, "entity_type": label} for name, label in labels.items()],
+        db,
+    )
+
+    entity_map = {raw: entity.canonical_name for raw, (entity, _) in resolved.items()}
+
+    edges = {}
+    for extraction in extractions:
+        for rel in extraction["relationships"]:
+            subject = entity_map.get(rel["subject"])
+            obj = entity_map.get(rel["object"])
+
+            if not subject or not obj or subject == obj:
+                continue
+
+            relation = rel["relationship"].upper()
+            key = (subject, obj, relation)
+
+            # Same edge seen in several documents: keep the strongest evidence
+            if key not in edges or rel["confidence"] > edges[key]["confidence"]:
+                edges[key] = {
+                    "subject_entity": subject,
+                    "object_entity": obj,
+                    "relationship_type": relation,
+                    "confidence": rel["confidence"],
+                }
+
+    if edges:
+        create_entity_relationships(list(edges.values()))
+
+    return len(resolved), len(edges)
+
+
+def process_documents(texts: Iterable[str], db: Session) -> dict:
+    """
+    Batch ingestion: one parse per document (entities and relations
+    from the same Doc), bulk entity resolution, bulk graph writes.
+    """
+    stats = {"documents": 0, "entities": 0, "relationships": 0}
+    texts = iter(texts)
+
+    while True:
+        batch = list(islice(texts, DOCUMENTS_PER_FLUSH))
+        if not batch:
+            break
+
+        entities, relationships = _flush(extract_documents(batch), db)
+
+        stats["documents"] += len(batch)
+        stats["entities"] += entities
+        stats["relationships"] += relationships
+
+    return stats
 
 
 def process_document(text: str, db: Session):
+    return process_documents([text], db)
+
 
-    extracted_entities = extract_entities(text)
-    extracted_relationships = extract_relationships(text)
-
-    entity_map = {}
-
-    # Resolve entities
-    for ent in extracted_entities:
-        entity, _ = resolve_or_create_entity(
-            name=ent["text"],
-            db=db,
-            entity_type=ent["label"],
-        )
-
-        entity_map[ent["text"]] = entity.canonical_name
-
-    # Resolve relationships
-    for rel in extracted_relationships:
-        subject = rel["subject"]
-        obj = rel["object"]
-        relation = rel["relationship"]
-
-        if subject in entity_map and obj in entity_map:
-            create_entity_relationship(
-                subject_entity=entity_map[subject],
-                object_entity=entity_map[obj],
-                relationship_type=relation,
-                confidence=0.85,
-            )
+def process_source(source: str, db: Session) -> dict:
+    """Ingest a large filing / report (path or URL) as streamed windows."""
+    return process_documents(stream_document(source), db)
@@ -1,29 +1,100 @@
-import spacy
 from typing import List, Dict
 
-nlp = spacy.load("en_core_web_sm")
+from app.nlp.confidence_engine import relationship_confidence
+from app.nlp.entity_extractor import ENTITY_LABELS
+from app.nlp.model_registry import parse
 
-def extract_relationships(text: str) -> List[Dict]:
-    doc = nlp(text)
+SUBJECT_DEPS = ["nsubj", "nsubjpass"]
+OBJECT_DEPS = ["dobj", "attr", "dative"]
+
+
+def _entity_spans(doc) -> dict:
+    """token index -> NER span (same labels entity extraction keeps)"""
+    spans = {}
+    for ent in doc.ents:
+        if ent.label_ in ENTITY_LABELS:
+            for token in ent:
+                spans[token.i] = ent
+    return spans
+
+
+def _aligned_entity(token, spans):
+    """The entity the token is part of, else the first one inside its phrase."""
+    if token.i in spans:
+        return spans[token.i]
+
+    for child in token.subtree:
+        if child.i in spans:
+            return spans[child.i]
+
+    return None
+
+
+def _object_tokens(verb):
+    for child in verb.children:
+        if child.dep_ in OBJECT_DEPS:
+            yield child
+        elif child.dep_ == "prep":
+            for grandchild in child.children:
+                if grandchild.dep_ == "pobj":
+                    yield grandchild
+
+
+def relationships_from_doc(doc) -> List[Dict]:
+    """
+    (subject entity, verb, object entity) triples whose arguments are the
+    full NER spans, so they line up with entities_from_doc of the same Doc.
+    """
+    spans = _entity_spans(doc)
+    if len(spans) < 2:
+        return []
 
     relationships = []
 
-    for token in doc:
-        if token.dep_ == "ROOT" and token.pos_ == "VERB":
-            subject = None
-            obj = None
+    for verb in doc:
+        if verb.pos_ != "VERB":
+            continue
+
+        subjects = [child for child in verb.children if child.dep_ in SUBJECT_DEPS]
+        if not subjects:
+            continue
+
+        subject_token = subjects[0]
+        object_tokens = list(_object_tokens(verb))
+
+        if subject_token.dep_ == "nsubjpass":
+            # "Beta was acquired by Acme" -> Acme acquired Beta
+            agents = [
+                grandchild
+                for child in verb.children if child.dep_ == "agent"
+                for grandchild in child.children if grandchild.dep_ == "pobj"
+            ]
+            if not agents:
+                continue
+            subject_token, object_tokens = agents[0], [subject_token]
 
-            for child in token.children:
-                if child.dep_ in ["nsubj", "nsubjpass"]:
-                    subject = child.text
-                if child.dep_ in ["dobj", "pobj"]:
-                    obj = child.text
+        subject = _aligned_entity(subject_token, spans)
+        if subject is None:
+            continue
 
-            if subject and obj:
-                relationships.append({
-                    "subject": subject,
-                    "relationship": token.text,
-                    "object": obj
-                })
+        for object_token in object_tokens:
+            obj = _aligned_entity(object_token, spans)
+            if obj is None or obj.start == subject.start:
+                continue
+
+            relationship = {
+                "subject": subject.text,
+                "subject_label": subject.label_,
+                "relationship": verb.text.lower(),
+                "object": obj.text,
+                "object_label": obj.label_,
+            }
+            relationship["confidence"] = relationship_confidence(relationship)
+            relationships.append(relationship)
 
     return relationships
+
+
+def extract_relationships(text: str) -> List[Dict]:
+    # Arguments are aligned to NER spans, so this needs NER + parser
+    return relationships_from_doc(parse(text, task="full"))
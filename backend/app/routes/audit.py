@@ -1,21 +1,24 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional
 from app.database import get_db
 from app.models import AuditLog, User
-from app.schemas import AuditLogResponse
+from app.schemas import AuditLogPage
+from app.core.pagination import keyset_page
 
 
 router = APIRouter(prefix="/audit", tags=["Audit"])
 
 
-@router.get("/", response_model=List[AuditLogResponse])
+@router.get("/", response_model=AuditLogPage)
 def get_audit_logs(
     db: Session = Depends(get_db),
     
     user_id: Optional[int] = Query(None),
     action: Optional[str] = Query(None),
     resource_type: Optional[str] = Query(None),
+    limit: int = Query(50),
+    cursor: Optional[str] = Query(None),
 ):
     query = db.query(AuditLog)
 
@@ -28,6 +31,8 @@ def get_audit_logs(
     if resource_type:
         query = query.filter(AuditLog.resource_type == resource_type)
 
-    logs = query.order_by(AuditLog.timestamp.desc()).limit(200).all()
+    logs, next_cursor = keyset_page(
+        query, AuditLog.timestamp, AuditLog.id, cursor=cursor, limit=limit
+    )
 
-    return logs
+    return {"items": logs, "next_cursor": next_cursor}
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List
+from app.database import get_db
+from app.models import User
+from app.schemas import BulkResolveRequest, ResolvedEntityResponse
+from app.core.security import get_current_user
+from app.services.entity_resolution_service import resolve_entities_bulk
+
+router = APIRouter(prefix="/entities", tags=["Entities"])
+
+MAX_BULK_RESOLVE = 10000
+
+
+# =====================================================
+# BULK ENTITY RESOLUTION
+# =====================================================
+@router.post("/resolve-bulk", response_model=List[ResolvedEntityResponse])
+def resolve_bulk(
+    payload: BulkResolveRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if len(payload.entities) > MAX_BULK_RESOLVE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_RESOLVE} names per request",
+        )
+
+    resolved = resolve_entities_bulk(
+        [item.model_dump() for item in payload.entities],
+        db,
+        entity_type=payload.entity_type or "COMPANY",
+    )
+
+    return [
+        {
+            "name": name,
+            "entity_id": entity.id,
+            "canonical_name": entity.canonical_name,
+            "confidence": confidence,
+        }
+        for name, (entity, confidence) in resolved.items()
+    ]
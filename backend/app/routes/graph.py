@@ -1,10 +1,32 @@
-from fastapi import APIRouter
+import json
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.database import get_db
 from app.graph.graph_client import get_session
 from app.graph.supplier_graph_service import build_supply_chain_graph
+from app.graph.dirty_tracker import graph_view_cache_key, GRAPH_VIEW_TTL_SECONDS
+from app.worker.celery_app import redis_client
 
 router = APIRouter(prefix="/graph", tags=["Graph"])
 
 
 @router.get("/{supplier_name}")
-def get_graph(supplier_name: str):
-    return build_supply_chain_graph(supplier_name)
\ No newline at end of file
+def get_graph(supplier_name: str, db: Session = Depends(get_db)):
+    # Cached until an edge / sanction change in the supplier's neighbourhood
+    cache_key = graph_view_cache_key(supplier_name)
+
+    try:
+        cached = redis_client.get(cache_key)
+        if cached:
+            return json.loads(cached)
+    except Exception as e:
+        print(f"⚠️ Graph view cache read failed: {e}")
+
+    result = build_supply_chain_graph(supplier_name, db=db)
+
+    try:
+        redis_client.setex(cache_key, GRAPH_VIEW_TTL_SECONDS, json.dumps(result))
+    except Exception as e:
+        print(f"⚠️ Graph view cache write failed: {e}")
+
+    return result
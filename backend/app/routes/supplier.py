@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, WebSocket, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import asyncio
-from sqlalchemy import desc, func, case, or_, literal_column
+from sqlalchemy import desc, func, case, literal_column
 from sqlalchemy.exc import IntegrityError
 from app.services.supplier_comparison_service import compare_suppliers
 from app.database import get_db, SessionLocal
@@ -15,99 +15,68 @@ from app.models import (
     SanctionedEntity,
     AuditLog,
 )
-from app.schemas import SupplierCreate, SupplierResponse
+from app.schemas import SupplierCreate, SupplierResponse, SupplierPage
 from app.services.assessment_service import run_assessment
 from app.services.audit_service import log_action
 from app.core.security import get_current_user
+from app.core.pagination import keyset_page
+from app.core.tenancy import tenant_suppliers, get_visible_supplier
 from app.graph.supplier_graph_service import create_supplier_node
-from app.graph.graph_client import get_session
+from app.graph.graph_client import get_read_session
 from app.services.entity_resolution_service import normalize
+from app.graph.sanction_exposure_index import get_supplier_exposure
+from app.services.supplier_search import apply_supplier_search
+from app.services.supplier_autocomplete import autocomplete_suppliers, add_supplier_to_index
 
 router = APIRouter(prefix="/suppliers", tags=["Suppliers"])
 
 # =====================================================
 # SUPPLIER SEARCH (TRIGRAM + BOOSTED RANKING)
 # =====================================================
-@router.get("/search", response_model=List[SupplierResponse])
+@router.get("/search", response_model=SupplierPage)
 def search_suppliers(
     query: Optional[str] = Query(None),
     country: Optional[str] = None,
     industry: Optional[str] = None,
     limit: int = 20,
-    offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
 
-    if query:
-        normalized_query = normalize(query)
-        # Multi-field similarity scoring
-        name_sim = func.similarity(Supplier.normalized_name, normalized_query)
-        industry_sim = func.similarity(Supplier.industry, normalized_query)
-        country_sim = func.similarity(Supplier.country, normalized_query)
-        
-        search_score = (
-            (name_sim * 2.0) +
-            (industry_sim * 1.5) +
-            (country_sim * 1.0)
-        ).label("search_score")
-    else:
-        # Default score if no query is provided
-        search_score = literal_column("1.0").label("search_score")
-
-    base_query = (
-        db.query(Supplier, search_score)
-        .filter(
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            )
-        )
-    )
+    # Tenant rows UNION ALL global rows (no OR across the two)
+    scoped = tenant_suppliers(current_user.organization_id)
+    base_query = db.query(scoped)
 
     # Explicit filters
     if country:
-        base_query = base_query.filter(Supplier.country.ilike(f"%{country}%"))
+        base_query = base_query.filter(scoped.country.ilike(f"%{country}%"))
     
     if industry:
-        base_query = base_query.filter(Supplier.industry.ilike(f"%{industry}%"))
+        base_query = base_query.filter(scoped.industry.ilike(f"%{industry}%"))
 
-    # Relevancy threshold
+    # Trigram (postgres) / FTS5 (sqlite) match + boosted ranking
     if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(
-            or_(
-                func.similarity(Supplier.normalized_name, normalize(query)) > 0.15,
-                func.similarity(Supplier.industry, query) > 0.3,
-                func.similarity(Supplier.country, query) > 0.4,
-                Supplier.address.ilike(search_pattern),
-                Supplier.naics_code.ilike(search_pattern)
-            )
-        )
-
-    # Order by score + boosts
-    if query:
-        normalized_query = normalize(query)
-        order_expr = desc(
-            search_score
-            + case((Supplier.normalized_name == normalized_query, 2.0), else_=0.0)
-            + case((Supplier.industry == query, 3.0), else_=0.0)
-            + case((Supplier.country == query, 1.0), else_=0.0)
+        base_query, score_expr = apply_supplier_search(db, base_query, query, supplier=scoped)
+        base_query = base_query.add_columns(score_expr.label("rank"))
+
+        rows, next_cursor = keyset_page(
+            base_query,
+            score_expr,
+            scoped.id,
+            cursor=cursor,
+            limit=limit,
+            row_entity=lambda row: row[0],
+            sort_value=lambda row: row.rank,
         )
+        suppliers = [row[0] for row in rows]
     else:
-        order_expr = desc(Supplier.id) # Default ordering if no query
-
-    results = (
-        base_query
-        .order_by(order_expr)
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
-
-    suppliers = [row[0] for row in results]
+        # Default ordering if no query
+        suppliers, next_cursor = keyset_page(
+            base_query, scoped.id, scoped.id, cursor=cursor, limit=limit
+        )
 
-    return suppliers
+    return {"items": suppliers, "next_cursor": next_cursor}
 
 # =====================================================
 # CREATE SUPPLIER
@@ -162,6 +131,7 @@ def create_supplier(
         )
 
     resolve_supplier_entity(db_supplier, db)
+    add_supplier_to_index(db_supplier)
 
     try:
         create_supplier_node(db_supplier.name)
@@ -182,44 +152,36 @@ def create_supplier(
 # =====================================================
 # LIST SUPPLIERS (BASIC)
 # =====================================================
-@router.get("/", response_model=List[SupplierResponse])
+@router.get("/", response_model=SupplierPage)
 def list_suppliers(
     limit: int = 50,
-    offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return (
-        db.query(Supplier)
-        .filter(
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True  # 🔥 include seeded suppliers
-            )
-        )
-        .order_by(desc(Supplier.id))
-        .limit(limit)
-        .offset(offset)
-        .all()
+    # Own suppliers + seeded global catalog
+    scoped = tenant_suppliers(current_user.organization_id)
+
+    suppliers, next_cursor = keyset_page(
+        db.query(scoped), scoped.id, scoped.id, cursor=cursor, limit=limit
     )
 
+    return {"items": suppliers, "next_cursor": next_cursor}
+
 # =====================================================
 # LIST SUPPLIERS WITH LATEST STATUS
 # =====================================================
 @router.get("/with-status")
 def list_suppliers_with_status(
+    limit: int = 50,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    suppliers = (
-        db.query(Supplier)
-        .filter(
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            )
-        )
-        .all()
+    scoped = tenant_suppliers(current_user.organization_id)
+
+    suppliers, next_cursor = keyset_page(
+        db.query(scoped), scoped.id, scoped.id, cursor=cursor, limit=limit
     )
 
     results = []
@@ -243,7 +205,7 @@ def list_suppliers_with_status(
             "risk_score": latest_assessment.risk_score if latest_assessment else None,
         })
 
-    return results
+    return {"items": results, "next_cursor": next_cursor}
 
 # =====================================================
 # IDENTITY RESOLUTION (TENANT SAFE)
@@ -259,29 +221,33 @@ def resolve_supplier_identity(
     if len(name) < 3:
         return {"matches": []}
 
-    existing_suppliers = (
-        db.query(Supplier)
-        .filter(
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            )
-        )
-        .all()
-    )
-
-    matches = []
+    suggestions = autocomplete_suppliers(db, current_user.organization_id, name)
 
-    for supplier in existing_suppliers:
-        if name.lower() in supplier.name.lower():
-            matches.append({
-                "canonical_name": supplier.name,
-                "confidence": 85,
-                "country": supplier.country,
-            })
+    matches = [
+        {
+            "canonical_name": s["name"],
+            "confidence": s["confidence"],
+            "country": s["country"],
+        }
+        for s in suggestions
+    ]
 
     return {"matches": matches}
 
+# =====================================================
+# TYPEAHEAD AUTOCOMPLETE (IN-MEMORY PREFIX INDEX)
+# =====================================================
+@router.get("/autocomplete")
+def autocomplete(
+    q: str = Query(..., min_length=1),
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return {
+        "suggestions": autocomplete_suppliers(db, current_user.organization_id, q, limit)
+    }
+
 # =====================================================
 # SUPPLIER PROFILE (AGGREGATED VIEW)
 # =====================================================
@@ -295,17 +261,7 @@ def get_supplier_profile(
     # =====================================================
     # Fetch Supplier (Tenant Safe)
     # =====================================================
-    supplier = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_id,
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            ),
-        )
-        .first()
-    )
+    supplier = get_visible_supplier(db, supplier_id, current_user.organization_id)
 
     if not supplier:
         raise HTTPException(status_code=404, detail="Supplier not found")
@@ -381,7 +337,7 @@ def get_supplier_profile(
     graph_summary = {"node_count": 0, "relationship_count": 0}
 
     try:
-        with get_session() as session:
+        with get_read_session() as session:
 
             # ---- Parent Entities ----
             parent_result = session.run(
@@ -463,6 +419,7 @@ def get_supplier_profile(
         ],
         "linked_entities": entity_data,
         "sanctioned_entities": sanction_hits,
+        "sanction_exposure": get_supplier_exposure(db, supplier.name),
         "graph_summary": graph_summary,
     }
 import json
@@ -503,17 +460,7 @@ def supplier_assessment(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    supplier = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_id,
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            ),
-        )
-        .first()
-    )
+    supplier = get_visible_supplier(db, supplier_id, current_user.organization_id)
 
     if not supplier:
         raise HTTPException(status_code=404, detail="Supplier not found")
@@ -578,38 +525,48 @@ def supplier_assessment(
 @router.get("/{supplier_id:int}/history")
 def supplier_history(
     supplier_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    history = (
-        db.query(AssessmentHistory)
-        .join(Supplier)
-        .filter(
-            Supplier.id == supplier_id,
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            ),
-        )
-        .order_by(AssessmentHistory.created_at.asc())
-        .all()
+    if not get_visible_supplier(db, supplier_id, current_user.organization_id):
+        raise HTTPException(status_code=404, detail="Supplier not found")
+
+    # Served by ix_assessment_history_supplier_created
+    base_query = db.query(AssessmentHistory).filter(
+        AssessmentHistory.supplier_id == supplier_id
+    )
+
+    # Newest first
+    history, next_cursor = keyset_page(
+        base_query,
+        AssessmentHistory.created_at,
+        AssessmentHistory.id,
+        cursor=cursor,
+        limit=limit,
     )
 
-    return [
-    {
-        "id": h.id,
-        "risk_score": h.risk_score,
-        "overall_status": h.overall_status,
-        "sanctions_flag": h.sanctions_flag,
-        "section889_status": h.section889_status,
-        "news_signal_score": h.news_signal_score,
-        "graph_risk_score": h.graph_risk_score,
-        "scoring_version": h.scoring_version,
-        "initiated_by_user_id": h.initiated_by_user_id,
-        "created_at": h.created_at,
+    return {
+        "items": [
+            {
+                "id": h.id,
+                "risk_score": h.risk_score,
+                "overall_status": h.overall_status,
+                "sanctions_flag": h.sanctions_flag,
+                "section889_status": h.section889_status,
+                "news_signal_score": h.news_signal_score,
+                "graph_risk_score": h.graph_risk_score,
+                "scoring_version": h.scoring_version,
+                "initiated_by_user_id": h.initiated_by_user_id,
+                "created_at": h.created_at,
+            }
+            for h in history
+        ],
+        "next_cursor": next_cursor,
     }
-    for h in history
-]
+
+
 # =====================================================
 # ASSESSMENT DELTA COMPARISON
 # =====================================================
@@ -621,17 +578,7 @@ def compare_assessments(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    supplier = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_id,
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            ),
-        )
-        .first()
-    )
+    supplier = get_visible_supplier(db, supplier_id, current_user.organization_id)
 
     if not supplier:
         raise HTTPException(status_code=404, detail="Supplier not found")
@@ -707,55 +654,34 @@ from app.services.public_data_service import aggregate_public_data
 def get_supplier_public_data(
     supplier_id: int,
     news_months: int = Query(12, ge=1, le=36),
+    trade_months: int = Query(12, ge=1, le=36),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Aggregate publicly available data for a supplier:
     - Sanctions lists (OFAC SDN, BIS Denied Parties, EU sanctions)
-    - Trade/import records (US Census)
-    - Corporate filings (SEC EDGAR)
+    - Trade/import records (local US Census import statistics)
+    - Corporate filings (local SEC EDGAR index)
     - Recent news (GNews, configurable time window)
 
-    Results are cached in Redis for 6 hours.
+    Each source is cached separately in Redis (shared across tenants,
+    per-source TTLs); see public_data_service.
     """
-    supplier = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_id,
-            or_(
-                Supplier.organization_id == current_user.organization_id,
-                Supplier.is_global == True
-            ),
-        )
-        .first()
-    )
+    supplier = get_visible_supplier(db, supplier_id, current_user.organization_id)
 
     if not supplier:
         raise HTTPException(status_code=404, detail="Supplier not found")
 
-    # ── Redis cache (6-hour TTL) ──
-    cache_key = f"public_data:{supplier_id}"
-    cached = redis_client.get(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except json.JSONDecodeError:
-            pass
-
-    # ── Fresh aggregation ──
     result = aggregate_public_data(
+        db=db,
         name=supplier.name,
         country=supplier.country or "",
         news_months=news_months,
+        supplier_id=supplier.id,
+        trade_months=trade_months,
     )
 
-    # Cache for 6 hours
-    try:
-        redis_client.setex(cache_key, 21600, json.dumps(result))
-    except Exception as e:
-        print(f"⚠️ Redis cache write failed: {e}")
-
     log_action(
         db=db,
         user_id=current_user.id,
@@ -27,6 +27,11 @@ class SupplierResponse(BaseModel):
         from_attributes = True
 
 
+class SupplierPage(BaseModel):
+    items: list[SupplierResponse]
+    next_cursor: Optional[str] = None
+
+
 class UserCreate(BaseModel):
     username: str
     password: str
@@ -59,3 +64,26 @@ class AuditLogResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AuditLogPage(BaseModel):
+    items: list[AuditLogResponse]
+    next_cursor: Optional[str] = None
+
+
+class EntityResolveItem(BaseModel):
+    name: str
+    entity_type: Optional[str] = None
+    country: Optional[str] = None
+
+
+class BulkResolveRequest(BaseModel):
+    entities: list[EntityResolveItem]
+    entity_type: Optional[str] = "COMPANY"
+
+
+class ResolvedEntityResponse(BaseModel):
+    name: str
+    entity_id: int
+    canonical_name: str
+    confidence: float
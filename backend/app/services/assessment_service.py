@@ -87,7 +87,7 @@ def run_assessment(supplier_id: int, db: Session, user_id: int | None = None):
         reasons.append(section889_result.get("reason"))
 
     # ------------------ External Intelligence (News) ------------------
-    news_score = news_risk_signal(supplier_name)
+    news_score = news_risk_signal(supplier_id, db)
 
     if news_score and news_score > 0:
         risk_score += news_score
@@ -0,0 +1,192 @@
+from collections import defaultdict
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from sqlalchemy.orm import Session
+
+from app.models import DuplicateCandidate, GlobalEntity, Supplier
+from app.core.normalization import core_name
+
+
+# =====================================================
+# DEDUP CONFIG
+# =====================================================
+
+DUPLICATE_THRESHOLD = 90
+PREFIX_LENGTH = 4
+
+# Blocks bigger than this are split on a longer prefix (keeps the
+# job near-linear when a common prefix like "inte" explodes)
+MAX_BLOCK_SIZE = 500
+MAX_PREFIX_LENGTH = 10
+
+
+# =====================================================
+# BLOCKING KEYS
+# =====================================================
+
+def blocking_keys(normalized_name: str, country: str = None, naics_code: str = None):
+    """
+    Cheap keys; two records are only compared if they share one.
+    - name prefix + country
+    - sorted tokens (catches reordered names)
+    - NAICS + first token
+    """
+    core = core_name(normalized_name)
+    tokens = core.split()
+    if not tokens:
+        return []
+
+    country_key = (country or "").strip().lower()
+
+    keys = [
+        f"prefix:{core[:PREFIX_LENGTH]}|{country_key}",
+        f"tokens:{' '.join(sorted(tokens))}",
+    ]
+
+    if naics_code:
+        keys.append(f"naics:{naics_code}|{tokens[0]}")
+
+    return keys
+
+
+def _split_block(key: str, members: list, names: dict, prefix_length: int):
+    """Re-block an oversized prefix block on a longer prefix."""
+    if len(members) <= MAX_BLOCK_SIZE:
+        return [(key, members)]
+
+    if not key.startswith("prefix:") or prefix_length >= MAX_PREFIX_LENGTH:
+        print(f"⚠️ Dedup block {key} skipped ({len(members)} records)")
+        return []
+
+    sub_blocks = defaultdict(list)
+    for record_id in members:
+        sub_blocks[names[record_id][:prefix_length + 2]].append(record_id)
+
+    blocks = []
+    for prefix, sub_members in sub_blocks.items():
+        blocks.extend(_split_block(f"{key}|{prefix}", sub_members, names, prefix_length + 2))
+    return blocks
+
+
+# =====================================================
+# PAIR SCORING (WITHIN BLOCKS ONLY)
+# =====================================================
+
+def find_duplicate_pairs(records):
+    """
+    records: iterable of (id, normalized_name, country, naics_code, scope).
+    Only records with the same scope (e.g. organization) are compared.
+    Returns {(keep_id, duplicate_id): (score, blocking_key)}.
+    """
+    blocks = defaultdict(list)
+    names = {}
+
+    for record_id, normalized_name, country, naics_code, scope in records:
+        names[record_id] = core_name(normalized_name)
+        for key in blocking_keys(normalized_name, country, naics_code):
+            blocks[(scope, key)].append(record_id)
+
+    pairs = {}
+
+    for (_, key), members in blocks.items():
+        if len(members) < 2:
+            continue
+
+        for block_key, block in _split_block(key, members, names, PREFIX_LENGTH):
+            if len(block) < 2:
+                continue
+
+            block_names = [names[record_id] for record_id in block]
+            scores = process.cdist(
+                block_names,
+                block_names,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=DUPLICATE_THRESHOLD,
+                dtype=np.float32,
+            )
+
+            rows, cols = np.nonzero(np.triu(scores, k=1))
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                keep_id, duplicate_id = sorted((block[row], block[col]))
+                score = round(float(scores[row, col]), 2)
+
+                if score > pairs.get((keep_id, duplicate_id), (0, None))[0]:
+                    pairs[(keep_id, duplicate_id)] = (score, block_key)
+
+    return pairs
+
+
+# =====================================================
+# PROPOSALS
+# =====================================================
+
+def _store_candidates(db: Session, record_type: str, pairs: dict, aliases: dict = None):
+    """Insert new pairs; existing ones (incl. rejected) are left alone."""
+    existing = set(
+        db.query(DuplicateCandidate.keep_id, DuplicateCandidate.duplicate_id)
+        .filter(DuplicateCandidate.record_type == record_type)
+        .all()
+    )
+
+    rows = [
+        {
+            "record_type": record_type,
+            "keep_id": keep_id,
+            "duplicate_id": duplicate_id,
+            "score": score,
+            "blocking_key": blocking_key,
+            "proposed_alias": (aliases or {}).get(duplicate_id),
+            "status": "PENDING",
+        }
+        for (keep_id, duplicate_id), (score, blocking_key) in pairs.items()
+        if (keep_id, duplicate_id) not in existing
+    ]
+
+    db.bulk_insert_mappings(DuplicateCandidate, rows)
+    db.commit()
+
+    return len(rows)
+
+
+def detect_supplier_duplicates(db: Session):
+    # Tenants are never merged with each other (scope = organization)
+    records = db.query(
+        Supplier.id,
+        Supplier.normalized_name,
+        Supplier.country,
+        Supplier.naics_code,
+        Supplier.organization_id,
+    ).yield_per(5000)
+
+    pairs = find_duplicate_pairs(records)
+    return _store_candidates(db, "SUPPLIER", pairs)
+
+
+def detect_entity_duplicates(db: Session):
+    canonical_names = {}
+    records = []
+
+    rows = db.query(
+        GlobalEntity.id,
+        GlobalEntity.normalized_name,
+        GlobalEntity.canonical_name,
+        GlobalEntity.country,
+        GlobalEntity.entity_type,
+    ).yield_per(5000)
+
+    for entity_id, normalized_name, canonical_name, country, entity_type in rows:
+        canonical_names[entity_id] = canonical_name
+        records.append((entity_id, normalized_name, country, None, entity_type))
+
+    pairs = find_duplicate_pairs(records)
+
+    # Accepting a merge keeps the older entity and aliases the newer name
+    return _store_candidates(db, "ENTITY", pairs, aliases=canonical_names)
+
+
+def run_dedup_scan(db: Session):
+    return {
+        "supplier_candidates": detect_supplier_duplicates(db),
+        "entity_candidates": detect_entity_duplicates(db),
+    }
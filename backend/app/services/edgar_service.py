@@ -0,0 +1,284 @@
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import requests
+from rapidfuzz import fuzz
+from sqlalchemy import case, func, or_, text
+from sqlalchemy.orm import Session
+
+from app.core.config import SEC_EDGAR_UA
+from app.core.normalization import core_name, normalize
+from app.database import dialect_insert
+from app.models import EdgarCompany, EdgarFiling
+
+
+# =====================================================
+# EDGAR INDEX CONFIG
+# =====================================================
+# EDGAR publishes one form.idx per quarter (the current quarter's file
+# is rebuilt nightly). A daily job pulls only filings newer than what is
+# stored; profile views match companies locally and never call SEC.
+
+EDGAR_FULL_INDEX_URL = "https://www.sec.gov/Archives/edgar/full-index/{year}/QTR{quarter}/form.idx"
+EDGAR_ARCHIVES_URL = "https://www.sec.gov/Archives/"
+
+# Forms kept locally (amendments included)
+FILING_FORMS = {"10-K", "10-Q", "8-K", "20-F", "6-K"}
+
+# Empty table: backfill this many quarters (matches the 2-year lookup window)
+EDGAR_BACKFILL_QUARTERS = int(os.getenv("EDGAR_BACKFILL_QUARTERS", "8"))
+
+# Politeness between quarter downloads (SEC allows ~10 req/s)
+EDGAR_REQUEST_PAUSE_SECONDS = 0.5
+
+INSERT_BATCH_SIZE = 5000
+
+# Lookup
+FILING_LOOKBACK_DAYS = 730
+FILING_RESULT_LIMIT = 10
+COMPANY_CANDIDATES = 50
+COMPANY_MATCH_THRESHOLD = 90
+TRIGRAM_SIMILARITY = 0.3
+# SQLite fallback: query tokens that select candidates
+FALLBACK_TOKENS = 3
+
+
+# =====================================================
+# form.idx PARSING
+# =====================================================
+
+def _quarter_of(day: date):
+    return day.year, (day.month - 1) // 3 + 1
+
+
+def _quarters_since(start: date, end: date):
+    year, quarter = _quarter_of(start)
+    last = _quarter_of(end)
+
+    while (year, quarter) <= last:
+        yield year, quarter
+        quarter += 1
+        if quarter == 5:
+            year, quarter = year + 1, 1
+
+
+def _column_starts(header: str):
+    """Fixed-width column offsets, read from the header row."""
+    labels = ["Form Type", "Company Name", "CIK", "Date Filed", "File Name"]
+    return [header.index(label) for label in labels]
+
+
+def iter_form_index(year: int, quarter: int):
+    """(form_type, company_name, cik, date_filed, filename) rows, streamed."""
+    url = EDGAR_FULL_INDEX_URL.format(year=year, quarter=quarter)
+
+    with requests.get(url, headers={"User-Agent": SEC_EDGAR_UA}, stream=True, timeout=60) as resp:
+        if resp.status_code == 404:
+            return
+        resp.raise_for_status()
+
+        starts = None
+        in_body = False
+
+        for raw in resp.iter_lines():
+            line = raw.decode("latin-1")
+
+            if not in_body:
+                if line.startswith("Form Type"):
+                    starts = _column_starts(line)
+                elif line.startswith("---") and starts:
+                    in_body = True
+                continue
+
+            if not line.strip():
+                continue
+
+            form_type = line[starts[0]:starts[1]].strip()
+            if form_type.removesuffix("/A") not in FILING_FORMS:
+                continue
+
+            try:
+                filed = datetime.strptime(line[starts[3]:starts[4]].strip(), "%Y-%m-%d").date()
+            except ValueError:
+                continue
+
+            yield (
+                form_type,
+                line[starts[1]:starts[2]].strip(),
+                line[starts[2]:starts[3]].strip(),
+                filed,
+                line[starts[4]:].strip(),
+            )
+
+
+# =====================================================
+# INGESTION
+# =====================================================
+
+def _write_batch(db: Session, filings: list, companies: dict):
+    insert = dialect_insert(db)
+
+    if companies:
+        stmt = insert(EdgarCompany).values([
+            {"cik": cik, "name": name, "normalized_name": normalize(name), "updated_at": datetime.utcnow()}
+            for cik, name in companies.items()
+        ])
+        # Conformed names change over time; the newest one wins
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["cik"],
+            set_={"name": stmt.excluded.name, "normalized_name": stmt.excluded.normalized_name,
+                  "updated_at": stmt.excluded.updated_at},
+        ))
+
+    added = 0
+    if filings:
+        added = db.execute(insert(EdgarFiling).values(filings).on_conflict_do_nothing()).rowcount
+
+    db.commit()
+    return added
+
+
+def refresh_edgar_index(db: Session) -> int:
+    """
+    Daily feed: load filings from the latest stored date_filed on. That
+    day is read again (the nightly form.idx may have grown since), known
+    rows are skipped by the insert.
+    """
+    today = datetime.utcnow().date()
+    latest = db.query(func.max(EdgarFiling.date_filed)).scalar()
+
+    if latest is None:
+        start = today - timedelta(days=92 * EDGAR_BACKFILL_QUARTERS)
+    else:
+        start = latest
+
+    added = 0
+
+    for year, quarter in _quarters_since(start, today):
+        filings, companies = [], {}
+
+        for form_type, company, cik, filed, filename in iter_form_index(year, quarter):
+            if latest is not None and filed < latest:
+                continue
+
+            filings.append({"cik": cik, "form_type": form_type, "date_filed": filed, "filename": filename})
+            companies[cik] = company
+
+            if len(filings) >= INSERT_BATCH_SIZE:
+                added += _write_batch(db, filings, companies)
+                filings, companies = [], {}
+
+        added += _write_batch(db, filings, companies)
+
+        time.sleep(EDGAR_REQUEST_PAUSE_SECONDS)
+
+    return added
+
+
+# =====================================================
+# LOCAL LOOKUP
+# =====================================================
+
+# Postgres narrows candidates with the trigram index, best first.
+#
+# The SQLite fallback (local development, tests) is DEGRADED: it has no
+# trigram index, so it keeps companies with a word starting with one of
+# the first FALLBACK_TOKENS core tokens of the query, ranked by how many
+# of those tokens they match, then by closest name length, then CIK. A
+# misspelled token selects nothing, and common words can still push the
+# right company past COMPANY_CANDIDATES.
+
+def _word_start_match(column, token: str):
+    # normalize() keeps "_", a LIKE wildcard
+    token = token.replace("_", "\\_")
+    return or_(
+        column.like(f"{token}%", escape="\\"),
+        column.like(f"% {token}%", escape="\\"),
+    )
+
+
+def _candidate_companies(db: Session, normalized: str):
+    query = db.query(EdgarCompany.cik, EdgarCompany.name, EdgarCompany.normalized_name)
+
+    if db.bind.dialect.name == "postgresql":
+        # Served by ix_edgar_companies_normalized_name_trgm. SET LOCAL:
+        # the threshold ends with the transaction, not the pooled connection
+        db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :limit, true)"),
+            {"limit": str(TRIGRAM_SIMILARITY)},
+        )
+        query = (
+            query.filter(EdgarCompany.normalized_name.op("%")(normalized))
+            .order_by(
+                func.similarity(EdgarCompany.normalized_name, normalized).desc(),
+                EdgarCompany.cik,
+            )
+        )
+    else:
+        tokens = list(dict.fromkeys(core_name(normalized).split()))[:FALLBACK_TOKENS]
+        matches = [_word_start_match(EdgarCompany.normalized_name, token) for token in tokens]
+        matched_tokens = sum(case((match, 1), else_=0) for match in matches)
+
+        query = (
+            query.filter(or_(*matches))
+            .order_by(
+                matched_tokens.desc(),
+                func.abs(func.length(EdgarCompany.normalized_name) - len(normalized)),
+                EdgarCompany.cik,
+            )
+        )
+
+    return query.limit(COMPANY_CANDIDATES).all()
+
+
+def match_edgar_companies(db: Session, name: str) -> list:
+    """[(cik, company name, score)] for EDGAR filers matching `name`."""
+    normalized = normalize(name)
+    if not normalized:
+        return []
+
+    target = core_name(normalized)
+    matches = []
+
+    for cik, company, company_normalized in _candidate_companies(db, normalized):
+        score = fuzz.token_sort_ratio(target, core_name(company_normalized))
+        if score >= COMPANY_MATCH_THRESHOLD:
+            matches.append((cik, company, score))
+
+    matches.sort(key=lambda m: -m[2])
+    return matches
+
+
+def search_local_filings(db: Session, name: str, days: int = FILING_LOOKBACK_DAYS,
+                         limit: int = FILING_RESULT_LIMIT) -> list:
+    matches = match_edgar_companies(db, name)
+    if not matches:
+        return []
+
+    companies = {cik: (company, score) for cik, company, score in matches}
+    since = datetime.utcnow().date() - timedelta(days=days)
+
+    rows = (
+        db.query(EdgarFiling)
+        .filter(
+            EdgarFiling.cik.in_(list(companies)),
+            EdgarFiling.date_filed >= since,
+        )
+        .order_by(EdgarFiling.date_filed.desc(), EdgarFiling.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+    return [
+        {
+            "title": f"{row.form_type} - {companies[row.cik][0]}",
+            "type": row.form_type,
+            "date": row.date_filed.isoformat(),
+            "url": EDGAR_ARCHIVES_URL + row.filename,
+            "summary": f"{companies[row.cik][0]} (CIK {row.cik})",
+            "cik": row.cik,
+            "match_score": companies[row.cik][1],
+        }
+        for row in rows
+    ]
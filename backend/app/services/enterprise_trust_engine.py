@@ -1,24 +1,13 @@
 from sqlalchemy.orm import Session
-from app.graph.graph_client import get_session
+from app.graph.graph_client import get_read_session
 from app.models import TrustModelConfig, TrustScoreHistory, GlobalEntity
+from app.graph.graph_snapshot import active_snapshot
+from app.graph.graph_analytics import trust_score
 import math
 
 
-def calculate_trust_score(entity_name: str, scenario: str, db: Session):
-
-    config = (
-        db.query(TrustModelConfig)
-        .filter(
-            TrustModelConfig.model_name == scenario,
-            TrustModelConfig.active == True
-        )
-        .first()
-    )
-
-    if not config:
-        raise Exception("Active trust model not configured")
-
-    with get_session() as session:
+def _live_trust_score(entity_name: str, config: TrustModelConfig):
+    with get_read_session() as session:
 
         result = session.run(
             f"""
@@ -74,6 +63,39 @@ def calculate_trust_score(entity_name: str, scenario: str, db: Session):
 
         final_score = min(round(total_risk * 20, 2), 100)
 
+    return final_score, explainability
+
+
+def calculate_trust_score(entity_name: str, scenario: str, db: Session):
+
+    config = (
+        db.query(TrustModelConfig)
+        .filter(
+            TrustModelConfig.model_name == scenario,
+            TrustModelConfig.active == True
+        )
+        .first()
+    )
+
+    if not config:
+        raise Exception("Active trust model not configured")
+
+    snapshot = active_snapshot()
+
+    if snapshot is not None:
+        offline = trust_score(
+            snapshot,
+            entity_name,
+            relationship_weights=config.relationship_weights,
+            depth_limit=config.depth_limit,
+            decay_factor=config.decay_factor,
+            sanction_boost=config.sanction_boost,
+        )
+        final_score = offline["score"]
+        explainability = offline["breakdown"]
+    else:
+        final_score, explainability = _live_trust_score(entity_name, config)
+
     # Persist history (audit)
     entity = (
         db.query(GlobalEntity)
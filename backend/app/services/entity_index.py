@@ -0,0 +1,248 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from sqlalchemy.orm import Session
+
+from app.core.normalization import core_name
+from app.models import GlobalEntity, GlobalEntityAlias
+
+
+# =====================================================
+# INDEX CONFIG
+# =====================================================
+
+INDEX_VERSION_KEY = "entity_index:version"
+
+VERSION_CHECK_SECONDS = 5
+FULL_RELOAD_SECONDS = 3600
+
+CANONICAL_CONFIDENCE = 1.0
+CORE_NAME_CONFIDENCE = 0.95
+ALIAS_CONFIDENCE = 0.9
+FUZZY_MAX_CONFIDENCE = 0.85
+
+FUZZY_MATCH_THRESHOLD = 92
+FUZZY_CANDIDATES = 25
+FUZZY_BATCH_ROWS = 64
+
+# Below this many unresolved names, score trigram-posting candidates per
+# name; a cdist pass costs a full scan of the index whatever the batch size
+CDIST_MIN_BATCH = 100
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# =====================================================
+# IN-MEMORY RESOLUTION INDEX
+# =====================================================
+
+class EntityResolutionIndex:
+    """
+    normalized name -> entity id, alias -> entity id, legal-suffix-free
+    core name -> entity id, plus a trigram fuzzy tier. Loaded once per
+    process and topped up from new rows when the shared version moves.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.by_name = {}
+        self.by_alias = {}
+        self.by_core = {}
+        self.core_of = {}
+        self.postings = defaultdict(set)
+
+        self.max_entity_id = 0
+        self.max_alias_id = 0
+        self.loaded = False
+        self.loaded_at = 0.0
+        self.version = None
+        self.checked_at = 0.0
+
+    # -------------------------------------------------
+    # Population
+    # -------------------------------------------------
+    def add_entity(self, entity_id: int, normalized_name: str):
+        with self._lock:
+            self.by_name.setdefault(normalized_name, entity_id)
+
+            core = core_name(normalized_name)
+            self.by_core.setdefault(core, entity_id)
+            self.core_of[entity_id] = core
+
+            for gram in _trigrams(core):
+                self.postings[gram].add(entity_id)
+
+            self.max_entity_id = max(self.max_entity_id, entity_id)
+
+    def add_alias(self, alias_id: int, entity_id: int, normalized_alias: str):
+        with self._lock:
+            self.by_alias.setdefault(normalized_alias, entity_id)
+            self.max_alias_id = max(self.max_alias_id, alias_id or 0)
+
+    def _load_new_rows(self, db: Session):
+        entities = (
+            db.query(GlobalEntity.id, GlobalEntity.normalized_name)
+            .filter(GlobalEntity.id > self.max_entity_id)
+            .yield_per(5000)
+        )
+        for entity_id, normalized_name in entities:
+            self.add_entity(entity_id, normalized_name)
+
+        aliases = (
+            db.query(GlobalEntityAlias.id, GlobalEntityAlias.entity_id, GlobalEntityAlias.normalized_alias)
+            .filter(GlobalEntityAlias.id > self.max_alias_id)
+            .yield_per(5000)
+        )
+        for alias_id, entity_id, normalized_alias in aliases:
+            self.add_alias(alias_id, entity_id, normalized_alias)
+
+    def refresh(self, db: Session):
+        """Full load on first use / hourly, then new rows on version change."""
+        now = time.monotonic()
+
+        with self._lock:
+            if self.loaded and now - self.checked_at < VERSION_CHECK_SECONDS:
+                return
+
+            self.checked_at = now
+            version = _current_version()
+
+            if not self.loaded or now - self.loaded_at >= FULL_RELOAD_SECONDS:
+                self._reset()
+                self.checked_at = now
+                self._load_new_rows(db)
+                self.loaded = True
+                self.loaded_at = now
+                self.version = version
+            elif version != self.version:
+                self._load_new_rows(db)
+                self.version = version
+
+    # -------------------------------------------------
+    # Lookup
+    # -------------------------------------------------
+    def lookup(self, normalized_name: str):
+        """(entity_id, confidence, method) or None."""
+        with self._lock:
+            if normalized_name in self.by_name:
+                return self.by_name[normalized_name], CANONICAL_CONFIDENCE, "CANONICAL"
+
+            if normalized_name in self.by_alias:
+                return self.by_alias[normalized_name], ALIAS_CONFIDENCE, "ALIAS"
+
+            core = core_name(normalized_name)
+            if core in self.by_core:
+                return self.by_core[core], CORE_NAME_CONFIDENCE, "CORE_NAME"
+
+            return self._fuzzy_lookup(core)
+
+    def _fuzzy_lookup(self, core: str):
+        grams = _trigrams(core)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+
+        best = None
+        for entity_id, _ in shared.most_common(FUZZY_CANDIDATES):
+            score = fuzz.ratio(core, self.core_of[entity_id])
+            if score >= FUZZY_MATCH_THRESHOLD and (best is None or score > best[1]):
+                best = (entity_id, score)
+
+        if not best:
+            return None
+
+        confidence = round(FUZZY_MAX_CONFIDENCE * best[1] / 100, 2)
+        return best[0], confidence, "FUZZY"
+
+    def match_many(self, normalized_names):
+        """
+        Core-name + fuzzy tiers for a batch of names. Small batches use the
+        trigram postings per name; bulk batches score every remaining name
+        against every entity with rapidfuzz.process.cdist.
+        Returns {normalized name: (entity_id, confidence, method)}.
+        """
+        results = {}
+        pending = []
+
+        with self._lock:
+            for name in normalized_names:
+                core = core_name(name)
+                if core in self.by_core:
+                    results[name] = (self.by_core[core], CORE_NAME_CONFIDENCE, "CORE_NAME")
+                else:
+                    pending.append((name, core))
+
+            if len(pending) < CDIST_MIN_BATCH:
+                for name, core in pending:
+                    match = self._fuzzy_lookup(core)
+                    if match:
+                        results[name] = match
+                return results
+
+            choice_ids = list(self.core_of)
+            choices = [self.core_of[entity_id] for entity_id in choice_ids]
+
+        if not choices:
+            return results
+
+        for start in range(0, len(pending), FUZZY_BATCH_ROWS):
+            chunk = pending[start:start + FUZZY_BATCH_ROWS]
+
+            scores = process.cdist(
+                [core for _, core in chunk],
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=FUZZY_MATCH_THRESHOLD,
+                dtype=np.float32,
+                workers=-1,
+            )
+            best = scores.argmax(axis=1)
+
+            for row, (name, _) in enumerate(chunk):
+                score = float(scores[row, best[row]])
+                if score >= FUZZY_MATCH_THRESHOLD:
+                    confidence = round(FUZZY_MAX_CONFIDENCE * score / 100, 2)
+                    results[name] = (choice_ids[best[row]], confidence, "FUZZY")
+
+        return results
+
+
+# =====================================================
+# CHANGE NOTIFICATIONS (SHARED VERSION COUNTER)
+# =====================================================
+
+def _current_version():
+    try:
+        from app.worker.celery_app import redis_client
+        return redis_client.get(INDEX_VERSION_KEY)
+    except Exception:
+        return None
+
+
+def notify_index_change():
+    """Tell other processes to pick up new entities / aliases."""
+    try:
+        from app.worker.celery_app import redis_client
+        redis_client.incr(INDEX_VERSION_KEY)
+    except Exception as e:
+        print(f"⚠️ Entity index change notification failed: {e}")
+
+
+# =====================================================
+# PROCESS-WIDE INSTANCE
+# =====================================================
+
+_index = EntityResolutionIndex()
+
+
+def get_entity_index(db: Session) -> EntityResolutionIndex:
+    _index.refresh(db)
+    return _index
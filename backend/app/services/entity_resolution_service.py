@@ -1,5 +1,6 @@
-import re
-from sqlalchemy.orm import Session
+import hashlib
+from collections import defaultdict
+from sqlalchemy.orm import Session, joinedload
 
 from app.models import (
     GlobalEntity,
@@ -8,19 +9,22 @@ from app.models import (
 )
 from app.graph.supplier_graph_service import (
     create_global_entity_node,
-    link_supplier_to_entity,
+    create_global_entity_nodes,
+    link_suppliers_to_entities,
+)
+from app.core.normalization import normalize, core_name
+from app.services.entity_index import (
+    CORE_NAME_CONFIDENCE,
+    ALIAS_CONFIDENCE,
+    get_entity_index,
+    notify_index_change,
 )
 
 
-# =====================================================
-# NORMALIZATION
-# =====================================================
+SQL_IN_CHUNK = 500
 
-def normalize(name: str) -> str:
-    name = name.lower().strip()
-    name = re.sub(r"[^\w\s]", "", name)
-    name = re.sub(r"\s+", " ", name)
-    return name
+# Bump when normalization / matching changes so existing links re-resolve
+RESOLVER_VERSION = "2"
 
 
 # =====================================================
@@ -36,7 +40,21 @@ def resolve_or_create_entity(
     normalized_name = normalize(name)
 
     # ---------------------------------------------
-    # 1️⃣ Canonical match
+    # 1️⃣ In-memory match (canonical → alias → core name → fuzzy)
+    # ---------------------------------------------
+    match = get_entity_index(db).lookup(normalized_name)
+
+    if match:
+        entity_id, confidence, _ = match
+        entity = db.get(GlobalEntity, entity_id)
+
+        # Graph node is MERGEd on creation and by link_supplier_to_entity
+        if entity:
+            return entity, confidence
+
+    # ---------------------------------------------
+    # 2️⃣ Exact re-check (another process may have created it
+    #    since this process last refreshed its index)
     # ---------------------------------------------
     entity = (
         db.query(GlobalEntity)
@@ -45,34 +63,9 @@ def resolve_or_create_entity(
     )
 
     if entity:
-        # Ensure graph node exists (idempotent MERGE)
-        create_global_entity_node(
-            canonical_name=entity.canonical_name,
-            entity_type=entity.entity_type,
-            country=entity.country,
-        )
+        get_entity_index(db).add_entity(entity.id, entity.normalized_name)
         return entity, 1.0
 
-    # ---------------------------------------------
-    # 2️⃣ Alias match
-    # ---------------------------------------------
-    alias = (
-        db.query(GlobalEntityAlias)
-        .filter(GlobalEntityAlias.normalized_alias == normalized_name)
-        .first()
-    )
-
-    if alias:
-        entity = alias.entity
-
-        # Ensure graph node exists
-        create_global_entity_node(
-            canonical_name=entity.canonical_name,
-            entity_type=entity.entity_type,
-            country=entity.country,
-        )
-        return entity, 0.9
-
     # ---------------------------------------------
     # 3️⃣ Create new canonical entity
     # ---------------------------------------------
@@ -87,6 +80,9 @@ def resolve_or_create_entity(
     db.commit()
     db.refresh(entity)
 
+    get_entity_index(db).add_entity(entity.id, entity.normalized_name)
+    notify_index_change()
+
     # Sync to Neo4j (MERGE = safe)
     create_global_entity_node(
         canonical_name=entity.canonical_name,
@@ -98,69 +94,257 @@ def resolve_or_create_entity(
 
 
 # =====================================================
-# RESOLVE SUPPLIER → ENTITY (STRICT 1:1 ENFORCED)
+# BULK RESOLUTION (ONE PASS, ONE COMMIT)
 # =====================================================
 
-def resolve_supplier_entity(supplier, db: Session):
+def _chunks(values: list, size: int = SQL_IN_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def resolve_entities_bulk(
+    items,
+    db: Session,
+    entity_type: str = "COMPANY",
+):
     """
-    Enforces:
-    - Each supplier resolves to exactly one canonical GlobalEntity
-    - SQL link always exists
-    - Graph RESOLVES_TO relationship always exists
-    - Idempotent (safe to call multiple times)
+    Resolve many raw names at once. `items` are names or dicts with
+    name / entity_type / country. Returns {raw name: (entity, confidence)}.
     """
+    requested = {}
+    raw_to_normalized = {}
 
-    entity, confidence = resolve_or_create_entity(
-        name=supplier.name,
-        db=db,
-        entity_type="COMPANY",
-        country=supplier.country,
-    )
+    for item in items:
+        if isinstance(item, str):
+            item = {"name": item}
 
-    # ---------------------------------------------
-    # Ensure exactly ONE link per supplier
-    # ---------------------------------------------
-    existing_links = (
-        db.query(SupplierEntityLink)
-        .filter(SupplierEntityLink.supplier_id == supplier.id)
-        .all()
-    )
+        raw = (item.get("name") or "").strip()
+        normalized = normalize(raw) if raw else ""
+        if not normalized:
+            continue
 
-    # Remove incorrect links (hard enforcement of 1:1)
-    for link in existing_links:
-        if link.entity_id != entity.id:
-            db.delete(link)
+        raw_to_normalized[item["name"]] = normalized
+        requested.setdefault(
+            normalized,
+            (raw, item.get("entity_type") or entity_type, item.get("country")),
+        )
 
-    db.commit()
+    matches = {}
+    names = list(requested)
 
-    # Check correct link exists
-    correct_link = (
-        db.query(SupplierEntityLink)
-        .filter(
-            SupplierEntityLink.supplier_id == supplier.id,
-            SupplierEntityLink.entity_id == entity.id,
+    # ---------------------------------------------
+    # 1️⃣ Canonical matches (set-based)
+    # ---------------------------------------------
+    for chunk in _chunks(names):
+        rows = (
+            db.query(GlobalEntity.id, GlobalEntity.normalized_name)
+            .filter(GlobalEntity.normalized_name.in_(chunk))
         )
-        .first()
-    )
+        for entity_id, normalized_name in rows:
+            matches.setdefault(normalized_name, (entity_id, 1.0))
 
-    if not correct_link:
-        new_link = SupplierEntityLink(
-            supplier_id=supplier.id,
-            entity_id=entity.id,
-            confidence_score=confidence,
-            resolution_method="AUTO",
+    # ---------------------------------------------
+    # 2️⃣ Alias matches (set-based)
+    # ---------------------------------------------
+    remaining = [name for name in names if name not in matches]
+    for chunk in _chunks(remaining):
+        rows = (
+            db.query(GlobalEntityAlias.entity_id, GlobalEntityAlias.normalized_alias)
+            .filter(GlobalEntityAlias.normalized_alias.in_(chunk))
         )
-        db.add(new_link)
+        for entity_id, normalized_alias in rows:
+            matches.setdefault(normalized_alias, (entity_id, ALIAS_CONFIDENCE))
+
+    # ---------------------------------------------
+    # 3️⃣ Core name + vectorized fuzzy matches
+    # ---------------------------------------------
+    index = get_entity_index(db)
+    remaining = [name for name in names if name not in matches]
+
+    for name, (entity_id, confidence, _) in index.match_many(remaining).items():
+        matches[name] = (entity_id, confidence)
+
+    # ---------------------------------------------
+    # 4️⃣ Create the rest (one entity per core name)
+    # ---------------------------------------------
+    remaining = [name for name in names if name not in matches]
+
+    primary_by_core = {}
+    for name in remaining:
+        primary_by_core.setdefault(core_name(name), name)
+
+    new_entities = []
+    for name in primary_by_core.values():
+        raw, name_type, country = requested[name]
+        new_entities.append(GlobalEntity(
+            canonical_name=raw,
+            normalized_name=name,
+            entity_type=name_type,
+            country=country,
+        ))
+
+    if new_entities:
+        db.add_all(new_entities)
+        db.flush()
+
+        created = {
+            entity.normalized_name: (entity.id, entity.canonical_name, entity.entity_type, entity.country)
+            for entity in new_entities
+        }
         db.commit()
 
+        for normalized_name, (entity_id, *_rest) in created.items():
+            index.add_entity(entity_id, normalized_name)
+        notify_index_change()
+
+        create_global_entity_nodes([
+            {"canonical_name": canonical, "entity_type": etype, "country": country}
+            for _, canonical, etype, country in created.values()
+        ])
+
+        for name in remaining:
+            primary = primary_by_core[core_name(name)]
+            confidence = 1.0 if name == primary else CORE_NAME_CONFIDENCE
+            matches[name] = (created[primary][0], confidence)
+
     # ---------------------------------------------
-    # Always sync graph relationship (MERGE safe)
+    # Load resolved entities in one query per chunk
     # ---------------------------------------------
-    link_supplier_to_entity(
-        supplier_name=supplier.name,
-        canonical_name=entity.canonical_name,
-        confidence_score=confidence,
-        resolution_method="AUTO",
+    entities = {}
+    for chunk in _chunks(list({entity_id for entity_id, _ in matches.values()})):
+        for entity in db.query(GlobalEntity).filter(GlobalEntity.id.in_(chunk)):
+            entities[entity.id] = entity
+
+    resolved = {}
+    for raw, normalized in raw_to_normalized.items():
+        entity_id, confidence = matches.get(normalized, (None, None))
+        if entity_id in entities:
+            resolved[raw] = (entities[entity_id], confidence)
+
+    return resolved
+
+
+# =====================================================
+# RESOLVE SUPPLIERS → ENTITIES (STRICT 1:1 ENFORCED)
+# =====================================================
+
+def resolution_fingerprint(name: str, country: str = None) -> str:
+    """What a supplier's link was resolved from; changes force a relink."""
+    key = f"{normalize(name)}|{(country or '').strip().lower()}|{RESOLVER_VERSION}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def resolve_supplier_entities_bulk(suppliers: list, db: Session, resolution_method: str = "AUTO"):
+    """
+    Bulk form of resolve_supplier_entity: one read of the existing links,
+    then one resolution pass and batched RESOLVES_TO writes for the
+    suppliers whose fingerprint changed.
+
+    Links are committed without a fingerprint; it is only written once the
+    graph sync has succeeded, so a failed sync leaves them stale and the
+    next call re-resolves and re-links them.
+    Returns {supplier id: entity}.
+    """
+    # Plain tuples: the commits below expire the ORM objects
+    rows = [(s.id, s.name, s.country) for s in suppliers]
+
+    existing_links = defaultdict(list)
+    for chunk in _chunks([supplier_id for supplier_id, _, _ in rows]):
+        links = (
+            db.query(SupplierEntityLink)
+            .options(joinedload(SupplierEntityLink.entity))
+            .filter(SupplierEntityLink.supplier_id.in_(chunk))
+        )
+        for link in links:
+            existing_links[link.supplier_id].append((link, link.entity_id))
+
+    # ---------------------------------------------
+    # Fast path: nothing changed since the last resolution
+    # ---------------------------------------------
+    result = {}
+    stale = []
+
+    for supplier_id, name, country in rows:
+        fingerprint = resolution_fingerprint(name, country)
+        links = existing_links[supplier_id]
+
+        if len(links) == 1 and links[0][0].resolution_fingerprint == fingerprint:
+            result[supplier_id] = links[0][0].entity
+        else:
+            stale.append((supplier_id, name, country, fingerprint))
+
+    if not stale:
+        return result
+
+    # ---------------------------------------------
+    # Re-resolve changed / new suppliers
+    # ---------------------------------------------
+    resolved = resolve_entities_bulk(
+        [{"name": name, "entity_type": "COMPANY", "country": country} for _, name, country, _ in stale],
+        db,
     )
 
-    return entity
\ No newline at end of file
+    graph_rows = []
+    pending_links = []
+
+    for supplier_id, name, _, fingerprint in stale:
+        if name not in resolved:
+            continue
+
+        entity, confidence = resolved[name]
+        link_to_keep = None
+
+        # Remove incorrect links (hard enforcement of 1:1)
+        for link, entity_id in existing_links[supplier_id]:
+            if entity_id != entity.id or link_to_keep is not None:
+                db.delete(link)
+            else:
+                link_to_keep = link
+
+        if link_to_keep is None:
+            link_to_keep = SupplierEntityLink(
+                supplier_id=supplier_id,
+                entity_id=entity.id,
+                confidence_score=confidence,
+                resolution_method=resolution_method,
+            )
+            db.add(link_to_keep)
+
+        # Pending until RESOLVES_TO is written
+        link_to_keep.resolution_fingerprint = None
+        pending_links.append((link_to_keep, fingerprint))
+
+        graph_rows.append({
+            "supplier_name": name,
+            "canonical_name": entity.canonical_name,
+            "confidence_score": confidence,
+            "resolution_method": resolution_method,
+        })
+        result[supplier_id] = entity
+
+    db.flush()
+    fingerprints = [
+        {"id": link.id, "resolution_fingerprint": fingerprint}
+        for link, fingerprint in pending_links
+    ]
+    db.commit()
+
+    # Sync graph relationships of relinked suppliers only (MERGE safe)
+    link_suppliers_to_entities(graph_rows)
+
+    db.bulk_update_mappings(SupplierEntityLink, fingerprints)
+    db.commit()
+
+    return result
+
+
+def resolve_supplier_entity(supplier, db: Session):
+    """
+    Enforces:
+    - Each supplier resolves to exactly one canonical GlobalEntity
+    - SQL link always exists
+    - Graph RESOLVES_TO relationship always exists
+    - Idempotent (safe to call multiple times)
+    - Unchanged suppliers cost one indexed read (fingerprint match)
+    """
+    return resolve_supplier_entities_bulk([supplier], db).get(supplier.id)
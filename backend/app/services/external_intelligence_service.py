@@ -3,7 +3,10 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from rapidfuzz import fuzz
 
+from app.core.normalization import normalize
 from app.models import GlobalEntity, SanctionedEntity, CoveredEntity
+from app.services.entity_index import notify_index_change
+from app.services.news_service import news_risk_score
 
 
 OFAC_SDN_URL = "https://www.treasury.gov/ofac/downloads/sdn.csv"
@@ -13,10 +16,6 @@ BIS_ENTITY_LIST_URL = "https://www.bis.doc.gov/index.php/documents/consolidated-
 MATCH_THRESHOLD = 88
 
 
-def normalize(text: str) -> str:
-    return text.lower().replace(",", "").replace(".", "").strip()
-
-
 # =====================================================
 # OFAC LIVE INGESTION
 # =====================================================
@@ -62,6 +61,7 @@ def refresh_ofac_data(db: Session):
             added_count += 1
 
     db.commit()
+    notify_index_change()
     return added_count
 
 
@@ -104,38 +104,21 @@ def refresh_bis_entity_list(db: Session):
             db.add(covered)
 
     db.commit()
+    notify_index_change()
 
 
 # =====================================================
 # NEWS RISK SIGNAL
 # =====================================================
-def news_risk_signal(supplier_name: str):
+def news_risk_signal(supplier_id: int, db: Session):
+    """
+    Negative-media score from the local news store (no API call on the
+    request path, no watch-list enrollment). Runs in a savepoint so a
+    failed read never rolls back the caller's transaction.
+    """
     try:
-        response = requests.get(
-            "https://newsapi.org/v2/everything",
-            params={
-                "q": supplier_name,
-                "sortBy": "publishedAt",
-                "pageSize": 5,
-                "apiKey": "YOUR_NEWSAPI_KEY",
-            },
-            timeout=10,
-        )
-
-        data = response.json()
-
-        risk_keywords = ["fraud", "sanction", "corruption", "bribery"]
-
-        score = 0
-
-        for article in data.get("articles", []):
-            text = (article.get("title", "") + " " + article.get("description", "")).lower()
-
-            for word in risk_keywords:
-                if word in text:
-                    score += 10
-
-        return min(score, 30)
-
-    except Exception:
+        with db.begin_nested():
+            return news_risk_score(db, supplier_id)
+    except Exception as e:
+        print(f"⚠️ News risk signal failed: {e}")
         return 0
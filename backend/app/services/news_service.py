@@ -0,0 +1,291 @@
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.keyword_scanner import get_risk_scanner
+from app.models import NewsArticle, Supplier, SupplierNewsState
+
+
+# =====================================================
+# NEWS INGESTION CONFIG
+# =====================================================
+# GNews free tier: 100 requests/day, 10 articles per request. The
+# scheduler spends that budget on watched suppliers (stalest first);
+# assessments and profile views only ever read the local store, and only
+# profile views add a supplier to the watch list.
+
+GNEWS_API_KEY = os.getenv("GNEWS_API_KEY", "")
+GNEWS_SEARCH_URL = "https://gnews.io/api/v4/search"
+GNEWS_MAX_ARTICLES = 10
+
+# Hourly job x 4 requests = 96 requests/day
+NEWS_REQUESTS_PER_RUN = int(os.getenv("NEWS_REQUESTS_PER_RUN", "4"))
+
+# First fetch for a newly watched supplier looks back this far
+NEWS_BACKFILL_DAYS = 365
+
+# news_risk_signal: most recent N stored articles, capped score.
+# An article scores NEWS_KEYWORD_POINTS per unit of keyword weight.
+NEWS_SIGNAL_ARTICLES = 5
+NEWS_SIGNAL_MAX_SCORE = 30
+NEWS_KEYWORD_POINTS = 10
+
+GNEWS_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _annotate(text: str):
+    """(distinct risk keywords, weighted score) from one scanner pass."""
+    hits = get_risk_scanner().scan(text)
+    weights = {hit.keyword: hit.weight for hit in hits}
+    return list(weights), round(sum(weights.values()) * NEWS_KEYWORD_POINTS)
+
+
+def _parse_published(value):
+    try:
+        return datetime.strptime(value, GNEWS_DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+# =====================================================
+# WATCH LIST
+# =====================================================
+
+def watch_supplier(db: Session, supplier_id: int):
+    """
+    Queue a supplier for news ingestion (no-op if already watched). Only
+    flushed, inside a savepoint: the caller's transaction commits it.
+    """
+    if db.get(SupplierNewsState, supplier_id) is not None:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(SupplierNewsState(supplier_id=supplier_id))
+    except IntegrityError:
+        # Watched concurrently by another request
+        pass
+
+
+def _due_suppliers(db: Session, limit: int):
+    """Never-checked suppliers first, then the longest since their last fetch."""
+    return (
+        db.query(SupplierNewsState, Supplier.name)
+        .join(Supplier, Supplier.id == SupplierNewsState.supplier_id)
+        .order_by(
+            SupplierNewsState.last_checked_at.is_(None).desc(),
+            SupplierNewsState.last_checked_at.asc(),
+        )
+        .limit(limit)
+        .all()
+    )
+
+
+# =====================================================
+# INCREMENTAL FETCH
+# =====================================================
+
+def _fetch_articles(name: str, since: datetime, until: datetime | None = None):
+    """Newest-first page of at most GNEWS_MAX_ARTICLES; None if the call failed."""
+    from app.services.public_data_service import _safe_get
+
+    params = {
+        "q": f'"{name}"',
+        "lang": "en",
+        "max": str(GNEWS_MAX_ARTICLES),
+        "sortby": "publishedAt",
+        "from": since.strftime(GNEWS_DATE_FORMAT),
+        "apikey": GNEWS_API_KEY,
+    }
+    if until is not None:
+        params["to"] = until.strftime(GNEWS_DATE_FORMAT)
+
+    resp = _safe_get(GNEWS_SEARCH_URL, params=params, timeout=15)
+
+    if not resp:
+        return None
+
+    try:
+        return resp.json().get("articles", [])
+    except Exception:
+        return None
+
+
+def _store_articles(db: Session, state: SupplierNewsState, articles: list) -> int:
+    urls = [a.get("url") for a in articles if a.get("url")]
+    if not urls:
+        return 0
+
+    existing = {
+        url for (url,) in db.query(NewsArticle.url).filter(
+            NewsArticle.supplier_id == state.supplier_id,
+            NewsArticle.url.in_(urls),
+        )
+    }
+
+    added = 0
+
+    for article in articles:
+        url = article.get("url")
+        if not url or url in existing:
+            continue
+        existing.add(url)
+
+        title = article.get("title") or ""
+        description = article.get("description") or ""
+        keywords, risk_score = _annotate(f"{title} {description}")
+
+        db.add(NewsArticle(
+            supplier_id=state.supplier_id,
+            url=url,
+            title=title,
+            description=description[:300],
+            source_name=(article.get("source") or {}).get("name", "Unknown"),
+            image=article.get("image", ""),
+            published_at=_parse_published(article.get("publishedAt")),
+            risk_keywords=keywords,
+            risk_score=risk_score,
+        ))
+        added += 1
+
+    db.flush()
+    return added
+
+
+def _stored_range(db: Session, state: SupplierNewsState):
+    """(oldest, newest) published_at stored past the cursor."""
+    query = db.query(func.min(NewsArticle.published_at), func.max(NewsArticle.published_at)).filter(
+        NewsArticle.supplier_id == state.supplier_id,
+        NewsArticle.published_at.isnot(None),
+    )
+    if state.last_published_at is not None:
+        query = query.filter(NewsArticle.published_at > state.last_published_at)
+    return query.one()
+
+
+# GNews returns the newest page of a window first. The cursor only moves
+# once the window back to it has been read completely: a full page means
+# older articles may remain, so the next request (this run or a later
+# one) asks again with `to` set to the oldest article stored so far.
+
+def _fetch_next_page(db: Session, state: SupplierNewsState, name: str, now: datetime):
+    """One GNews request for a supplier: (articles added, more pages pending)."""
+    if state.last_published_at:
+        since = state.last_published_at + timedelta(seconds=1)
+    else:
+        since = now - timedelta(days=NEWS_BACKFILL_DAYS)
+
+    until, _ = _stored_range(db, state)
+    articles = _fetch_articles(name, since, until)
+
+    if articles is None:
+        # Failed call: keep the cursor, retry on a later run
+        return 0, False
+
+    added = _store_articles(db, state, articles)
+
+    # A full page of nothing new cannot move `to` any further back
+    pending = len(articles) >= GNEWS_MAX_ARTICLES and added > 0
+
+    if not pending:
+        _, newest = _stored_range(db, state)
+        if newest is not None:
+            state.last_published_at = newest
+
+    return added, pending
+
+
+def ingest_watched_news(db: Session) -> int:
+    """
+    Scheduler feed: NEWS_REQUESTS_PER_RUN GNews requests spread over the
+    due suppliers, paging back through a supplier's full pages first.
+    """
+    if not GNEWS_API_KEY:
+        return 0
+
+    now = datetime.utcnow()
+    budget = NEWS_REQUESTS_PER_RUN
+    added = 0
+
+    for state, name in _due_suppliers(db, NEWS_REQUESTS_PER_RUN):
+        if budget <= 0:
+            break
+
+        pending = True
+        while pending and budget > 0:
+            page_added, pending = _fetch_next_page(db, state, name, now)
+            added += page_added
+            budget -= 1
+
+        state.last_checked_at = now
+        db.commit()
+
+    return added
+
+
+# =====================================================
+# LOCAL READS (REQUEST PATH)
+# =====================================================
+
+def news_risk_score(db: Session, supplier_id: int) -> int:
+    scores = (
+        db.query(NewsArticle.risk_score)
+        .filter(NewsArticle.supplier_id == supplier_id)
+        .order_by(NewsArticle.published_at.desc().nullslast())
+        .limit(NEWS_SIGNAL_ARTICLES)
+        .all()
+    )
+    return min(sum(score or 0 for (score,) in scores), NEWS_SIGNAL_MAX_SCORE)
+
+
+def recent_news(db: Session, supplier_id: int, months: int = 12) -> dict:
+    """Stored articles in the window, in the search_recent_news response shape."""
+    since = datetime.utcnow() - timedelta(days=months * 30)
+
+    state = db.get(SupplierNewsState, supplier_id)
+    rows = (
+        db.query(NewsArticle)
+        .filter(
+            NewsArticle.supplier_id == supplier_id,
+            NewsArticle.published_at >= since,
+        )
+        .order_by(NewsArticle.published_at.desc())
+        .all()
+    )
+
+    articles = [
+        {
+            "title": row.title,
+            "description": row.description or "",
+            "source": row.source_name,
+            "url": row.url,
+            "published_at": row.published_at.strftime(GNEWS_DATE_FORMAT) if row.published_at else "",
+            "image": row.image or "",
+            "risk_relevant": bool(row.risk_keywords),
+            "risk_keywords": row.risk_keywords or [],
+        }
+        for row in rows
+    ]
+
+    result = {
+        "available": len(articles) > 0,
+        "total_articles": len(articles),
+        "risk_relevant_count": sum(1 for a in articles if a["risk_relevant"]),
+        "articles": articles,
+        "source": "GNews",
+        "time_window_months": months,
+        "checked_at": (
+            state.last_checked_at.isoformat()
+            if state and state.last_checked_at else datetime.utcnow().isoformat()
+        ),
+    }
+
+    if not GNEWS_API_KEY:
+        result["reason"] = "GNEWS_API_KEY not configured"
+    elif state is None or state.last_checked_at is None:
+        result["reason"] = "News ingestion pending for this supplier"
+
+    return result
@@ -3,32 +3,40 @@ Public Data Aggregation Service
 ================================
 Aggregates freely available public data for supplier due diligence:
   1. Sanctions & Watchlists  (OFAC SDN, BIS Entity List, EU Consolidated)
-  2. Trade / Import Records  (US Census Foreign Trade)
-  3. Corporate Filings       (SEC EDGAR full-text search)
+  2. Trade / Import Records  (US Census Foreign Trade, stored locally)
+  3. Corporate Filings       (SEC EDGAR quarterly index, stored locally)
   4. Recent News             (GNews free tier)
 """
 
 import os
 import csv
+import hashlib
+import json
 import io
+import time
+import threading
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
+from urllib.parse import quote_plus
 import requests
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-# ─── Config ───────────────────────────────────────────
+from sqlalchemy.orm import Session
 
-GNEWS_API_KEY = os.getenv("GNEWS_API_KEY", "")
-SEC_EDGAR_UA = os.getenv("SEC_EDGAR_USER_AGENT", "VDashboard admin@example.com")
+from app.core.normalization import normalize
+from app.services.edgar_service import search_local_filings
+from app.services.news_service import recent_news, watch_supplier
+from app.services.trade_stats_service import trade_stats_version, trade_window
 
-MATCH_THRESHOLD = 82  # fuzzy-match cutoff for sanctions screening
+# ─── Config ───────────────────────────────────────────
 
-# ─── Helpers ──────────────────────────────────────────
+MATCH_THRESHOLD = 82  # fuzzy-match cutoff for sanctions screening
 
-def _normalize(text: str) -> str:
-    return text.lower().replace(",", "").replace(".", "").replace("-", "").strip()
+# Parsed sanctions lists are kept in-process this long
+SANCTIONS_LIST_TTL_SECONDS = int(os.getenv("SANCTIONS_LIST_TTL_SECONDS", "21600"))
 
+# ─── Helpers ──────────────────────────────────────────
 
 def _safe_get(url: str, headers: dict | None = None, params: dict | None = None,
               timeout: int = 20) -> requests.Response | None:
@@ -57,94 +65,197 @@ _EU_SANCTIONS_URL = (
 )
 
 
-def _screen_ofac(name: str) -> list[dict]:
-    """Download OFAC SDN CSV and fuzzy-match against supplier name."""
-    hits: list[dict] = []
+# ─── Parsed list cache (names normalized once per download) ───
+
+_list_cache: dict = {}
+_list_lock = threading.Lock()
+
+# public_data:sanctions_version:{list} -> content digest of the last
+# download by any process, so the snapshot version is a Redis read
+LIST_VERSION_KEY_PREFIX = "public_data:sanctions_version"
+
+
+def _list_version_key(key: str) -> str:
+    return f"{LIST_VERSION_KEY_PREFIX}:{key}"
+
+
+def _publish_list_digest(key: str, digest: str):
+    try:
+        from app.worker.celery_app import redis_client
+        redis_client.setex(_list_version_key(key), SANCTIONS_LIST_TTL_SECONDS, digest)
+    except Exception as e:
+        print(f"⚠️ Sanctions list version publish failed ({key}): {e}")
+
+
+def _cached_list(key: str, loader):
+    """
+    (entries, normalized names) for a sanctions list. Re-downloaded every
+    SANCTIONS_LIST_TTL_SECONDS; a failed download keeps the stale copy.
+    """
+    with _list_lock:
+        cached = _list_cache.get(key)
+        if cached and time.monotonic() - cached[0] < SANCTIONS_LIST_TTL_SECONDS:
+            return cached[1], cached[2]
+
+        entries = loader()
+        if entries is None:
+            return (cached[1], cached[2]) if cached else ([], [])
+
+        names = [entry["normalized"] for entry in entries]
+        digest = hashlib.sha1("\n".join(names).encode("utf-8")).hexdigest()[:12]
+        _list_cache[key] = (time.monotonic(), entries, names, digest)
+        _publish_list_digest(key, digest)
+        return entries, names
+
+
+def sanctions_snapshot_version() -> str:
+    """
+    Content digest of the OFAC/BIS/EU lists (same data -> same version).
+    Read from Redis; a list is only downloaded here when no process has
+    published its digest within SANCTIONS_LIST_TTL_SECONDS.
+    """
+    lists = (("ofac", _load_ofac), ("bis", _load_bis), ("eu", _load_eu))
+
+    try:
+        from app.worker.celery_app import redis_client
+        published = redis_client.mget([_list_version_key(key) for key, _ in lists])
+    except Exception as e:
+        print(f"⚠️ Sanctions list version read failed: {e}")
+        published = [None] * len(lists)
+
+    digests = []
+    for (key, loader), digest in zip(lists, published):
+        if digest is None:
+            _cached_list(key, loader)
+            cached = _list_cache.get(key)
+            digest = cached[3] if cached else "none"
+        digests.append(digest)
+    return "-".join(digests)
+
+
+def _fuzzy_hits(name: str, key: str, loader):
+    """(entry, score) for every list entry at or above MATCH_THRESHOLD."""
+    entries, names = _cached_list(key, loader)
+    if not names:
+        return []
+
+    matches = process.extract(
+        normalize(name),
+        names,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=MATCH_THRESHOLD,
+        limit=None,
+    )
+    return [(entries[index], score) for _, score, index in matches]
+
+
+def _load_ofac() -> list[dict] | None:
     resp = _safe_get(_OFAC_SDN_URL, timeout=30)
     if not resp:
-        return hits
-
-    norm = _normalize(name)
-    reader = csv.reader(io.StringIO(resp.text))
+        return None
 
-    for row in reader:
+    entries = []
+    for row in csv.reader(io.StringIO(resp.text)):
         if len(row) < 2:
             continue
         sdn_name = row[1].strip()
         if not sdn_name:
             continue
-        score = fuzz.token_set_ratio(norm, _normalize(sdn_name))
-        if score >= MATCH_THRESHOLD:
-            hits.append({
-                "list": "OFAC SDN",
-                "matched_name": sdn_name,
-                "match_score": score,
-                "sdn_type": row[2].strip() if len(row) > 2 else "",
-                "program": row[3].strip() if len(row) > 3 else "",
-                "reference_url": "https://sanctionssearch.ofac.treas.gov/",
-            })
-    return hits
+        entries.append({
+            "name": sdn_name,
+            "normalized": normalize(sdn_name),
+            "sdn_type": row[2].strip() if len(row) > 2 else "",
+            "program": row[3].strip() if len(row) > 3 else "",
+        })
+    return entries
 
 
-def _screen_bis(name: str) -> list[dict]:
-    """Download BIS Entity List CSV and fuzzy-match."""
-    hits: list[dict] = []
+def _load_bis() -> list[dict] | None:
     resp = _safe_get(_BIS_ENTITY_URL, timeout=30)
     if not resp:
-        return hits
+        return None
 
-    norm = _normalize(name)
     reader = csv.reader(io.StringIO(resp.text))
     header = next(reader, None)
 
+    entries = []
     for row in reader:
         if not row:
             continue
         entity_name = row[0].strip()
         if not entity_name:
             continue
-        score = fuzz.token_set_ratio(norm, _normalize(entity_name))
-        if score >= MATCH_THRESHOLD:
-            hits.append({
-                "list": "BIS Entity List",
-                "matched_name": entity_name,
-                "match_score": score,
-                "country": row[1].strip() if len(row) > 1 else "",
-                "license_requirement": row[2].strip() if len(row) > 2 else "",
-                "reference_url": "https://www.bis.doc.gov/index.php/the-denied-persons-list",
-            })
-    return hits
+        entries.append({
+            "name": entity_name,
+            "normalized": normalize(entity_name),
+            "country": row[1].strip() if len(row) > 1 else "",
+            "license_requirement": row[2].strip() if len(row) > 2 else "",
+        })
+    return entries
 
 
-def _screen_eu(name: str) -> list[dict]:
-    """Download EU Consolidated Sanctions XML and fuzzy-match."""
-    hits: list[dict] = []
+def _load_eu() -> list[dict] | None:
     resp = _safe_get(_EU_SANCTIONS_URL, timeout=30)
     if not resp:
-        return hits
+        return None
 
-    norm = _normalize(name)
+    entries = []
     try:
         root = ET.fromstring(resp.content)
-        # EU XML namespace
-        ns = {"eu": "http://eu.europa.ec/fpi/fsd/export"}
         for entity in root.iter():
             if entity.tag.endswith("nameAlias") or entity.tag.endswith("wholeName"):
                 eu_name = entity.text or entity.get("wholeName", "")
                 if not eu_name:
                     continue
-                score = fuzz.token_set_ratio(norm, _normalize(eu_name))
-                if score >= MATCH_THRESHOLD:
-                    hits.append({
-                        "list": "EU Consolidated Sanctions",
-                        "matched_name": eu_name,
-                        "match_score": score,
-                        "reference_url": "https://data.europa.eu/data/datasets/consolidated-list-of-persons-groups-and-entities-subject-to-eu-financial-sanctions",
-                    })
+                entries.append({"name": eu_name, "normalized": normalize(eu_name)})
     except ET.ParseError:
         print("⚠️  Failed to parse EU sanctions XML")
+        return None
+
+    return entries
+
+
+def _screen_ofac(name: str) -> list[dict]:
+    """Fuzzy-match supplier name against the OFAC SDN list."""
+    return [
+        {
+            "list": "OFAC SDN",
+            "matched_name": entry["name"],
+            "match_score": score,
+            "sdn_type": entry["sdn_type"],
+            "program": entry["program"],
+            "reference_url": "https://sanctionssearch.ofac.treas.gov/",
+        }
+        for entry, score in _fuzzy_hits(name, "ofac", _load_ofac)
+    ]
+
+
+def _screen_bis(name: str) -> list[dict]:
+    """Fuzzy-match against the BIS Entity List."""
+    return [
+        {
+            "list": "BIS Entity List",
+            "matched_name": entry["name"],
+            "match_score": score,
+            "country": entry["country"],
+            "license_requirement": entry["license_requirement"],
+            "reference_url": "https://www.bis.doc.gov/index.php/the-denied-persons-list",
+        }
+        for entry, score in _fuzzy_hits(name, "bis", _load_bis)
+    ]
 
-    return hits
+
+def _screen_eu(name: str) -> list[dict]:
+    """Fuzzy-match against the EU Consolidated Sanctions list."""
+    return [
+        {
+            "list": "EU Consolidated Sanctions",
+            "matched_name": entry["name"],
+            "match_score": score,
+            "reference_url": "https://data.europa.eu/data/datasets/consolidated-list-of-persons-groups-and-entities-subject-to-eu-financial-sanctions",
+        }
+        for entry, score in _fuzzy_hits(name, "eu", _load_eu)
+    ]
 
 
 def check_sanctions_lists(name: str, country: str = "") -> dict:
@@ -172,18 +283,12 @@ def check_sanctions_lists(name: str, country: str = "") -> dict:
 # 2.  TRADE / IMPORT RECORDS
 # =====================================================
 
-_CENSUS_TRADE_URL = "https://api.census.gov/data/timeseries/intltrade/imports/hs"
-
-
-def search_trade_records(name: str, country: str = "") -> dict:
+def search_trade_records(name: str, country: str, db: Session, months: int = 12) -> dict:
     """
-    Query US Census International Trade data for import records.
-    Falls back to summary-level data if detailed data is unavailable.
+    Country-level US import statistics (HS2, monthly) from the local
+    trade_stats table, over the latest `months` published months.
     """
-    records: list[dict] = []
-
-    # US Census trade API is free, no key required
-    # We search by country HS-level imports as a proxy signal
+    # Census data is per country; the supplier name is not a filter
     if not country:
         return {
             "available": False,
@@ -193,37 +298,15 @@ def search_trade_records(name: str, country: str = "") -> dict:
             "checked_at": datetime.utcnow().isoformat(),
         }
 
-    # Map common country names to 2-letter ISO codes for Census API
-    country_upper = country.upper().strip()
-    
-    params = {
-        "get": "CTY_NAME,GEN_VAL_MO,CON_VAL_MO",
-        "time": "2024",
-        "CTY_NAME": country_upper,
-    }
-
-    resp = _safe_get(_CENSUS_TRADE_URL, params=params, timeout=15)
-
-    if resp:
-        try:
-            data = resp.json()
-            if isinstance(data, list) and len(data) > 1:
-                headers = data[0]
-                for row in data[1:6]:  # limit to 5 records
-                    record = dict(zip(headers, row))
-                    records.append({
-                        "country": record.get("CTY_NAME", ""),
-                        "general_value": record.get("GEN_VAL_MO", ""),
-                        "consumption_value": record.get("CON_VAL_MO", ""),
-                        "period": record.get("time", ""),
-                    })
-        except Exception:
-            pass
+    window = trade_window(db, country, months)
 
     return {
-        "available": len(records) > 0,
-        "total_records": len(records),
-        "records": records,
+        "available": len(window["monthly"]) > 0,
+        "total_records": len(window["monthly"]),
+        "records": window["monthly"],
+        "top_hs_chapters": window["top_chapters"],
+        "period_start": window["start_period"],
+        "period_end": window["end_period"],
         "source": "US Census Bureau International Trade",
         "reference_url": "https://www.census.gov/foreign-trade/data/index.html",
         "checked_at": datetime.utcnow().isoformat(),
@@ -234,98 +317,26 @@ def search_trade_records(name: str, country: str = "") -> dict:
 # 3.  CORPORATE FILINGS (SEC EDGAR)
 # =====================================================
 
-_SEC_EFTS_URL = "https://efts.sec.gov/LATEST/search-index"
-_SEC_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
-_SEC_COMPANY_URL = "https://www.sec.gov/cgi-bin/browse-edgar"
-_SEC_FULLTEXT_URL = "https://efts.sec.gov/LATEST/search-index"
+def _edgar_company_search_url(name: str) -> str:
+    return (
+        f"https://www.sec.gov/cgi-bin/browse-edgar?company={quote_plus(name)}"
+        "&CIK=&type=&dateb=&owner=include&count=40&search_text=&action=getcompany"
+    )
 
 
-def search_corporate_filings(name: str) -> dict:
+def search_corporate_filings(name: str, db: Session) -> dict:
     """
-    Search SEC EDGAR for corporate filings mentioning the supplier.
-    Uses the free EDGAR full-text search API.
+    Recent SEC filings of EDGAR filers matching the supplier, from the
+    local index (edgar_service, refreshed daily from form.idx).
     """
-    filings: list[dict] = []
-
-    # EDGAR full-text search API (EFTS)
-    search_url = "https://efts.sec.gov/LATEST/search-index"
-    params = {
-        "q": f'"{name}"',
-        "dateRange": "custom",
-        "startdt": (datetime.utcnow() - timedelta(days=730)).strftime("%Y-%m-%d"),
-        "enddt": datetime.utcnow().strftime("%Y-%m-%d"),
-        "forms": "10-K,10-Q,8-K,20-F,6-K",
-    }
-    headers = {"User-Agent": SEC_EDGAR_UA}
-
-    # Try the newer EDGAR full-text search endpoint
-    resp = _safe_get(
-        "https://efts.sec.gov/LATEST/search-index",
-        headers=headers,
-        params=params,
-        timeout=15,
-    )
-
-    # Fallback: use the company search endpoint
-    if not resp or resp.status_code != 200:
-        resp = _safe_get(
-            "https://www.sec.gov/cgi-bin/browse-edgar",
-            headers=headers,
-            params={
-                "company": name,
-                "CIK": "",
-                "type": "10-K",
-                "dateb": "",
-                "owner": "include",
-                "count": "10",
-                "search_text": "",
-                "action": "getcompany",
-                "output": "atom",
-            },
-            timeout=15,
-        )
-
-        if resp:
-            try:
-                # Parse Atom feed
-                root = ET.fromstring(resp.content)
-                ns = {"atom": "http://www.w3.org/2005/Atom"}
-                for entry in root.findall("atom:entry", ns)[:10]:
-                    title = entry.find("atom:title", ns)
-                    link = entry.find("atom:link", ns)
-                    updated = entry.find("atom:updated", ns)
-                    summary = entry.find("atom:summary", ns)
-
-                    filings.append({
-                        "title": title.text if title is not None else "Unknown",
-                        "type": "SEC Filing",
-                        "date": updated.text[:10] if updated is not None else "",
-                        "url": link.get("href", "") if link is not None else "",
-                        "summary": (summary.text[:200] if summary is not None and summary.text else ""),
-                    })
-            except ET.ParseError:
-                pass
-    else:
-        try:
-            data = resp.json()
-            for hit in data.get("hits", {}).get("hits", [])[:10]:
-                source = hit.get("_source", {})
-                filings.append({
-                    "title": source.get("file_description", "SEC Filing"),
-                    "type": source.get("form_type", ""),
-                    "date": source.get("file_date", ""),
-                    "url": f"https://www.sec.gov/Archives/edgar/data/{source.get('file_num', '')}",
-                    "summary": source.get("file_description", "")[:200],
-                })
-        except Exception:
-            pass
+    filings = search_local_filings(db, name)
 
     return {
         "available": len(filings) > 0,
         "total_filings": len(filings),
         "filings": filings,
         "source": "SEC EDGAR",
-        "reference_url": f"https://www.sec.gov/cgi-bin/browse-edgar?company={name}&CIK=&type=&dateb=&owner=include&count=40&search_text=&action=getcompany",
+        "reference_url": _edgar_company_search_url(name),
         "checked_at": datetime.utcnow().isoformat(),
     }
 
@@ -334,84 +345,114 @@ def search_corporate_filings(name: str) -> dict:
 # 4.  RECENT NEWS (GNews Free Tier)
 # =====================================================
 
-def search_recent_news(name: str, months: int = 12) -> dict:
+def search_recent_news(supplier_id: int, db: Session, months: int = 12) -> dict:
     """
-    Search for recent news about the supplier using GNews free API.
-    Free tier: 100 requests/day, 10 articles per request.
+    Recent news from the local store (filled by the scheduled GNews
+    ingestion). Viewing a supplier adds it to the ingestion watch list.
     """
-    articles: list[dict] = []
+    watch_supplier(db, supplier_id)
+    return recent_news(db, supplier_id, months)
 
-    if not GNEWS_API_KEY:
-        return {
-            "available": False,
-            "reason": "GNEWS_API_KEY not configured",
-            "articles": [],
-            "source": "GNews",
-            "checked_at": datetime.utcnow().isoformat(),
-        }
 
-    from_date = (datetime.utcnow() - timedelta(days=months * 30)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    resp = _safe_get(
-        "https://gnews.io/api/v4/search",
-        params={
-            "q": name,
-            "lang": "en",
-            "max": "10",
-            "from": from_date,
-            "apikey": GNEWS_API_KEY,
-        },
-        timeout=15,
-    )
+# =====================================================
+# PER-SOURCE CACHE (SHARED ACROSS TENANTS)
+# =====================================================
+# public_data:{source}:{query} -> one source's result. Sources refresh
+# on their own schedule, so each has its own TTL; empty results are
+# cached too (negative caching), for less time.
 
-    risk_keywords = [
-        "fraud", "sanction", "corruption", "bribery", "lawsuit",
-        "violation", "penalty", "fine", "investigation", "indictment",
-        "embargo", "seizure", "default", "bankruptcy", "money laundering",
-    ]
+CACHE_PREFIX = "public_data"
 
-    if resp:
+SOURCE_TTL_SECONDS = {
+    "sanctions": 7 * 86400,   # key carries the list snapshot version
+    "trade": 30 * 86400,      # key carries the trade load version
+    "filings": 86400,         # EDGAR index refreshes daily
+    "news": 3600,             # news ingestion runs hourly
+}
+
+NEGATIVE_TTL_SECONDS = {
+    "sanctions": 7 * 86400,
+    "trade": 86400,
+    "filings": 6 * 3600,
+    "news": 900,
+}
+
+
+def _cache_key(source: str, *parts) -> str:
+    return ":".join([CACHE_PREFIX, source, *[str(part) for part in parts]])
+
+
+def _cached_source(source: str, key: str, compute, is_empty) -> dict:
+    try:
+        from app.worker.celery_app import redis_client
+        cached = redis_client.get(key)
+        if cached:
+            return json.loads(cached)
+    except Exception as e:
+        print(f"⚠️ Public data cache read failed ({source}): {e}")
+        redis_client = None
+
+    result = compute()
+
+    if redis_client is not None:
+        ttl = NEGATIVE_TTL_SECONDS[source] if is_empty(result) else SOURCE_TTL_SECONDS[source]
         try:
-            data = resp.json()
-            for article in data.get("articles", []):
-                title = article.get("title", "")
-                description = article.get("description", "")
-                content_text = f"{title} {description}".lower()
-
-                # Flag risk-relevant articles
-                risk_flags = [kw for kw in risk_keywords if kw in content_text]
-
-                articles.append({
-                    "title": title,
-                    "description": description[:300] if description else "",
-                    "source": article.get("source", {}).get("name", "Unknown"),
-                    "url": article.get("url", ""),
-                    "published_at": article.get("publishedAt", ""),
-                    "image": article.get("image", ""),
-                    "risk_relevant": len(risk_flags) > 0,
-                    "risk_keywords": risk_flags,
-                })
-        except Exception:
-            pass
-
-    risk_count = sum(1 for a in articles if a.get("risk_relevant"))
+            redis_client.setex(key, ttl, json.dumps(result))
+        except Exception as e:
+            print(f"⚠️ Public data cache write failed ({source}): {e}")
 
-    return {
-        "available": len(articles) > 0,
-        "total_articles": len(articles),
-        "risk_relevant_count": risk_count,
-        "articles": articles,
-        "source": "GNews",
-        "time_window_months": months,
-        "checked_at": datetime.utcnow().isoformat(),
-    }
+    return result
+
+
+def cached_sanctions(name: str, country: str = "") -> dict:
+    key = _cache_key("sanctions", sanctions_snapshot_version(), normalize(name))
+    return _cached_source(
+        "sanctions", key,
+        lambda: check_sanctions_lists(name, country),
+        lambda r: not r["hits"],
+    )
+
+
+def cached_trade_records(name: str, country: str, db: Session, months: int = 12) -> dict:
+    # Per country, not per supplier: every supplier in a country shares it
+    key = _cache_key("trade", trade_stats_version(), (country or "").upper().strip(), months)
+    return _cached_source(
+        "trade", key,
+        lambda: search_trade_records(name, country, db, months),
+        lambda r: not r["records"],
+    )
+
+
+def cached_corporate_filings(name: str, db: Session) -> dict:
+    key = _cache_key("filings", normalize(name))
+
+    def compute():
+        # Shared by every spelling of the name, so the cached payload
+        # carries nothing built from this caller's spelling
+        result = search_corporate_filings(name, db)
+        result.pop("reference_url", None)
+        return result
+
+    result = _cached_source("filings", key, compute, lambda r: not r["filings"])
+    return {**result, "reference_url": _edgar_company_search_url(name)}
+
+
+def cached_recent_news(supplier_id: int, db: Session, months: int = 12) -> dict:
+    # The news store is per supplier (watch list), so the key is too
+    key = _cache_key("news", supplier_id, months)
+    return _cached_source(
+        "news", key,
+        lambda: search_recent_news(supplier_id, db, months),
+        lambda r: not r["articles"],
+    )
 
 
 # =====================================================
 # MASTER AGGREGATOR
 # =====================================================
 
-def aggregate_public_data(name: str, country: str = "", news_months: int = 12) -> dict:
+def aggregate_public_data(db: Session, name: str, country: str = "", news_months: int = 12,
+                          supplier_id: int | None = None, trade_months: int = 12) -> dict:
     """
     Aggregate all four public data categories for a supplier.
     Each category is fetched independently — if one fails, the rest still return.
@@ -419,9 +460,13 @@ def aggregate_public_data(name: str, country: str = "", news_months: int = 12) -
     return {
         "supplier_name": name,
         "country": country,
-        "sanctions": check_sanctions_lists(name, country),
-        "trade_records": search_trade_records(name, country),
-        "corporate_filings": search_corporate_filings(name),
-        "news": search_recent_news(name, news_months),
+        "sanctions": cached_sanctions(name, country),
+        "trade_records": cached_trade_records(name, country, db, trade_months),
+        "corporate_filings": cached_corporate_filings(name, db),
+        "news": (
+            cached_recent_news(supplier_id, db, news_months)
+            if supplier_id is not None
+            else {"available": False, "reason": "Supplier not stored", "articles": [], "source": "GNews"}
+        ),
         "aggregated_at": datetime.utcnow().isoformat(),
     }
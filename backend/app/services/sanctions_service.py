@@ -2,7 +2,8 @@ from sqlalchemy.orm import Session
 from app.models import Supplier, SanctionedEntity
 from app.services.entity_resolution_service import resolve_supplier_entity, resolve_or_create_entity
 from app.services.public_data_service import check_sanctions_lists
-from app.graph.graph_client import get_session
+from app.graph.supplier_graph_service import mark_entity_as_sanctioned
+from app.graph.sanction_exposure_index import get_supplier_exposure
 
 
 MATCH_THRESHOLD = 85
@@ -18,48 +19,15 @@ def check_sanctions(supplier_id: int, db: Session):
     primary_entity = resolve_supplier_entity(supplier, db)
     entities_to_check = {primary_entity.canonical_name: primary_entity}
 
-    # 2. Extract related entities via Graph
-    try:
-        with get_session() as session:
-            # Parents
-            parent_result = session.run(
-                """
-                MATCH (e:GlobalEntity {canonical_name: $name})
-                      -[:RELATION {type:'SUBSIDIARY_OF'}]->
-                      (parent:GlobalEntity)
-                RETURN parent.canonical_name AS name, parent.country AS country
-                """,
-                name=primary_entity.canonical_name,
-            )
-            for r in parent_result:
-                name = r["name"]
-                if name not in entities_to_check:
-                    ent, _ = resolve_or_create_entity(name, db, country=r.get("country"))
-                    entities_to_check[name] = ent
-
-            # Subsidiaries
-            child_result = session.run(
-                """
-                MATCH (child:GlobalEntity)
-                      -[:RELATION {type:'SUBSIDIARY_OF'}]->
-                      (e:GlobalEntity {canonical_name: $name})
-                RETURN child.canonical_name AS name, child.country AS country
-                """,
-                name=primary_entity.canonical_name,
-            )
-            for r in child_result:
-                name = r["name"]
-                if name not in entities_to_check:
-                    ent, _ = resolve_or_create_entity(name, db, country=r.get("country"))
-                    entities_to_check[name] = ent
-    except Exception as e:
-        print(f"⚠️ Graph relation fetch failed for sanctions: {e}")
-
-    # 3. Check direct parent_company attribute if present
+    # 2. Check direct parent_company attribute if present
     if supplier.parent_company and supplier.parent_company not in entities_to_check:
         ent, _ = resolve_or_create_entity(supplier.parent_company, db)
         entities_to_check[supplier.parent_company] = ent
 
+    # 3. Sanctioned entities near the supplier in the graph (precomputed
+    #    index); reported alongside, scored by graph propagation
+    graph_exposure = get_supplier_exposure(db, supplier.name)
+
     all_matches = []
     highest_score = 0
 
@@ -86,6 +54,12 @@ def check_sanctions(supplier_id: int, db: Session):
                         )
                         db.add(new_sanction)
 
+                        # Flag the graph node so propagation / exposure index pick it up
+                        try:
+                            mark_entity_as_sanctioned(entity.canonical_name, hit.get("list", "Unknown"))
+                        except Exception as e:
+                            print(f"⚠️ Graph sanction marking failed: {e}")
+
                     all_matches.append({
                         "checked_name": name,
                         "sanctioned_name": hit.get("matched_name"),
@@ -106,7 +80,8 @@ def check_sanctions(supplier_id: int, db: Session):
             "overall_status": "FAIL",
             "risk_score": 100,
             "reason": reason,
-            "matches": all_matches
+            "matches": all_matches,
+            "graph_exposure": graph_exposure,
         }
 
     return {
@@ -114,5 +89,6 @@ def check_sanctions(supplier_id: int, db: Session):
         "overall_status": "PASS",
         "risk_score": 0,
         "reason": "No sanctions match found",
-        "matches": []
+        "matches": [],
+        "graph_exposure": graph_exposure,
     }
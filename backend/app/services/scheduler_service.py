@@ -9,6 +9,15 @@ from app.services.external_intelligence_service import (
     refresh_bis_entity_list,
 )
 from app.services.assessment_service import run_assessment
+from app.services.dedup_service import run_dedup_scan
+from app.services.news_service import ingest_watched_news
+from app.services.edgar_service import refresh_edgar_index
+from app.services.trade_stats_service import refresh_trade_stats
+from app.graph.sanction_exposure_index import rebuild_exposure_index
+from app.graph.risk_propagation import (
+    run_batch_risk_propagation,
+    apply_incremental_propagation,
+)
 
 
 scheduler = BackgroundScheduler()
@@ -60,6 +69,46 @@ def rescore_all_suppliers():
     db.close()
 
 
+# =====================================================
+# GRAPH RISK PROPAGATION JOB
+# =====================================================
+def propagate_graph_risk():
+    db: Session = SessionLocal()
+
+    try:
+        # One export (taken under the propagation lock) feeds both entity
+        # scoring and the exposure index
+        run_batch_risk_propagation(
+            include_suppliers=True,
+            with_graph=lambda graph: rebuild_exposure_index(db, graph),
+        )
+    except Exception as e:
+        print(f"⚠️ Graph risk propagation failed: {e}")
+    finally:
+        db.close()
+
+
+def propagate_graph_changes():
+    try:
+        apply_incremental_propagation()
+    except Exception as e:
+        print(f"⚠️ Incremental graph propagation failed: {e}")
+
+
+# =====================================================
+# DUPLICATE DETECTION JOB
+# =====================================================
+def detect_duplicates():
+    db: Session = SessionLocal()
+
+    try:
+        run_dedup_scan(db)
+    except Exception as e:
+        print(f"⚠️ Duplicate detection failed: {e}")
+    finally:
+        db.close()
+
+
 # =====================================================
 # SCHEDULER SETUP
 # =====================================================
@@ -83,6 +132,60 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    # EDGAR form.idx (current quarter is rebuilt nightly by SEC)
+    scheduler.add_job(
+        lambda: run_feed_with_tracking("EDGAR", refresh_edgar_index),
+        trigger="interval",
+        hours=24,
+        id="edgar_index_refresh",
+        replace_existing=True,
+    )
+
+    # Census HS2 imports by country (published monthly)
+    scheduler.add_job(
+        lambda: run_feed_with_tracking("CENSUS_TRADE", refresh_trade_stats),
+        trigger="interval",
+        days=30,
+        id="trade_stats_refresh",
+        replace_existing=True,
+    )
+
+    # Hourly incremental news fetch for watched suppliers (GNews quota)
+    scheduler.add_job(
+        lambda: run_feed_with_tracking("GNEWS", ingest_watched_news),
+        trigger="interval",
+        hours=1,
+        id="news_ingestion",
+        replace_existing=True,
+    )
+
+    # Whole-graph risk propagation (runs before rescoring reads it)
+    scheduler.add_job(
+        propagate_graph_risk,
+        trigger="interval",
+        hours=12,
+        id="graph_risk_propagation",
+        replace_existing=True,
+    )
+
+    # Incremental propagation of new edges / sanctions
+    scheduler.add_job(
+        propagate_graph_changes,
+        trigger="interval",
+        minutes=5,
+        id="graph_incremental_propagation",
+        replace_existing=True,
+    )
+
+    # Nightly duplicate supplier / entity proposals
+    scheduler.add_job(
+        detect_duplicates,
+        trigger="interval",
+        hours=24,
+        id="duplicate_detection",
+        replace_existing=True,
+    )
+
     # Nightly Supplier Rescoring
     scheduler.add_job(
         rescore_all_suppliers,
@@ -0,0 +1,307 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from operator import itemgetter
+
+from sqlalchemy.orm import Session
+
+from app.core.normalization import normalize
+from app.models import Supplier
+
+
+# =====================================================
+# AUTOCOMPLETE CONFIG
+# =====================================================
+
+GLOBAL_SCOPE = "global"
+
+# New rows (incremental top-up) / renames, deletes, scope moves (rebuild)
+VERSION_KEY_PREFIX = "autocomplete:version"
+GENERATION_KEY_PREFIX = "autocomplete:generation"
+
+VERSION_CHECK_SECONDS = 5
+# Also picks up changes written outside the API (scripts, SQL)
+FULL_RELOAD_SECONDS = 3600
+
+MIN_QUERY_LENGTH = 2
+MAX_SUGGESTIONS = 25
+
+# Sorts after every character a normalized key can hold
+_PREFIX_END = "\U0010ffff"
+
+# Matching the start of the name ranks above matching a later word
+NAME_START_WEIGHT = 1.0
+WORD_START_WEIGHT = 0.8
+
+
+# =====================================================
+# SORTED-ARRAY PREFIX INDEX
+# =====================================================
+
+class PrefixIndex:
+    """
+    Sorted keys for every word start of every supplier name, bucketed by
+    (matched at name start, normalized name length). Every key in a
+    bucket scores the same for a given query, so a lookup walks buckets
+    best-first and bisects each to the keys starting with the prefix.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.suppliers = {}
+        self.max_id = 0
+        self.version = None
+        self.generation = None
+        self.checked_at = 0.0
+        self.loaded_at = 0.0
+
+    @staticmethod
+    def _keys_for(supplier_id: int, normalized: str):
+        tokens = normalized.split()
+        return [
+            ((position == 0, len(normalized)), (" ".join(tokens[position:]), supplier_id))
+            for position in range(len(tokens))
+        ]
+
+    def _entries(self, supplier_id: int, name: str, country: str = None):
+        normalized = normalize(name)
+        if not normalized or supplier_id in self.suppliers:
+            return []
+
+        self.suppliers[supplier_id] = (name, normalized, country)
+        self.max_id = max(self.max_id, supplier_id)
+        return self._keys_for(supplier_id, normalized)
+
+    def add(self, supplier_id: int, name: str, country: str = None):
+        """Insert, or re-key a supplier already in the index."""
+        self.remove(supplier_id)
+        for bucket, key in self._entries(supplier_id, name, country):
+            insort(self.buckets.setdefault(bucket, []), key)
+
+    def add_many(self, rows):
+        """Bulk load: append everything, sort each touched bucket once."""
+        touched = set()
+        for supplier_id, name, country in rows:
+            for bucket, key in self._entries(supplier_id, name, country):
+                self.buckets.setdefault(bucket, []).append(key)
+                touched.add(bucket)
+
+        for bucket in touched:
+            self.buckets[bucket].sort()
+
+    def remove(self, supplier_id: int):
+        indexed = self.suppliers.pop(supplier_id, None)
+        if indexed is None:
+            return
+
+        for bucket, key in self._keys_for(supplier_id, indexed[1]):
+            keys = self.buckets.get(bucket, [])
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+            if not keys:
+                self.buckets.pop(bucket, None)
+
+    def prefix_ranges(self, prefix: str):
+        """(name_start, name length, keys, start, end) for each bucket with keys starting with prefix."""
+        ranges = []
+
+        for (name_start, length), keys in self.buckets.items():
+            if length < len(prefix):
+                continue
+            start = bisect_left(keys, (prefix,))
+            end = bisect_left(keys, (prefix + _PREFIX_END,), start)
+            if start < end:
+                ranges.append((name_start, length, keys, start, end))
+
+        return ranges
+
+
+def _confidence(query: str, length: int, name_start: bool) -> int:
+    coverage = len(query) / max(length, 1)
+    weight = NAME_START_WEIGHT if name_start else WORD_START_WEIGHT
+    return round(100 * weight * (0.5 + 0.5 * min(coverage, 1.0)))
+
+
+# =====================================================
+# PER-TENANT INDEXES (+ THE GLOBAL SET)
+# =====================================================
+
+_indexes: dict = {}
+_lock = threading.RLock()
+
+
+def _version_key(scope) -> str:
+    return f"{VERSION_KEY_PREFIX}:{scope}"
+
+
+def _generation_key(scope) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{scope}"
+
+
+def _scope_of(supplier):
+    return GLOBAL_SCOPE if supplier.is_global else supplier.organization_id
+
+
+def _current_versions(scope):
+    try:
+        from app.worker.celery_app import redis_client
+        version, generation = redis_client.mget([_version_key(scope), _generation_key(scope)])
+        return version, generation
+    except Exception:
+        return None, None
+
+
+def _notify(key: str):
+    try:
+        from app.worker.celery_app import redis_client
+        redis_client.incr(key)
+    except Exception as e:
+        print(f"⚠️ Autocomplete index notification failed: {e}")
+
+
+def _scope_filter(scope):
+    if scope == GLOBAL_SCOPE:
+        return Supplier.is_global == True
+    return (Supplier.organization_id == scope) & (Supplier.is_global == False)
+
+
+def _get_index(db: Session, scope) -> PrefixIndex:
+    """
+    Load a scope on first use, top it up with new rows when its version
+    moves, rebuild it when its generation moves or it is an hour old.
+    """
+    now = time.monotonic()
+
+    with _lock:
+        index = _indexes.get(scope)
+
+        if index is not None and now - index.checked_at < VERSION_CHECK_SECONDS:
+            return index
+
+        version, generation = _current_versions(scope)
+
+        rebuild = (
+            index is None
+            or generation != index.generation
+            or now - index.loaded_at >= FULL_RELOAD_SECONDS
+        )
+
+        if rebuild:
+            index = PrefixIndex()
+            index.generation = generation
+            index.loaded_at = now
+
+        if rebuild or version != index.version:
+            rows = (
+                db.query(Supplier.id, Supplier.name, Supplier.country)
+                .filter(_scope_filter(scope), Supplier.id > index.max_id)
+                .yield_per(5000)
+            )
+            index.add_many(rows)
+
+            index.version = version
+            _indexes[scope] = index
+
+        index.checked_at = now
+        return index
+
+
+def add_supplier_to_index(supplier):
+    """Incremental update on supplier create (this process + others)."""
+    scope = _scope_of(supplier)
+
+    with _lock:
+        index = _indexes.get(scope)
+        if index is not None:
+            index.add(supplier.id, supplier.name, supplier.country)
+
+    _notify(_version_key(scope))
+
+
+def update_supplier_in_index(supplier, previous_scope=None):
+    """
+    Re-key a renamed supplier, or move one whose is_global / organization
+    changed out of `previous_scope`. Other processes rebuild the scopes.
+    """
+    scope = _scope_of(supplier)
+    scopes = {scope} if previous_scope is None else {scope, previous_scope}
+
+    with _lock:
+        for changed in scopes:
+            index = _indexes.get(changed)
+            if index is not None:
+                index.remove(supplier.id)
+
+        index = _indexes.get(scope)
+        if index is not None:
+            index.add(supplier.id, supplier.name, supplier.country)
+
+    for changed in scopes:
+        _notify(_generation_key(changed))
+
+
+def remove_supplier_from_index(supplier_id: int, scope):
+    """Drop a deleted supplier (this process + others)."""
+    with _lock:
+        index = _indexes.get(scope)
+        if index is not None:
+            index.remove(supplier_id)
+
+    _notify(_generation_key(scope))
+
+
+# =====================================================
+# LOOKUP
+# =====================================================
+
+def _walk(keys: list, start: int, end: int, index: PrefixIndex):
+    for position in range(start, end):
+        yield keys[position], index
+
+
+def autocomplete_suppliers(db: Session, organization_id, query: str, limit: int = 10):
+    """
+    Ranked top-k suppliers visible to a tenant whose words start with
+    `query`: by confidence, then shorter name, then matched key. Reads
+    the indexes under _lock and stops at the k-th distinct supplier.
+    """
+    normalized_query = normalize(query)
+    if len(normalized_query) < MIN_QUERY_LENGTH:
+        return []
+
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    scopes = [GLOBAL_SCOPE]
+    if organization_id is not None:
+        scopes.insert(0, organization_id)
+
+    results = []
+    seen = set()
+
+    with _lock:
+        ranks = {}
+        for scope in scopes:
+            index = _get_index(db, scope)
+            for name_start, length, keys, start, end in index.prefix_ranges(normalized_query):
+                confidence = _confidence(normalized_query, length, name_start)
+                ranks.setdefault((-confidence, length), []).append(_walk(keys, start, end, index))
+
+        # A supplier's first hit is its best: later ranks only score lower
+        for (negative_confidence, _), walks in sorted(ranks.items()):
+            for (_, supplier_id), index in heapq.merge(*walks, key=itemgetter(0)):
+                if supplier_id in seen:
+                    continue
+                seen.add(supplier_id)
+
+                name, _, country = index.suppliers[supplier_id]
+                results.append({
+                    "id": supplier_id,
+                    "name": name,
+                    "country": country,
+                    "confidence": -negative_confidence,
+                })
+                if len(results) == limit:
+                    return results
+
+    return results
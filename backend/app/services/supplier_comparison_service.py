@@ -2,7 +2,6 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 
 from app.models import (
-    Supplier,
     AssessmentHistory,
     SupplierEntityLink,
     GlobalEntity,
@@ -10,7 +9,10 @@ from app.models import (
     CoveredEntity,
 )
 
-from app.graph.graph_client import get_session
+from app.core.tenancy import get_visible_supplier
+from app.graph.graph_client import read_query
+from app.graph.graph_snapshot import active_snapshot
+from app.graph.graph_analytics import graph_exposure
 
 
 SECTION_RANK = {
@@ -56,19 +58,22 @@ def get_section_889_status(supplier_id: int, db: Session) -> str:
 
 
 def get_graph_exposure(supplier_name: str):
+    snapshot = active_snapshot()
+    if snapshot is not None:
+        return graph_exposure(snapshot, supplier_name)
+
     try:
-        with get_session() as session:
-            result = session.run(
-                """
-                MATCH (n {name: $name})-[r*1..2]-(m)
-                RETURN COUNT(DISTINCT m) as nodes,
-                       COUNT(DISTINCT r) as rels
-                """,
-                name=supplier_name,
-            ).single()
-
-            if result:
-                return result["nodes"] + result["rels"]
+        records = read_query(
+            """
+            MATCH (n {name: $name})-[r*1..2]-(m)
+            RETURN COUNT(DISTINCT m) as nodes,
+                   COUNT(DISTINCT r) as rels
+            """,
+            name=supplier_name,
+        )
+
+        if records:
+            return records[0]["nodes"] + records[0]["rels"]
 
     except Exception:
         pass
@@ -116,26 +121,12 @@ def compare_suppliers(
     # ------------------------------------------------------------------
     # Tenant Isolation
     # ------------------------------------------------------------------
-    supplier_a = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_a_id,
-            Supplier.organization_id == organization_id
-        )
-        .first()
-    )
-
-    supplier_b = (
-        db.query(Supplier)
-        .filter(
-            Supplier.id == supplier_b_id,
-            Supplier.organization_id == organization_id
-        )
-        .first()
-    )
+    # Same visibility as the other supplier endpoints: own + global catalog
+    supplier_a = get_visible_supplier(db, supplier_a_id, organization_id)
+    supplier_b = get_visible_supplier(db, supplier_b_id, organization_id)
 
     if not supplier_a or not supplier_b:
-        return {"error": "One or both suppliers not found in your organization"}
+        return {"error": "One or both suppliers not found"}
 
     # ------------------------------------------------------------------
     # Latest Assessment Snapshot
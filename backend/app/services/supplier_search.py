@@ -0,0 +1,192 @@
+from sqlalchemy import Float, Integer, case, func, literal_column, or_, text
+from sqlalchemy.orm import Query, Session
+
+from app.core.normalization import normalize
+from app.models import Supplier
+
+
+# =====================================================
+# SEARCH CONFIG
+# =====================================================
+
+# pg_trgm: `%` uses the session limit; per-column floors are rechecked
+NAME_SIMILARITY = 0.15
+INDUSTRY_SIMILARITY = 0.3
+COUNTRY_SIMILARITY = 0.4
+
+# FTS5 trigram tokenizer needs at least 3 characters per query
+FTS_MIN_QUERY_LENGTH = 3
+
+SQLITE_FTS_TABLE = "suppliers_fts"
+
+# Kept in sync with alembic revision 3f8d2c6b9a41 (local sqlite
+# deployments that never ran migrations get it from ensure_search_index)
+SQLITE_FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        normalized_name, industry, country, address, naics_code,
+        content='suppliers', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_ai AFTER INSERT ON suppliers BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, normalized_name, industry, country, address, naics_code)
+        VALUES (new.id, new.normalized_name, new.industry, new.country, new.address, new.naics_code);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_ad AFTER DELETE ON suppliers BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, normalized_name, industry, country, address, naics_code)
+        VALUES ('delete', old.id, old.normalized_name, old.industry, old.country, old.address, old.naics_code);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_au AFTER UPDATE ON suppliers BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, normalized_name, industry, country, address, naics_code)
+        VALUES ('delete', old.id, old.normalized_name, old.industry, old.country, old.address, old.naics_code);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, normalized_name, industry, country, address, naics_code)
+        VALUES (new.id, new.normalized_name, new.industry, new.country, new.address, new.naics_code);
+    END
+    """,
+]
+
+
+def ensure_search_index(engine):
+    """Create the SQLite FTS5 table + triggers if missing (no-op elsewhere)."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": SQLITE_FTS_TABLE},
+        ).first()
+
+        for statement in SQLITE_FTS_DDL:
+            conn.execute(text(statement))
+
+        if not exists:
+            conn.execute(text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _has_fts_table(db: Session) -> bool:
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+        {"name": SQLITE_FTS_TABLE},
+    ).first() is not None
+
+
+# =====================================================
+# POSTGRES: INDEX-FRIENDLY TRIGRAM MATCH
+# =====================================================
+
+def _postgres_search(db: Session, base_query: Query, query: str, normalized_query: str, supplier):
+    # `%` matches similarity >= pg_trgm.similarity_threshold; the GIN
+    # trigram indexes serve it. Transaction-local (SET LOCAL), so the
+    # threshold never leaks to the next user of a pooled connection.
+    db.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :limit, true)"),
+        {"limit": str(NAME_SIMILARITY)},
+    )
+
+    name_sim = func.similarity(supplier.normalized_name, normalized_query)
+    industry_sim = func.similarity(supplier.industry, query)
+    country_sim = func.similarity(supplier.country, query)
+
+    search_score = (
+        (name_sim * 2.0) +
+        (industry_sim * 1.5) +
+        (country_sim * 1.0)
+    ).label("search_score")
+
+    search_pattern = f"%{query}%"
+
+    filtered = (
+        base_query
+        .add_columns(search_score)
+        .filter(
+            or_(
+                supplier.normalized_name.op("%")(normalized_query),
+                supplier.industry.op("%")(query) & (industry_sim > INDUSTRY_SIMILARITY),
+                supplier.country.op("%")(query) & (country_sim > COUNTRY_SIMILARITY),
+                supplier.address.ilike(search_pattern),
+                supplier.naics_code.ilike(search_pattern),
+            )
+        )
+    )
+
+    return filtered, search_score
+
+
+# =====================================================
+# SQLITE: FTS5 TRIGRAM FALLBACK
+# =====================================================
+
+def _sqlite_search(db: Session, base_query: Query, query: str, normalized_query: str, supplier):
+    if len(normalized_query) < FTS_MIN_QUERY_LENGTH or not _has_fts_table(db):
+        # Tiny queries / unmigrated databases: plain substring match
+        pattern = f"%{normalized_query}%"
+        search_score = literal_column("1.0").label("search_score")
+        filtered = base_query.add_columns(search_score).filter(
+            or_(
+                supplier.normalized_name.like(pattern),
+                supplier.industry.ilike(f"%{query}%"),
+                supplier.country.ilike(f"%{query}%"),
+                supplier.address.ilike(f"%{query}%"),
+                supplier.naics_code.ilike(f"%{query}%"),
+            )
+        )
+        return filtered, search_score
+
+    # Phrase query: trigram tokenizer turns it into a substring match
+    fts_query = '"' + normalized_query.replace('"', '""') + '"'
+
+    matches = (
+        text(
+            f"SELECT rowid AS id, bm25({SQLITE_FTS_TABLE}, 2.0, 1.5, 1.0, 1.0, 1.0) AS rank "
+            f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :fts_query"
+        )
+        .bindparams(fts_query=fts_query)
+        .columns(id=Integer, rank=Float)
+        .subquery("fts_matches")
+    )
+
+    # bm25 is lower-is-better
+    search_score = (-matches.c.rank).label("search_score")
+
+    filtered = (
+        base_query
+        .add_columns(search_score)
+        .join(matches, matches.c.id == supplier.id)
+    )
+
+    return filtered, search_score
+
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+
+def apply_supplier_search(db: Session, base_query: Query, query: str, supplier=Supplier):
+    """
+    Add the text-search filter and a `search_score` column to a
+    Supplier query. Returns (query, order expression).
+
+    supplier: the Supplier entity (or alias, e.g. tenant_suppliers())
+    the base query selects from.
+    """
+    normalized_query = normalize(query)
+
+    if db.bind.dialect.name == "postgresql":
+        filtered, search_score = _postgres_search(db, base_query, query, normalized_query, supplier)
+    else:
+        filtered, search_score = _sqlite_search(db, base_query, query, normalized_query, supplier)
+
+    order_expr = (
+        search_score
+        + case((supplier.normalized_name == normalized_query, 2.0), else_=0.0)
+        + case((supplier.industry == query, 3.0), else_=0.0)
+        + case((supplier.country == query, 1.0), else_=0.0)
+    )
+
+    return filtered, order_expr
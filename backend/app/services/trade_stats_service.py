@@ -0,0 +1,252 @@
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import dialect_insert
+from app.models import TradeStat
+
+
+# =====================================================
+# CENSUS TRADE STATS CONFIG
+# =====================================================
+# Import values are per country, not per supplier: one monthly HS2
+# extract (every country x chapter) serves every supplier lookup.
+
+CENSUS_TRADE_URL = "https://api.census.gov/data/timeseries/intltrade/imports/hs"
+CENSUS_FIELDS = "CTY_CODE,CTY_NAME,I_COMMODITY,GEN_VAL_MO,CON_VAL_MO"
+
+# Empty table: backfill this many months
+TRADE_BACKFILL_MONTHS = int(os.getenv("TRADE_BACKFILL_MONTHS", "36"))
+
+CENSUS_REQUEST_PAUSE_SECONDS = 0.5
+UPSERT_BATCH_SIZE = 2000
+
+VERSION_KEY = "public_data:trade:version"
+
+DEFAULT_WINDOW_MONTHS = 12
+TOP_CHAPTERS = 5
+
+
+# =====================================================
+# PERIOD HELPERS (YYYY-MM)
+# =====================================================
+
+def _period(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+
+def _shift(period: str, months: int) -> str:
+    year, month = map(int, period.split("-"))
+    index = year * 12 + (month - 1) + months
+    return _period(index // 12, index % 12 + 1)
+
+
+def _periods(start: str, end: str):
+    while start <= end:
+        yield start
+        start = _shift(start, 1)
+
+
+def _is_country_code(code) -> bool:
+    """
+    Census Schedule C country: four digits, not 0xxx. Aggregate rows use
+    "-" (TOTAL FOR ALL COUNTRIES), 0xxx groupings (OPEC, EUROPEAN UNION,
+    USMCA, ...) and nXXX continents.
+    """
+    return isinstance(code, str) and len(code) == 4 and code.isdigit() and code[0] != "0"
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+# =====================================================
+# MONTHLY BULK LOADER
+# =====================================================
+
+def _fetch_month(period: str) -> list:
+    from app.services.public_data_service import _safe_get
+
+    resp = _safe_get(
+        CENSUS_TRADE_URL,
+        params={"get": CENSUS_FIELDS, "COMM_LVL": "HS2", "time": period},
+        timeout=60,
+    )
+
+    # Census answers 204 (no body) for months not yet published
+    if not resp or resp.status_code == 204:
+        return []
+
+    try:
+        data = resp.json()
+    except Exception:
+        return []
+
+    if not isinstance(data, list) or len(data) < 2:
+        return []
+
+    headers = data[0]
+    rows = []
+
+    for values in data[1:]:
+        record = dict(zip(headers, values))
+        if not record.get("CTY_NAME") or not record.get("I_COMMODITY"):
+            continue
+        if not _is_country_code(record.get("CTY_CODE")):
+            continue
+
+        rows.append({
+            "country_code": record.get("CTY_CODE"),
+            "country_name": record["CTY_NAME"].upper().strip(),
+            "hs_chapter": record["I_COMMODITY"],
+            "period": period,
+            "general_value": _to_int(record.get("GEN_VAL_MO")),
+            "consumption_value": _to_int(record.get("CON_VAL_MO")),
+            "updated_at": datetime.utcnow(),
+        })
+
+    return rows
+
+
+def _upsert(db: Session, rows: list):
+    insert = dialect_insert(db)
+
+    for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = insert(TradeStat).values(rows[i:i + UPSERT_BATCH_SIZE])
+        # Census revises recent months; keep the latest published values
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["country_name", "hs_chapter", "period"],
+            set_={
+                "country_code": stmt.excluded.country_code,
+                "general_value": stmt.excluded.general_value,
+                "consumption_value": stmt.excluded.consumption_value,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ))
+
+    db.commit()
+
+
+def refresh_trade_stats(db: Session) -> int:
+    """
+    Monthly feed: re-load the latest stored month (revisions) and every
+    newer month until Census has nothing published yet.
+    """
+    now = datetime.utcnow()
+    current = _period(now.year, now.month)
+
+    latest = db.query(func.max(TradeStat.period)).scalar()
+    start = latest or _shift(current, -TRADE_BACKFILL_MONTHS)
+
+    loaded = 0
+
+    for period in _periods(start, current):
+        rows = _fetch_month(period)
+
+        if not rows:
+            # Past the newest release (backfill may still hit gaps first)
+            if latest is not None or period > _shift(current, -3):
+                break
+            continue
+
+        _upsert(db, rows)
+        loaded += len(rows)
+
+        time.sleep(CENSUS_REQUEST_PAUSE_SECONDS)
+
+    if loaded:
+        _bump_version()
+
+    return loaded
+
+
+def trade_stats_version() -> str:
+    """Changes whenever a load lands, so cached trade lookups roll over."""
+    try:
+        from app.worker.celery_app import redis_client
+        return redis_client.get(VERSION_KEY) or "0"
+    except Exception:
+        return "0"
+
+
+def _bump_version():
+    try:
+        from app.worker.celery_app import redis_client
+        redis_client.incr(VERSION_KEY)
+    except Exception as e:
+        print(f"⚠️ Trade stats version bump failed: {e}")
+
+
+# =====================================================
+# LOCAL LOOKUPS
+# =====================================================
+
+def trade_window(db: Session, country: str, months: int = DEFAULT_WINDOW_MONTHS,
+                 end_period: str | None = None) -> dict:
+    """
+    Monthly import totals and top HS chapters for a country over the
+    `months` periods ending at end_period (default: latest loaded).
+    """
+    country_name = country.upper().strip()
+
+    if end_period is None:
+        end_period = (
+            db.query(func.max(TradeStat.period))
+            .filter(TradeStat.country_name == country_name)
+            .scalar()
+        )
+
+    if end_period is None:
+        return {"monthly": [], "top_chapters": [], "start_period": None, "end_period": None}
+
+    start_period = _shift(end_period, -(months - 1))
+    window = (
+        TradeStat.country_name == country_name,
+        TradeStat.period >= start_period,
+        TradeStat.period <= end_period,
+    )
+
+    monthly = (
+        db.query(
+            TradeStat.period,
+            func.sum(TradeStat.general_value),
+            func.sum(TradeStat.consumption_value),
+        )
+        .filter(*window)
+        .group_by(TradeStat.period)
+        .order_by(TradeStat.period.desc())
+        .all()
+    )
+
+    top_chapters = (
+        db.query(TradeStat.hs_chapter, func.sum(TradeStat.general_value).label("total"))
+        .filter(*window)
+        .group_by(TradeStat.hs_chapter)
+        .order_by(func.sum(TradeStat.general_value).desc())
+        .limit(TOP_CHAPTERS)
+        .all()
+    )
+
+    return {
+        "monthly": [
+            {
+                "country": country_name,
+                "general_value": int(general or 0),
+                "consumption_value": int(consumption or 0),
+                "period": period,
+            }
+            for period, general, consumption in monthly
+        ],
+        "top_chapters": [
+            {"hs_chapter": chapter, "general_value": int(total or 0)}
+            for chapter, total in top_chapters
+        ],
+        "start_period": start_period,
+        "end_period": end_period,
+    }
@@ -1,6 +1,7 @@
 import os
 import redis
 from celery import Celery
+from celery.signals import worker_init
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
@@ -34,3 +35,19 @@ clean_redis_url = redis_url.split("?")[0]
 
 # Shared Redis client for ultra-fast <1s caching
 redis_client = redis.Redis.from_url(clean_redis_url, decode_responses=True, ssl_cert_reqs=None)
+
+
+# Load spaCy once in the parent before the pool forks; children share it
+PRELOAD_NLP_MODELS = os.getenv("PRELOAD_NLP_MODELS", "true").lower() == "true"
+
+
+@worker_init.connect
+def preload_nlp_models(**kwargs):
+    if not PRELOAD_NLP_MODELS:
+        return
+
+    try:
+        from app.nlp.model_registry import preload_models
+        preload_models()
+    except Exception as e:
+        print(f"⚠️ spaCy model preload failed: {e}")
@@ -4,6 +4,8 @@ import time
 from app.worker.celery_app import celery_app, redis_client
 from app.database import SessionLocal
 from app.services.assessment_service import run_assessment
+from app.graph.risk_propagation import run_batch_risk_propagation
+from app.services.dedup_service import run_dedup_scan
 
 logger = logging.getLogger(__name__)
 
@@ -29,3 +31,54 @@ def run_assessment_task(self, supplier_id: int, user_id: int):
         return {"error": str(e)}
     finally:
         db.close()
+
+
+@celery_app.task(name="run_batch_risk_propagation_task")
+def run_batch_risk_propagation_task():
+    # Whole-graph scoring job; safe to trigger on demand from batch workers
+    try:
+        return run_batch_risk_propagation()
+    except Exception as e:
+        logger.error(f"Batch risk propagation failed: {e}")
+        return {"error": str(e)}
+
+
+@celery_app.task(name="run_dedup_scan_task")
+def run_dedup_scan_task():
+    db = SessionLocal()
+    try:
+        return run_dedup_scan(db)
+    except Exception as e:
+        logger.error(f"Duplicate detection failed: {e}")
+        return {"error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="process_documents_task")
+def process_documents_task(texts: list):
+    # Imported here so the API process never loads spaCy
+    from app.nlp.nlp_entity_pipeline import process_documents
+
+    db = SessionLocal()
+    try:
+        return process_documents(texts, db)
+    except Exception as e:
+        logger.error(f"Document ingestion failed: {e}")
+        return {"error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="process_source_task")
+def process_source_task(source: str):
+    from app.nlp.nlp_entity_pipeline import process_source
+
+    db = SessionLocal()
+    try:
+        return process_source(source, db)
+    except Exception as e:
+        logger.error(f"Source ingestion failed for {source}: {e}")
+        return {"error": str(e)}
+    finally:
+        db.close()
@@ -1,6 +1,6 @@
 from app.database import SessionLocal
 from app.models import User, Organization
-from app.core.security import hash_password
+from app.core.security import hash_password, revoke_user_tokens
 
 db = SessionLocal()
 username = "testuser_verif"
@@ -8,6 +8,7 @@ password = "password123"
 
 existing = db.query(User).filter(User.username == username).first()
 if existing:
+    revoke_user_tokens(db, existing)
     db.delete(existing)
     db.commit()
 
@@ -0,0 +1,62 @@
+import argparse
+import json
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.graph.graph_snapshot import export_snapshot, load_snapshot, restore_snapshot
+from app.graph.graph_engine import propagate_exposure, exposure_to_score
+from app.graph.graph_analytics import trust_score, sanction_paths, graph_exposure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supplier graph snapshot tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = sub.add_parser("export", help="Dump the live Neo4j graph to a snapshot")
+    export_cmd.add_argument("path")
+
+    restore_cmd = sub.add_parser("restore", help="Load a snapshot into Neo4j")
+    restore_cmd.add_argument("path")
+
+    propagate_cmd = sub.add_parser("propagate", help="Offline risk propagation")
+    propagate_cmd.add_argument("path")
+    propagate_cmd.add_argument("--top", type=int, default=20)
+
+    trust_cmd = sub.add_parser("trust", help="Offline trust score for an entity")
+    trust_cmd.add_argument("path")
+    trust_cmd.add_argument("entity")
+
+    paths_cmd = sub.add_parser("sanction-paths", help="Offline sanction paths for a supplier")
+    paths_cmd.add_argument("path")
+    paths_cmd.add_argument("supplier")
+
+    exposure_cmd = sub.add_parser("exposure", help="Offline comparison exposure for a supplier")
+    exposure_cmd.add_argument("path")
+    exposure_cmd.add_argument("supplier")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        result = export_snapshot(args.path)
+    elif args.command == "restore":
+        result = restore_snapshot(args.path)
+    else:
+        graph = load_snapshot(args.path)
+
+        if args.command == "propagate":
+            scores = exposure_to_score(propagate_exposure(graph))
+            top = scores.argsort()[::-1][:args.top]
+            result = [{"entity": graph.names[i], "score": float(scores[i])} for i in top]
+        elif args.command == "trust":
+            result = trust_score(graph, args.entity)
+        elif args.command == "sanction-paths":
+            result = sanction_paths(graph, args.supplier)
+        else:
+            result = {"graph_exposure": graph_exposure(graph, args.supplier)}
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
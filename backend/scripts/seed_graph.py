@@ -2,10 +2,11 @@ import pandas as pd
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.database import SessionLocal
+from app.services.entity_resolution_service import resolve_entities_bulk
 from app.graph.supplier_graph_service import (
-    create_global_entity_node,
-    link_supplier_to_entity,
-    create_entity_relationship
+    link_suppliers_to_entities,
+    create_entity_relationships,
 )
 
 def seed_graph():
@@ -16,54 +17,56 @@ def seed_graph():
         return
 
     print("Seeding Neo4j graph relationships...")
-    count = 0
-    edges_created = 0
-    
+
+    rows = []
     for _, row in df.iterrows():
-        supplier_name = row["name"]
         parent_company = row["parent_company"]
-        country = row["country"]
-        
-        canonical_name = supplier_name
-        
-        # 1. Ensure global entity node
-        create_global_entity_node(
-            canonical_name=canonical_name,
-            entity_type="COMPANY",
-            country=country
-        )
-        
-        # 2. Link Supplier -> Entity
-        link_supplier_to_entity(
-            supplier_name=supplier_name,
-            canonical_name=canonical_name,
-            confidence_score=1.0,
-            resolution_method="SEED"
+        parent_name = (
+            str(parent_company).strip()
+            if pd.notna(parent_company) and str(parent_company).strip()
+            else None
         )
-        
-        # 3. Create relationship if parent exists
-        if pd.notna(parent_company) and str(parent_company).strip():
-            parent_name = str(parent_company).strip()
-            # Ensure parent node exists
-            create_global_entity_node(
-                canonical_name=parent_name,
-                entity_type="COMPANY",
-                country="Global"
-            )
-            # Create SUBSIDIARY_OF relation
-            create_entity_relationship(
-                subject_entity=canonical_name,
-                object_entity=parent_name,
-                relationship_type="SUBSIDIARY_OF",
-                confidence=0.9
-            )
-            edges_created += 1
-            
-        count += 1
-        if count % 100 == 0:
-            print(f"Processed {count} rows...")
-            
-    print(f"Graph seeding complete. Processed {count} suppliers, created {edges_created} relationships.")
+        rows.append((row["name"], row["country"], parent_name))
+
+    db = SessionLocal()
+
+    try:
+        # 1. Resolve suppliers + parents to GlobalEntities (SQL rows and
+        #    graph nodes are created in bulk)
+        names = [{"name": name, "country": country} for name, country, _ in rows]
+        names += [{"name": parent, "country": "Global"} for _, _, parent in rows if parent]
+
+        resolved = resolve_entities_bulk(names, db)
+        canonical = {name: entity.canonical_name for name, (entity, _) in resolved.items()}
+    finally:
+        db.close()
+
+    # 2. Link Supplier -> Entity
+    link_suppliers_to_entities([
+        {
+            "supplier_name": name,
+            "canonical_name": canonical[name],
+            "confidence_score": 1.0,
+            "resolution_method": "SEED",
+        }
+        for name, _, _ in rows
+        if name in canonical
+    ])
+
+    # 3. Create SUBSIDIARY_OF relation where a parent exists
+    relations = [
+        {
+            "subject_entity": canonical[name],
+            "object_entity": canonical[parent],
+            "relationship_type": "SUBSIDIARY_OF",
+            "confidence": 0.9,
+        }
+        for name, _, parent in rows
+        if parent and name in canonical and parent in canonical
+    ]
+    create_entity_relationships(relations)
+
+    print(f"Graph seeding complete. Processed {len(rows)} suppliers, created {len(relations)} relationships.")
 
 if __name__ == "__main__":
     seed_graph()
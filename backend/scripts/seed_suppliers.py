@@ -2,7 +2,7 @@ import pandas as pd
 from sqlalchemy.exc import IntegrityError
 from app.database import SessionLocal
 from app.models import Supplier
-from app.services.entity_resolution_service import normalize
+from app.services.entity_resolution_service import normalize, resolve_supplier_entities_bulk
 
 
 def seed():
@@ -16,25 +16,23 @@ def seed():
 
     inserted = 0
     skipped = 0
+    new_suppliers = []
+
+    # Prevent duplicates (based on name + country) with one query
+    existing = set(
+        db.query(Supplier.normalized_name, Supplier.country).all()
+    )
 
     for _, row in df.iterrows():
 
         normalized_name = normalize(row["name"])
 
-        # Prevent duplicates (based on name + country)
-        exists = (
-            db.query(Supplier)
-            .filter(
-                Supplier.normalized_name == normalized_name,
-                Supplier.country == row["country"],
-            )
-            .first()
-        )
-
-        if exists:
+        if (normalized_name, row["country"]) in existing:
             skipped += 1
             continue
 
+        existing.add((normalized_name, row["country"]))
+
         supplier = Supplier(
             name=row["name"],
             normalized_name=normalized_name,
@@ -50,11 +48,15 @@ def seed():
             organization_id=None,    # Global dataset
         )
 
-        db.add(supplier)
+        new_suppliers.append(supplier)
         inserted += 1
 
     try:
-        db.commit()
+        db.add_all(new_suppliers)
+        db.flush()
+
+        # Resolve the whole batch to GlobalEntities in one pass (commits)
+        resolve_supplier_entities_bulk(new_suppliers, db, resolution_method="SEED")
     except IntegrityError as e:
         db.rollback()
         print(f"Database integrity error: {e}")
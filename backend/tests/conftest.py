@@ -0,0 +1,127 @@
+import fnmatch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (registers every table on Base)
+from app.database import Base
+
+
+# =====================================================
+# IN-MEMORY SQLITE SESSION
+# =====================================================
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+# =====================================================
+# IN-PROCESS REDIS DOUBLE
+# =====================================================
+# Covers the string / list commands the services use; pipelines run
+# their commands in order on execute().
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    # strings
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        self.ttls[key] = ex
+        return True
+
+    def setex(self, key, ttl, value):
+        self.data[key] = str(value)
+        self.ttls[key] = ttl
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def exists(self, *keys):
+        return sum(1 for key in keys if key in self.data)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def keys(self, pattern="*"):
+        return [key for key in self.data if fnmatch.fnmatch(key, pattern)]
+
+    # lists
+    def _list(self, key):
+        return self.data.setdefault(key, [])
+
+    def rpush(self, key, *values):
+        self._list(key).extend(values)
+        return len(self.data[key])
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def ltrim(self, key, start, end):
+        self.data[key] = self.lrange(key, start, end)
+        return True
+
+    def lmove(self, source, destination, src="LEFT", dest="RIGHT"):
+        items = self.data.get(source, [])
+        if not items:
+            return None
+        value = items.pop(0 if src == "LEFT" else -1)
+        target = self._list(destination)
+        target.insert(0 if dest == "LEFT" else len(target), value)
+        return value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
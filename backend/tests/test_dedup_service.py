@@ -0,0 +1,114 @@
+from itertools import combinations
+
+from rapidfuzz import fuzz
+
+from app.core.normalization import core_name, normalize
+from app.models import DuplicateCandidate, GlobalEntity, Supplier
+from app.services import dedup_service
+
+RECORDS = [
+    # (id, normalized name, country, naics, scope)
+    (1, "acme industrial holdings", "US", None, 1),
+    (2, "acme industrial holding", "US", None, 1),
+    (3, "holdings acme industrial", "DE", None, 1),   # reordered, other country
+    (4, "acme industrial holdings", "US", None, 2),   # other tenant
+    (5, "northwind traders ltd", "GB", "4245", 1),
+    (6, "northwind tradres", "FR", "4245", 1),        # typo, only NAICS shared
+    (7, "globex manufacturing", "US", None, 1),
+]
+
+
+def brute_force_pairs(records):
+    """Every same-scope pair that shares a blocking key and scores high enough."""
+    pairs = set()
+    for a, b in combinations(records, 2):
+        if a[4] != b[4]:
+            continue
+        if not set(dedup_service.blocking_keys(a[1], a[2], a[3])) & set(
+            dedup_service.blocking_keys(b[1], b[2], b[3])
+        ):
+            continue
+        if fuzz.token_sort_ratio(core_name(a[1]), core_name(b[1])) >= dedup_service.DUPLICATE_THRESHOLD:
+            pairs.add(tuple(sorted((a[0], b[0]))))
+    return pairs
+
+
+# =====================================================
+# BLOCKING
+# =====================================================
+
+def test_blocking_keys():
+    assert dedup_service.blocking_keys("acme industrial holdings ltd", " US ", "3312") == [
+        "prefix:acme|us",
+        "tokens:acme holdings industrial",
+        "naics:3312|acme",
+    ]
+    assert dedup_service.blocking_keys("") == []
+
+
+def test_pairs_match_brute_force_over_blocks():
+    pairs = dedup_service.find_duplicate_pairs(RECORDS)
+
+    assert set(pairs) == brute_force_pairs(RECORDS)
+    assert set(pairs) == {(1, 2), (1, 3), (5, 6)}
+    assert pairs[(1, 3)] == (100.0, "tokens:acme holdings industrial")
+    assert pairs[(5, 6)][1] == "naics:4245|northwind"
+
+
+def test_oversized_prefix_blocks_are_split(monkeypatch):
+    monkeypatch.setattr(dedup_service, "MAX_BLOCK_SIZE", 2)
+    records = [
+        (1, "intel semiconductor", "US", None, 1),
+        (2, "intel semiconductors", "US", None, 1),
+        (3, "interface systems", "US", None, 1),
+        (4, "internal audit group", "US", None, 1),
+    ]
+
+    pairs = dedup_service.find_duplicate_pairs(records)
+
+    # Found through the longer-prefix sub-block, not the 4-record block
+    assert pairs[(1, 2)][1] == "prefix:inte|us|intel "
+    assert set(pairs) == {(1, 2)}
+
+
+# =====================================================
+# STORED CANDIDATES
+# =====================================================
+
+def add_supplier(db, supplier_id, name, organization_id=1, country="US"):
+    db.add(Supplier(id=supplier_id, name=name, normalized_name=normalize(name),
+                    country=country, organization_id=organization_id))
+
+
+def test_supplier_scan_is_per_tenant_and_idempotent(db):
+    add_supplier(db, 1, "Acme Industrial Holdings")
+    add_supplier(db, 2, "ACME Industrial Holding")
+    add_supplier(db, 3, "Acme Industrial Holdings", organization_id=2)
+    db.commit()
+
+    assert dedup_service.detect_supplier_duplicates(db) == 1
+
+    candidate = db.query(DuplicateCandidate).one()
+    assert (candidate.record_type, candidate.keep_id, candidate.duplicate_id) == ("SUPPLIER", 1, 2)
+
+    # A rejected proposal is not raised again
+    candidate.status = "REJECTED"
+    db.commit()
+    assert dedup_service.detect_supplier_duplicates(db) == 0
+    assert db.query(DuplicateCandidate).one().status == "REJECTED"
+
+
+def test_entity_scan_proposes_the_newer_name_as_alias(db):
+    db.add_all([
+        GlobalEntity(id=1, canonical_name="Globex Manufacturing", normalized_name="globex manufacturing"),
+        GlobalEntity(id=2, canonical_name="Globex Manufacturing Co.", normalized_name="globex manufacturing co"),
+        GlobalEntity(id=3, canonical_name="Globex Manufacturing", normalized_name="globex manufacturing",
+                     entity_type="INDIVIDUAL"),
+    ])
+    db.commit()
+
+    assert dedup_service.detect_entity_duplicates(db) == 1
+
+    candidate = db.query(DuplicateCandidate).one()
+    assert (candidate.keep_id, candidate.duplicate_id) == (1, 2)
+    assert candidate.proposed_alias == "Globex Manufacturing Co."
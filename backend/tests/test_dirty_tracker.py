@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from app.graph import dirty_tracker, risk_propagation
+from app.graph.dirty_tracker import DIRTY_EVENTS_KEY, PROCESSING_EVENTS_KEY
+
+
+@pytest.fixture
+def tracker(monkeypatch, fake_redis):
+    monkeypatch.setattr(dirty_tracker, "redis_client", fake_redis)
+    return fake_redis
+
+
+def pending(redis, key=DIRTY_EVENTS_KEY):
+    return [json.loads(raw) for raw in redis.lrange(key, 0, -1)]
+
+
+def test_claim_moves_events_to_processing_in_order(tracker):
+    for name in ["a", "b", "c"]:
+        dirty_tracker.record_sanction_change(name)
+
+    claimed, events = dirty_tracker.claim_events(limit=2)
+
+    assert claimed == 2
+    assert [e["entity"] for e in events] == ["a", "b"]
+    assert [e["entity"] for e in pending(tracker)] == ["c"]
+    assert [e["entity"] for e in pending(tracker, PROCESSING_EVENTS_KEY)] == ["a", "b"]
+
+
+def test_ack_drops_only_the_claimed_events(tracker):
+    dirty_tracker.record_sanction_change("a")
+    claimed, _ = dirty_tracker.claim_events()
+
+    # Claimed by an overlapping run after ours
+    tracker.rpush(PROCESSING_EVENTS_KEY, json.dumps({"kind": "sanction", "entity": "late"}))
+    dirty_tracker.ack_events(claimed)
+
+    assert [e["entity"] for e in pending(tracker, PROCESSING_EVENTS_KEY)] == ["late"]
+
+
+def test_unacknowledged_events_are_reclaimed(tracker):
+    dirty_tracker.record_sanction_change("a")
+    dirty_tracker.claim_events()
+
+    # The first run died before acknowledging
+    dirty_tracker.record_sanction_change("b")
+    claimed, events = dirty_tracker.claim_events()
+
+    assert claimed == 2
+    assert [e["entity"] for e in events] == ["a", "b"]
+
+
+def test_undecodable_entries_are_still_acknowledged(tracker):
+    tracker.rpush(DIRTY_EVENTS_KEY, "{not json")
+    claimed, events = dirty_tracker.claim_events()
+
+    assert (claimed, events) == (1, [])
+    dirty_tracker.ack_events(claimed)
+    assert tracker.llen(PROCESSING_EVENTS_KEY) == 0
+
+
+def test_failed_propagation_requeues_the_batch(tracker, monkeypatch):
+    monkeypatch.setattr(risk_propagation, "has_full_propagation", lambda: True)
+
+    def neo4j_down(*args, **kwargs):
+        raise ConnectionError("neo4j unavailable")
+
+    monkeypatch.setattr(risk_propagation, "get_session", neo4j_down)
+
+    dirty_tracker.record_edge_change("a", "b", "OWNS", None, 0.9)
+    dirty_tracker.record_sanction_change("b")
+
+    with pytest.raises(ConnectionError):
+        risk_propagation.apply_incremental_propagation()
+
+    assert tracker.llen(PROCESSING_EVENTS_KEY) == 0
+    assert {e["kind"] for e in pending(tracker)} == {"edge", "sanction"}
+
+
+def test_drop_keeps_events_recorded_after_the_snapshot(tracker):
+    dirty_tracker.record_sanction_change("a")
+    dirty_tracker.claim_events()
+    dirty_tracker.record_sanction_change("b")
+
+    covered = dirty_tracker.pending_event_count()
+    dirty_tracker.record_sanction_change("late")
+    dirty_tracker.drop_events(covered)
+
+    assert [e["entity"] for e in pending(tracker)] == ["late"]
+    assert tracker.llen(PROCESSING_EVENTS_KEY) == 0
+
+
+def test_lock_is_exclusive_and_released(tracker):
+    with dirty_tracker.propagation_lock() as first:
+        with dirty_tracker.propagation_lock() as second:
+            assert (first, second) == (True, False)
+        # The loser must not release the holder's lock
+        assert tracker.exists(dirty_tracker.PROPAGATION_LOCK_KEY)
+
+    assert not tracker.exists(dirty_tracker.PROPAGATION_LOCK_KEY)
@@ -0,0 +1,142 @@
+from datetime import date
+
+import pytest
+
+from app.models import EdgarCompany, EdgarFiling
+from app.services import edgar_service
+
+FORM_IDX = """Description:           Master Index of EDGAR Dissemination Feed by Form Type
+Last Data Received:    June 30, 2026
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+
+
+
+
+Form Type   Company Name                                                  CIK         Date Filed  File Name
+---------------------------------------------------------------------------------------------------------------------------------------------
+10-K        ACME CORP                                                     1000001     2026-05-09  edgar/data/1000001/0001000001-26-000001.txt
+10-K/A      ACME CORP                                                     1000001     2026-05-10  edgar/data/1000001/0001000001-26-000002.txt
+4           JANE INSIDER                                                  1000009     2026-05-10  edgar/data/1000009/0001000009-26-000001.txt
+8-K         GLOBEX HOLDINGS, INC.                                         1000002     2026-05-11  edgar/data/1000002/0001000002-26-000001.txt
+8-K         BROKEN DATE CO                                                1000003     2026-13-45  edgar/data/1000003/0001000003-26-000001.txt
+
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=""):
+        self.status_code = status_code
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def iter_lines(self):
+        for line in self.body.splitlines():
+            yield line.encode("latin-1")
+
+
+@pytest.fixture
+def sec(monkeypatch):
+    """Serves FORM_IDX as 2026 Q2, 404 for every other quarter."""
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url == edgar_service.EDGAR_FULL_INDEX_URL.format(year=2026, quarter=2):
+            return FakeResponse(200, FORM_IDX)
+        return FakeResponse(404)
+
+    monkeypatch.setattr(edgar_service.requests, "get", fake_get)
+    monkeypatch.setattr(edgar_service.time, "sleep", lambda seconds: None)
+    return requested
+
+
+# =====================================================
+# form.idx PARSING
+# =====================================================
+
+def test_quarters_since_crosses_year_boundary():
+    quarters = list(edgar_service._quarters_since(date(2025, 11, 30), date(2026, 4, 1)))
+    assert quarters == [(2025, 4), (2026, 1), (2026, 2)]
+
+
+def test_iter_form_index_reads_fixed_width_columns(sec):
+    rows = list(edgar_service.iter_form_index(2026, 2))
+
+    assert rows == [
+        ("10-K", "ACME CORP", "1000001", date(2026, 5, 9),
+         "edgar/data/1000001/0001000001-26-000001.txt"),
+        ("10-K/A", "ACME CORP", "1000001", date(2026, 5, 10),
+         "edgar/data/1000001/0001000001-26-000002.txt"),
+        ("8-K", "GLOBEX HOLDINGS, INC.", "1000002", date(2026, 5, 11),
+         "edgar/data/1000002/0001000002-26-000001.txt"),
+    ]
+
+
+def test_iter_form_index_missing_quarter_is_empty(sec):
+    assert list(edgar_service.iter_form_index(2030, 1)) == []
+
+
+# =====================================================
+# INCREMENTAL REFRESH
+# =====================================================
+
+def test_refresh_rescans_latest_filing_date(db, sec):
+    # Stored before the nightly rebuild added the rest of 2026-05-10
+    db.add(EdgarFiling(cik="1000001", form_type="10-K", date_filed=date(2026, 5, 9),
+                       filename="edgar/data/1000001/0001000001-26-000001.txt"))
+    db.add(EdgarFiling(cik="1000009", form_type="8-K", date_filed=date(2026, 5, 10),
+                       filename="edgar/data/1000009/0001000009-26-000099.txt"))
+    db.commit()
+
+    edgar_service.refresh_edgar_index(db)
+
+    filed = {(row.cik, row.date_filed) for row in db.query(EdgarFiling)}
+    assert filed == {
+        ("1000001", date(2026, 5, 9)),
+        ("1000009", date(2026, 5, 10)),
+        ("1000001", date(2026, 5, 10)),
+        ("1000002", date(2026, 5, 11)),
+    }
+    assert db.query(EdgarCompany).filter_by(cik="1000002").one().name == "GLOBEX HOLDINGS, INC."
+
+    # Running again adds nothing new
+    edgar_service.refresh_edgar_index(db)
+    assert db.query(EdgarFiling).count() == 4
+
+
+# =====================================================
+# LOCAL LOOKUP (SQLITE FALLBACK)
+# =====================================================
+
+def test_fallback_ranks_candidates_on_every_query_token(db, monkeypatch):
+    monkeypatch.setattr(edgar_service, "COMPANY_CANDIDATES", 2)
+    db.add_all([
+        EdgarCompany(cik="1000001", name="THE ALPHA GROUP", normalized_name="the alpha group"),
+        EdgarCompany(cik="1000002", name="THE BETA GROUP", normalized_name="the beta group"),
+        EdgarCompany(cik="1000003", name="THE BOEING CO", normalized_name="the boeing co"),
+        EdgarCompany(cik="1000004", name="ACME_WIDGETS INC", normalized_name="acme_widgets inc"),
+        EdgarCompany(cik="1000005", name="ACMEXWIDGETS INC", normalized_name="acmexwidgets inc"),
+    ])
+    db.commit()
+
+    # "the%" alone used to fill the candidate limit with the wrong companies
+    matches = edgar_service.match_edgar_companies(db, "The Boeing Company")
+    assert [cik for cik, _, _ in matches] == ["1000003"]
+
+    # Equal token matches: closest name length first
+    candidates = edgar_service._candidate_companies(db, "the group")
+    assert [row.cik for row in candidates] == ["1000002", "1000001"]
+
+    # "_" is matched literally, not as a wildcard
+    candidates = edgar_service._candidate_companies(db, "acme_widgets")
+    assert [row.cik for row in candidates] == ["1000004"]
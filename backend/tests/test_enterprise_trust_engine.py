@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+
+import pytest
+
+from app.graph.graph_engine import RelationGraph
+from app.models import GlobalEntity, TrustModelConfig
+from app.services import enterprise_trust_engine
+
+# A (sanctioned) -OWNS-> B -CONTROLS-> C, acyclic so both paths agree
+NAMES = ["A", "B", "C"]
+EDGES = [("A", "B", "OWNS", 0.9), ("B", "C", "CONTROLS", 1.0)]
+WEIGHTS = {"OWNS": 1.0, "CONTROLS": 0.8}
+
+
+def make_graph():
+    index = {name: i for i, name in enumerate(NAMES)}
+    return RelationGraph(
+        NAMES,
+        [name == "A" for name in NAMES],
+        [index[a] for a, _, _, _ in EDGES],
+        [index[b] for _, b, _, _ in EDGES],
+        [rel_type for _, _, rel_type, _ in EDGES],
+        [confidence for _, _, _, confidence in EDGES],
+    )
+
+
+class FakePath:
+    def __init__(self, edges):
+        self.relationships = [{"type": rel_type, "confidence": confidence} for _, _, rel_type, confidence in edges]
+
+
+class FakeResult(list):
+    def single(self):
+        return self[0] if self else None
+
+
+class FakeNeo4jSession:
+    """Answers the path query with every path out of A, then its sanction flag."""
+
+    def run(self, query, name):
+        if "RETURN path" in query:
+            return FakeResult({"path": FakePath(EDGES[:hops])} for hops in range(1, len(EDGES) + 1))
+        return FakeResult([{"sanctioned": True}])
+
+
+@pytest.fixture
+def scenario(db):
+    db.add(GlobalEntity(id=1, canonical_name="A", normalized_name="a"))
+    db.add(TrustModelConfig(
+        model_name="OFAC_MODE", version="v1", relationship_weights=WEIGHTS,
+        sanction_boost=1.5, depth_limit=4, decay_factor=1.0, active=True,
+    ))
+    db.commit()
+    return "OFAC_MODE"
+
+
+def breakdown_keys(result):
+    return {key for entry in result["explainability"] for key in entry}
+
+
+def test_snapshot_and_live_breakdowns_share_keys(db, scenario, monkeypatch):
+    @contextmanager
+    def fake_session():
+        yield FakeNeo4jSession()
+
+    monkeypatch.setattr(enterprise_trust_engine, "get_read_session", fake_session)
+
+    monkeypatch.setattr(enterprise_trust_engine, "active_snapshot", lambda: None)
+    live = enterprise_trust_engine.calculate_trust_score("A", scenario, db)
+
+    monkeypatch.setattr(enterprise_trust_engine, "active_snapshot", make_graph)
+    offline = enterprise_trust_engine.calculate_trust_score("A", scenario, db)
+
+    assert breakdown_keys(offline) == breakdown_keys(live) == {"depth", "path_score", "sanction_boost"}
+    assert offline["score"] == pytest.approx(live["score"])
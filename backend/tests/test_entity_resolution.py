@@ -0,0 +1,222 @@
+import pytest
+
+from app.models import GlobalEntity, GlobalEntityAlias
+from app.services import entity_index, entity_resolution_service
+from app.services.entity_index import CDIST_MIN_BATCH, EntityResolutionIndex
+
+
+@pytest.fixture
+def index():
+    idx = EntityResolutionIndex()
+    for entity_id, name in enumerate([
+        "acme industrial holdings",
+        "northwind traders ltd",
+        "globex manufacturing co",
+        "initech software",
+    ], start=1):
+        idx.add_entity(entity_id, name)
+    return idx
+
+
+@pytest.fixture
+def no_cdist(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("small batches must not scan the whole index")
+
+    monkeypatch.setattr(entity_index.process, "cdist", fail)
+
+
+# =====================================================
+# match_many: POSTINGS FOR SMALL BATCHES, CDIST FOR BULK
+# =====================================================
+
+def test_single_name_uses_trigram_postings(index, no_cdist):
+    results = index.match_many(["acme industrail holdings"])
+
+    entity_id, confidence, method = results["acme industrail holdings"]
+    assert (entity_id, method) == (1, "FUZZY")
+    assert 0 < confidence <= entity_index.FUZZY_MAX_CONFIDENCE
+
+
+def test_core_name_tier_before_fuzzy(index, no_cdist):
+    assert index.match_many(["northwind traders"]) == {
+        "northwind traders": (2, entity_index.CORE_NAME_CONFIDENCE, "CORE_NAME"),
+    }
+
+
+def test_bulk_batch_agrees_with_small_batch_path(index):
+    probes = ["globex manufacturng", "initech sofware", "unrelated name"]
+    padding = [f"zz filler {i}" for i in range(CDIST_MIN_BATCH)]
+
+    small = index.match_many(probes)
+    bulk = index.match_many(probes + padding)
+
+    assert {name: bulk[name] for name in small} == small
+    assert "unrelated name" not in bulk
+    assert not any(name in bulk for name in padding)
+
+
+# =====================================================
+# resolve_entities_bulk (SQLITE)
+# =====================================================
+
+@pytest.fixture
+def resolver(db, monkeypatch):
+    graph_nodes = []
+    fresh_index = EntityResolutionIndex()
+
+    monkeypatch.setattr(entity_resolution_service, "get_entity_index", lambda session: fresh_index)
+    monkeypatch.setattr(entity_resolution_service, "notify_index_change", lambda: None)
+    monkeypatch.setattr(entity_resolution_service, "create_global_entity_nodes", graph_nodes.extend)
+
+    db.add_all([
+        GlobalEntity(id=1, canonical_name="Acme Industrial Holdings", normalized_name="acme industrial holdings"),
+        GlobalEntity(id=2, canonical_name="Northwind Traders Ltd", normalized_name="northwind traders ltd"),
+        GlobalEntityAlias(id=1, entity_id=2, alias="NWT", normalized_alias="nwt"),
+    ])
+    db.commit()
+
+    fresh_index._load_new_rows(db)
+    fresh_index.loaded = True
+    fresh_index.graph_nodes = graph_nodes
+    return fresh_index
+
+
+def test_bulk_resolution_tiers(db, resolver):
+    resolved = entity_resolution_service.resolve_entities_bulk(
+        ["ACME Industrial Holdings", "nwt", "Northwind Traders", "Acme Industrail Holdings", "Brand New Co"],
+        db,
+    )
+
+    assert resolved["ACME Industrial Holdings"][0].id == 1
+    assert resolved["ACME Industrial Holdings"][1] == 1.0
+    alias_entity, alias_confidence = resolved["nwt"]
+    assert (alias_entity.id, alias_confidence) == (2, entity_index.ALIAS_CONFIDENCE)
+    assert resolved["Northwind Traders"][0].id == 2
+    assert resolved["Acme Industrail Holdings"][0].id == 1
+
+    created = resolved["Brand New Co"][0]
+    assert created.id not in (1, 2)
+    assert created.normalized_name == "brand new co"
+    assert [node["canonical_name"] for node in resolver.graph_nodes] == ["Brand New Co"]
+
+
+def test_new_names_sharing_a_core_create_one_entity(db, resolver):
+    resolved = entity_resolution_service.resolve_entities_bulk(["Zenith Ltd", "Zenith"], db)
+
+    assert resolved["Zenith Ltd"][0].id == resolved["Zenith"][0].id
+    assert db.query(GlobalEntity).filter(GlobalEntity.normalized_name.like("zenith%")).count() == 1
+
+
+# =====================================================
+# lookup TIERS AND VERSIONED REFRESH
+# =====================================================
+
+def test_lookup_tier_order(index):
+    index.add_alias(1, 3, "gmc")
+    index.add_alias(2, 4, "acme industrial holdings")
+
+    # A canonical name wins over an alias spelled the same way
+    assert index.lookup("acme industrial holdings") == (1, entity_index.CANONICAL_CONFIDENCE, "CANONICAL")
+    assert index.lookup("gmc") == (3, entity_index.ALIAS_CONFIDENCE, "ALIAS")
+    assert index.lookup("globex manufacturing") == (3, entity_index.CORE_NAME_CONFIDENCE, "CORE_NAME")
+    assert index.lookup("initech sofware")[::2] == (4, "FUZZY")
+    assert index.lookup("completely different") is None
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_redis):
+    from app.worker import celery_app
+
+    monkeypatch.setattr(celery_app, "redis_client", fake_redis)
+    now = [1000.0]
+    monkeypatch.setattr(entity_index.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_refresh_tops_up_on_version_change(db, clock):
+    db.add(GlobalEntity(id=1, canonical_name="Acme", normalized_name="acme"))
+    db.commit()
+
+    idx = EntityResolutionIndex()
+    idx.refresh(db)
+    assert idx.lookup("acme")[0] == 1
+
+    db.add_all([
+        GlobalEntity(id=2, canonical_name="Globex", normalized_name="globex"),
+        GlobalEntityAlias(id=1, entity_id=2, alias="GBX", normalized_alias="gbx"),
+    ])
+    db.commit()
+    entity_index.notify_index_change()
+
+    # Version is only re-read every VERSION_CHECK_SECONDS
+    idx.refresh(db)
+    assert idx.lookup("globex") is None
+
+    clock[0] += entity_index.VERSION_CHECK_SECONDS
+    idx.refresh(db)
+    assert idx.lookup("globex")[0] == 2
+    assert idx.lookup("gbx") == (2, entity_index.ALIAS_CONFIDENCE, "ALIAS")
+    assert (idx.max_entity_id, idx.max_alias_id) == (2, 1)
+
+
+def test_hourly_full_reload_drops_deleted_rows(db, clock):
+    db.add_all([
+        GlobalEntity(id=1, canonical_name="Acme", normalized_name="acme"),
+        GlobalEntity(id=2, canonical_name="Globex", normalized_name="globex"),
+    ])
+    db.commit()
+
+    idx = EntityResolutionIndex()
+    idx.refresh(db)
+
+    db.query(GlobalEntity).filter_by(id=2).delete()
+    db.commit()
+
+    # No new rows and no version change: nothing reloaded
+    clock[0] += entity_index.VERSION_CHECK_SECONDS
+    idx.refresh(db)
+    assert idx.lookup("globex")[0] == 2
+
+    clock[0] += entity_index.FULL_RELOAD_SECONDS
+    idx.refresh(db)
+    assert idx.lookup("globex") is None
+    assert idx.lookup("acme")[0] == 1
+
+
+# =====================================================
+# resolve_supplier_entities_bulk: FINGERPRINT AFTER GRAPH SYNC
+# =====================================================
+
+def test_failed_graph_sync_is_retried_on_the_next_run(db, resolver, monkeypatch):
+    from app.models import Supplier, SupplierEntityLink
+
+    db.add(Supplier(id=10, name="Acme Industrial Holdings", normalized_name="acme industrial holdings",
+                    organization_id=1))
+    db.commit()
+    supplier = db.get(Supplier, 10)
+
+    synced = []
+
+    def neo4j_down(rows):
+        raise ConnectionError("neo4j unavailable")
+
+    monkeypatch.setattr(entity_resolution_service, "link_suppliers_to_entities", neo4j_down)
+    with pytest.raises(ConnectionError):
+        entity_resolution_service.resolve_supplier_entities_bulk([supplier], db)
+
+    link = db.query(SupplierEntityLink).one()
+    assert (link.entity_id, link.resolution_fingerprint) == (1, None)
+
+    monkeypatch.setattr(entity_resolution_service, "link_suppliers_to_entities", synced.extend)
+    assert entity_resolution_service.resolve_supplier_entities_bulk([supplier], db)[10].id == 1
+    assert [row["supplier_name"] for row in synced] == ["Acme Industrial Holdings"]
+
+    link = db.query(SupplierEntityLink).one()
+    assert link.resolution_fingerprint == entity_resolution_service.resolution_fingerprint(
+        "Acme Industrial Holdings", None,
+    )
+
+    # Linked and fingerprinted: the fast path skips the graph
+    entity_resolution_service.resolve_supplier_entities_bulk([supplier], db)
+    assert len(synced) == 1
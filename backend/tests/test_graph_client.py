@@ -0,0 +1,111 @@
+import pytest
+from neo4j.exceptions import AuthError, CypherSyntaxError, ServiceUnavailable
+
+from app.graph import graph_client
+from app.graph.graph_client import CircuitBreaker
+
+
+class FakeSession:
+    def __init__(self, error=None):
+        self.error = error
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+        return False
+
+    def run(self, query, **params):
+        if self.error:
+            raise self.error
+        return []
+
+
+class FakeDriver:
+    def __init__(self, session_error=None, connect_error=None):
+        self.session_error = session_error
+        self.connect_error = connect_error
+        self.closed = False
+
+    def verify_connectivity(self):
+        if self.connect_error:
+            raise self.connect_error
+
+    def session(self, **kwargs):
+        return FakeSession(self.session_error)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def neo4j(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    monkeypatch.setattr(graph_client, "breaker", breaker)
+    monkeypatch.setattr(graph_client, "driver", None)
+
+    def install(**kwargs):
+        fake = FakeDriver(**kwargs)
+        monkeypatch.setattr(graph_client.GraphDatabase, "driver", lambda *a, **k: fake)
+        return fake
+
+    install.breaker = breaker
+    return install
+
+
+def test_session_failures_trip_the_breaker(neo4j):
+    neo4j(session_error=ServiceUnavailable("cluster gone"))
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailable):
+            with graph_client.get_session() as session:
+                session.run("RETURN 1")
+
+    assert neo4j.breaker.is_open
+    assert graph_client.driver is None
+
+    with pytest.raises(RuntimeError, match="circuit open"):
+        with graph_client.get_session():
+            pass
+
+
+def test_query_errors_do_not_count_as_outages(neo4j):
+    neo4j(session_error=CypherSyntaxError("bad query"))
+
+    with pytest.raises(CypherSyntaxError):
+        with graph_client.get_read_session() as session:
+            session.run("RETRUN 1")
+
+    assert neo4j.breaker.failures == 0
+
+
+def test_clean_session_closes_the_breaker(neo4j):
+    neo4j()
+    neo4j.breaker.record_failure()
+
+    with graph_client.get_session() as session:
+        session.run("RETURN 1")
+
+    assert neo4j.breaker.failures == 0
+
+
+def test_auth_error_closes_the_candidate_driver(neo4j):
+    fake = neo4j(connect_error=AuthError("wrong password"))
+
+    with pytest.raises(AuthError):
+        graph_client.get_driver()
+
+    assert fake.closed
+    assert graph_client.driver is None
+    assert neo4j.breaker.failures == 1
+
+
+def test_unreachable_cluster_reports_unavailable(neo4j):
+    fake = neo4j(connect_error=ServiceUnavailable("no route"))
+
+    with pytest.raises(RuntimeError, match="connection failed"):
+        graph_client.get_driver()
+
+    assert fake.closed
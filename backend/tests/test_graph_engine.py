@@ -0,0 +1,119 @@
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from app.graph import dirty_tracker, risk_propagation
+from app.graph.graph_engine import RelationGraph, propagate_exposure, exposure_to_score, relation_weight
+from app.graph.supplier_graph_service import MAX_DEPTH
+
+# Small graph with a cycle (A <-> B), parallel edges (C -> S twice) and
+# a sanctioned entity that also has outgoing edges (S -> T)
+NAMES = ["A", "B", "C", "D", "S", "T", "U"]
+SANCTIONED = {"S", "T"}
+EDGES = [
+    ("A", "B", "OWNS", 0.9),
+    ("B", "A", "PARTNER_OF", 0.7),
+    ("B", "C", "CONTROLS", 1.0),
+    ("C", "S", "SUBSIDIARY_OF", 0.8),
+    ("C", "S", "MENTIONED_WITH", None),
+    ("D", "C", "UNKNOWN_TYPE", 0.6),
+    ("S", "T", "OWNS", 1.0),
+    ("A", "T", "ASSOCIATED_WITH", 0.5),
+]
+
+
+def make_graph():
+    index = {name: i for i, name in enumerate(NAMES)}
+    return RelationGraph(
+        NAMES,
+        [name in SANCTIONED for name in NAMES],
+        [index[a] for a, _, _, _ in EDGES],
+        [index[b] for _, b, _, _ in EDGES],
+        [rel_type for _, _, rel_type, _ in EDGES],
+        [0.5 if confidence is None else confidence for _, _, _, confidence in EDGES],
+    )
+
+
+def brute_force_exposure(start, depth):
+    """Sum over every walk of at most `depth` hops ending on a sanctioned entity."""
+    total = 0.0
+    stack = [(start, 0, 1.0)]
+
+    while stack:
+        node, hops, weight = stack.pop()
+        if node in SANCTIONED:
+            total += weight / (hops + 1)
+        if hops == depth:
+            continue
+        for source, target, rel_type, confidence in EDGES:
+            if source == node:
+                stack.append((target, hops + 1, weight * relation_weight(rel_type, confidence)))
+
+    return total
+
+
+# =====================================================
+# CSR PROPAGATION
+# =====================================================
+
+@pytest.mark.parametrize("depth", [1, 2, MAX_DEPTH])
+def test_propagation_matches_walk_enumeration(depth):
+    exposure = propagate_exposure(make_graph(), depth)
+
+    for i, name in enumerate(NAMES):
+        assert exposure[i] == pytest.approx(brute_force_exposure(name, depth)), name
+
+
+def test_unreachable_entity_has_no_exposure():
+    graph = make_graph()
+    exposure = propagate_exposure(graph)
+
+    assert exposure[graph.index["U"]] == 0.0
+    assert exposure[graph.index["T"]] == 1.0
+
+
+def test_scores_are_capped_at_100():
+    scores = exposure_to_score(np.array([0.0, 0.123456, 0.5, 3.0]))
+    assert scores.tolist() == [0.0, 12.35, 50.0, 100.0]
+
+
+def test_outgoing_edges_index():
+    graph = make_graph()
+    out = graph.outgoing_edges(graph.index["C"])
+    assert sorted(graph.edge_types[i] for i in out) == ["MENTIONED_WITH", "SUBSIDIARY_OF"]
+    assert len(graph.outgoing_edges(graph.index["U"])) == 0
+
+
+# =====================================================
+# WHOLE-GRAPH BATCH JOB
+# =====================================================
+
+def test_batch_job_writes_every_entity_in_batches(monkeypatch, fake_redis):
+    written = []
+
+    class RecordingSession:
+        def run(self, query, rows):
+            written.append(rows)
+
+    @contextmanager
+    def fake_session():
+        yield RecordingSession()
+
+    monkeypatch.setattr(dirty_tracker, "redis_client", fake_redis)
+    monkeypatch.setattr(risk_propagation, "get_session", fake_session)
+    monkeypatch.setattr(risk_propagation, "get_read_session", fake_session)
+    monkeypatch.setattr(risk_propagation, "load_relation_graph", lambda session, include_suppliers: make_graph())
+    monkeypatch.setattr(risk_propagation, "WRITE_BATCH_SIZE", 3)
+
+    result = risk_propagation.run_batch_risk_propagation()
+
+    assert result["entities"] == len(NAMES)
+    assert result["relations"] == len(EDGES)
+    assert [len(batch) for batch in written] == [3, 3, 1]
+
+    rows = {row["name"]: row for batch in written for row in batch}
+    for name in NAMES:
+        expected = brute_force_exposure(name, MAX_DEPTH)
+        assert rows[name]["exposure"] == pytest.approx(expected)
+        assert rows[name]["score"] == min(round(expected * 100, 2), 100.0)
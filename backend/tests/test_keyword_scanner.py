@@ -0,0 +1,77 @@
+import json
+import re
+
+import pytest
+
+from app.core import keyword_scanner
+from app.core.keyword_scanner import DEFAULT_RISK_KEYWORDS, KeywordHit, KeywordScanner
+
+TEXTS = [
+    "Acme was FINED after a money   laundering investigation; sanctions followed.",
+    "Regulators define new rules; the finest suppliers refined their process.",
+    "Bankruptcy filing after the company defaulted on bonds amid fraud claims.",
+    "Embargoed goods seized. Seizures and penalties, plus a fine and a penalty.",
+    "",
+]
+
+
+def naive_keywords(keyword_sets, text):
+    """One regex per keyword, no alternation: the distinct keywords present."""
+    found = set()
+    for weighted in keyword_sets.values():
+        for keyword in weighted:
+            literal = keyword.rstrip("*")
+            pattern = r"\b" + r"\s+".join(re.escape(w) for w in literal.split())
+            pattern += r"\w*" if keyword.endswith("*") else r"\b"
+            if re.search(pattern, text, re.IGNORECASE):
+                found.add(literal)
+    return found
+
+
+def test_hits_carry_keyword_category_and_positions():
+    text = TEXTS[0]
+    hits = KeywordScanner(DEFAULT_RISK_KEYWORDS).scan(text)
+
+    assert hits == [
+        KeywordHit("fined", "legal", 1.0, 9, 14),
+        KeywordHit("money laundering", "financial_crime", 1.5, 23, 41),
+        KeywordHit("investigation", "legal", 1.0, 42, 55),
+        KeywordHit("sanction", "sanctions", 1.5, 57, 66),
+    ]
+    assert [text[h.start:h.end] for h in hits] == ["FINED", "money   laundering", "investigation", "sanctions"]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_single_pass_finds_what_per_keyword_scans_find(text):
+    scanner = KeywordScanner(DEFAULT_RISK_KEYWORDS)
+    assert set(scanner.matched_keywords(text)) == naive_keywords(DEFAULT_RISK_KEYWORDS, text)
+
+
+def test_word_boundaries():
+    scanner = KeywordScanner(DEFAULT_RISK_KEYWORDS)
+    assert scanner.scan(TEXTS[1]) == []
+    assert scanner.matched_keywords("a fine, then fined again") == ["fine", "fined"]
+
+
+def test_score_counts_each_keyword_once():
+    scanner = KeywordScanner({"legal": {"fine": 0.5, "lawsuit*": 1.0}, "other": {"recall": 2}})
+
+    assert scanner.score("Fine. Fine. Lawsuits and a lawsuit.") == 1.5
+    assert scanner.score("nothing here") == 0
+    assert KeywordScanner({}).scan("fine") == []
+
+
+def test_keywords_file_overrides_defaults(tmp_path, monkeypatch):
+    path = tmp_path / "keywords.json"
+    path.write_text(json.dumps({"custom": {"recall*": 2.0}}))
+
+    monkeypatch.setattr(keyword_scanner, "RISK_KEYWORDS_FILE", str(path))
+    keyword_scanner.get_risk_scanner.cache_clear()
+    try:
+        assert keyword_scanner.get_risk_scanner().score("Product recalls and sanctions") == 2.0
+
+        monkeypatch.setattr(keyword_scanner, "RISK_KEYWORDS_FILE", str(tmp_path / "missing.json"))
+        keyword_scanner.get_risk_scanner.cache_clear()
+        assert keyword_scanner.get_risk_scanner().matched_keywords("sanctions") == ["sanction"]
+    finally:
+        keyword_scanner.get_risk_scanner.cache_clear()
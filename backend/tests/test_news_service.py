@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import text
+
+from app.core.normalization import normalize
+from app.models import NewsArticle, Supplier, SupplierNewsState
+from app.services import external_intelligence_service, news_service
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+
+
+class FakeGNews:
+    """Answers like GNews search: newest first, `from` / `to` inclusive, capped pages."""
+
+    def __init__(self, count):
+        self.articles = [
+            {
+                "url": f"https://news.example/{i}",
+                "title": f"Article {i}",
+                "description": "",
+                "publishedAt": (NOW - timedelta(hours=i + 1)).strftime(news_service.GNEWS_DATE_FORMAT),
+            }
+            for i in range(count)
+        ]
+        self.calls = []
+
+    def publish(self, hours_ago, url):
+        self.articles.append({
+            "url": url,
+            "title": url,
+            "description": "",
+            "publishedAt": (NOW - timedelta(hours=hours_ago)).strftime(news_service.GNEWS_DATE_FORMAT),
+        })
+
+    def __call__(self, name, since, until=None):
+        self.calls.append((since, until))
+        window = [
+            a for a in self.articles
+            if since <= news_service._parse_published(a["publishedAt"])
+            and (until is None or news_service._parse_published(a["publishedAt"]) <= until)
+        ]
+        window.sort(key=lambda a: a["publishedAt"], reverse=True)
+        return window[:news_service.GNEWS_MAX_ARTICLES]
+
+
+@pytest.fixture
+def gnews(monkeypatch):
+    monkeypatch.setattr(news_service, "GNEWS_API_KEY", "test-key")
+    monkeypatch.setattr(news_service, "NEWS_REQUESTS_PER_RUN", 4)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return NOW
+
+    monkeypatch.setattr(news_service, "datetime", FrozenDatetime)
+
+    def install(count):
+        api = FakeGNews(count)
+        monkeypatch.setattr(news_service, "_fetch_articles", api)
+        return api
+
+    return install
+
+
+def watched_supplier(db, supplier_id=1, name="Acme Corp"):
+    db.add(Supplier(id=supplier_id, name=name, normalized_name=normalize(name), organization_id=1))
+    db.commit()
+    news_service.watch_supplier(db, supplier_id)
+    db.commit()
+    return db.get(SupplierNewsState, supplier_id)
+
+
+def stored_urls(db):
+    return {url for (url,) in db.query(NewsArticle.url)}
+
+
+# =====================================================
+# WATCH LIST
+# =====================================================
+
+def test_watch_supplier_leaves_caller_transaction_open(db):
+    db.add(Supplier(id=1, name="Acme Corp", normalized_name="acme corp", organization_id=1))
+    db.commit()
+
+    db.add(Supplier(id=2, name="Pending Ltd", normalized_name="pending", organization_id=1))
+    news_service.watch_supplier(db, 1)
+    db.rollback()
+
+    # Neither the caller's pending row nor the enrollment was committed
+    assert db.get(Supplier, 2) is None
+    assert db.get(SupplierNewsState, 1) is None
+
+    news_service.watch_supplier(db, 1)
+    news_service.watch_supplier(db, 1)
+    db.commit()
+    assert db.query(SupplierNewsState).count() == 1
+
+
+def test_news_risk_signal_does_not_enroll(db):
+    db.add(Supplier(id=1, name="Acme Corp", normalized_name="acme corp", organization_id=1))
+    db.commit()
+
+    assert external_intelligence_service.news_risk_signal(1, db) == 0
+    db.commit()
+    assert db.query(SupplierNewsState).count() == 0
+
+
+def test_failed_news_signal_keeps_caller_transaction(db, monkeypatch):
+    def broken_read(db, supplier_id):
+        db.execute(text("SELECT risk_score FROM missing_table"))
+
+    monkeypatch.setattr(external_intelligence_service, "news_risk_score", broken_read)
+
+    db.add(Supplier(id=1, name="Acme Corp", normalized_name="acme corp", organization_id=1))
+    assert external_intelligence_service.news_risk_signal(1, db) == 0
+
+    db.commit()
+    assert db.get(Supplier, 1) is not None
+
+
+# =====================================================
+# INCREMENTAL CURSOR
+# =====================================================
+
+def test_small_window_advances_cursor_to_newest(db, gnews):
+    api = gnews(3)
+    state = watched_supplier(db)
+
+    assert news_service.ingest_watched_news(db) == 3
+    assert len(api.calls) == 1
+    assert state.last_published_at == NOW - timedelta(hours=1)
+    assert state.last_checked_at == NOW
+
+
+def test_full_pages_are_paged_back_before_cursor_moves(db, gnews):
+    api = gnews(25)
+    state = watched_supplier(db)
+
+    assert news_service.ingest_watched_news(db) == 25
+    assert stored_urls(db) == {a["url"] for a in api.articles}
+
+    # Second and third requests page back from the oldest stored article
+    assert api.calls[0][1] is None
+    assert api.calls[1][1] == NOW - timedelta(hours=10)
+    assert api.calls[2][1] == NOW - timedelta(hours=19)
+    assert state.last_published_at == NOW - timedelta(hours=1)
+
+
+def test_gap_left_by_exhausted_budget_resumes_next_run(db, gnews, monkeypatch):
+    monkeypatch.setattr(news_service, "NEWS_REQUESTS_PER_RUN", 2)
+    api = gnews(25)
+    state = watched_supplier(db)
+
+    assert news_service.ingest_watched_news(db) == 19
+    # Older articles are still missing: the cursor has not moved
+    assert state.last_published_at is None
+
+    api.publish(0.5, "https://news.example/fresh")
+
+    # The next run finishes the gap before asking for anything newer
+    assert news_service.ingest_watched_news(db) == 6
+    assert "https://news.example/fresh" not in stored_urls(db)
+    assert state.last_published_at == NOW - timedelta(hours=1)
+
+    assert news_service.ingest_watched_news(db) == 1
+    assert stored_urls(db) == {a["url"] for a in api.articles}
+    assert state.last_published_at == NOW - timedelta(minutes=30)
+
+
+def test_failed_request_keeps_cursor(db, gnews, monkeypatch):
+    gnews(3)
+    state = watched_supplier(db)
+    news_service.ingest_watched_news(db)
+    cursor = state.last_published_at
+
+    monkeypatch.setattr(news_service, "_fetch_articles", lambda name, since, until=None: None)
+
+    assert news_service.ingest_watched_news(db) == 0
+    assert state.last_published_at == cursor
+
+
+# =====================================================
+# LOCAL READS
+# =====================================================
+
+def test_news_risk_score_ignores_undated_articles(db):
+    db.add(Supplier(id=1, name="Acme Corp", normalized_name="acme corp", organization_id=1))
+    for i in range(news_service.NEWS_SIGNAL_ARTICLES):
+        db.add(NewsArticle(supplier_id=1, url=f"u{i}", published_at=NOW - timedelta(days=i), risk_score=2))
+    db.add(NewsArticle(supplier_id=1, url="undated", published_at=None, risk_score=25))
+    db.commit()
+
+    assert news_service.news_risk_score(db, 1) == 2 * news_service.NEWS_SIGNAL_ARTICLES
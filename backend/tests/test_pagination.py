@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import pagination
+from app.models import AssessmentHistory, AuditLog, Supplier
+from app.routes.supplier import list_suppliers_with_status
+
+START = datetime(2026, 1, 1, 9, 30)
+
+
+@pytest.fixture
+def audit_rows(db):
+    # Seven rows per timestamp: pages have to split ties on id
+    db.add_all([
+        AuditLog(id=i, action="VIEW", resource_type="Supplier", timestamp=START + timedelta(minutes=i % 3))
+        for i in range(1, 22)
+    ])
+    db.commit()
+    return sorted(db.query(AuditLog).all(), key=lambda r: (r.timestamp, r.id), reverse=True)
+
+
+def walk(query, sort_expr, id_column, limit, **kwargs):
+    rows, cursors, cursor = [], [], None
+    while True:
+        page, cursor = pagination.keyset_page(query, sort_expr, id_column, cursor=cursor, limit=limit, **kwargs)
+        rows.extend(page)
+        cursors.append(cursor)
+        if cursor is None:
+            return rows, cursors
+
+
+def test_pages_are_continuous_across_timestamp_ties(db, audit_rows):
+    rows, cursors = walk(db.query(AuditLog), AuditLog.timestamp, AuditLog.id, limit=5)
+
+    assert [r.id for r in rows] == [r.id for r in audit_rows]
+    assert len(cursors) == 5 and cursors[-1] is None
+
+
+def test_ascending_pages_with_filter(db, audit_rows):
+    db.add(AuditLog(id=100, action="DELETE", resource_type="Supplier", timestamp=START))
+    db.commit()
+
+    query = db.query(AuditLog).filter(AuditLog.action == "VIEW")
+    rows, _ = walk(query, AuditLog.timestamp, AuditLog.id, limit=4, descending=False)
+
+    assert [r.id for r in rows] == [r.id for r in reversed(audit_rows)]
+
+
+def test_exact_multiple_of_page_size_has_no_empty_last_page(db):
+    db.add_all([
+        Supplier(id=i, name=f"S{i}", normalized_name=f"s{i}", organization_id=1) for i in range(1, 7)
+    ])
+    db.commit()
+
+    first, cursor = pagination.keyset_page(db.query(Supplier), Supplier.id, Supplier.id, limit=3)
+    second, last = pagination.keyset_page(db.query(Supplier), Supplier.id, Supplier.id, cursor=cursor, limit=3)
+
+    assert [s.id for s in first + second] == [6, 5, 4, 3, 2, 1]
+    assert last is None
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    token = pagination.encode_cursor(START, 42)
+    assert "=" not in token
+    assert pagination.decode_cursor(token) == (START, 42)
+    assert pagination.decode_cursor(pagination.encode_cursor(0.75, 7)) == (0.75, 7)
+
+    with pytest.raises(HTTPException) as exc:
+        pagination.decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_page_size_is_clamped():
+    assert pagination.page_size(0) == pagination.DEFAULT_PAGE_SIZE
+    assert pagination.page_size(-5) == 1
+    assert pagination.page_size(10_000) == pagination.MAX_PAGE_SIZE
+
+
+def test_suppliers_with_status_follow_next_cursor(db):
+    db.add_all([
+        Supplier(id=i, name=f"Supplier {i}", normalized_name=f"supplier {i}", organization_id=1)
+        for i in range(1, 6)
+    ])
+    db.add(AssessmentHistory(supplier_id=3, risk_score=40, overall_status="CONDITIONAL", created_at=START))
+    db.commit()
+
+    user = SimpleNamespace(organization_id=1)
+    items, cursor = [], None
+    while True:
+        page = list_suppliers_with_status(limit=2, cursor=cursor, db=db, current_user=user)
+        assert len(page["items"]) <= 2
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [s["id"] for s in items] == [5, 4, 3, 2, 1]
+    assert {s["id"]: s["latest_status"] for s in items}[3] == "CONDITIONAL"
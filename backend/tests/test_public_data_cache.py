@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from app.services import public_data_service as public_data
+from app.services.trade_stats_service import VERSION_KEY
+from app.worker import celery_app
+
+
+@pytest.fixture
+def cache(monkeypatch, fake_redis):
+    monkeypatch.setattr(celery_app, "redis_client", fake_redis)
+    return fake_redis
+
+
+def test_filings_cache_is_shared_without_the_callers_spelling(db, cache, monkeypatch):
+    lookups = []
+
+    def fake_filings(session, name):
+        lookups.append(name)
+        return [{"title": "10-K - ACME CORP", "cik": "1000001"}]
+
+    monkeypatch.setattr(public_data, "search_local_filings", fake_filings)
+
+    first = public_data.cached_corporate_filings("Acme Corp", db)
+    second = public_data.cached_corporate_filings("ACME CORP.", db)
+
+    # One key per normalized name, filled once
+    key = public_data._cache_key("filings", "acme corp")
+    assert list(cache.data) == [key]
+    assert lookups == ["Acme Corp"]
+    assert cache.ttls[key] == public_data.SOURCE_TTL_SECONDS["filings"]
+
+    assert "reference_url" not in json.loads(cache.data[key])
+    assert "company=Acme+Corp&" in first["reference_url"]
+    assert "company=ACME+CORP.&" in second["reference_url"]
+    assert second["filings"] == first["filings"]
+
+
+def test_empty_results_get_the_negative_ttl(db, cache, monkeypatch):
+    monkeypatch.setattr(public_data, "search_local_filings", lambda session, name: [])
+
+    result = public_data.cached_corporate_filings("Nobody Ltd", db)
+
+    key = public_data._cache_key("filings", "nobody ltd")
+    assert result["filings"] == []
+    assert cache.ttls[key] == public_data.NEGATIVE_TTL_SECONDS["filings"]
+
+
+def test_trade_key_is_per_country_and_load_version(db, cache, monkeypatch):
+    windows = []
+
+    def fake_window(session, country, months):
+        windows.append(country)
+        return {"monthly": [{"period": "2026-01"}], "top_chapters": [],
+                "start_period": "2026-01", "end_period": "2026-01"}
+
+    monkeypatch.setattr(public_data, "trade_window", fake_window)
+
+    public_data.cached_trade_records("Acme Corp", "china ", db)
+    public_data.cached_trade_records("Globex", "CHINA", db)
+    assert windows == ["china "]
+    assert public_data._cache_key("trade", "0", "CHINA", 12) in cache.data
+
+    # A new load rolls the key over
+    cache.incr(VERSION_KEY)
+    public_data.cached_trade_records("Globex", "CHINA", db)
+    assert len(windows) == 2
+    assert public_data._cache_key("trade", "1", "CHINA", 12) in cache.data
+
+
+def test_news_key_is_per_supplier(db, cache, monkeypatch):
+    monkeypatch.setattr(
+        public_data, "search_recent_news",
+        lambda supplier_id, session, months: {"articles": [{"supplier": supplier_id}]},
+    )
+
+    assert public_data.cached_recent_news(1, db)["articles"] == [{"supplier": 1}]
+    assert public_data.cached_recent_news(2, db)["articles"] == [{"supplier": 2}]
+    assert cache.ttls[public_data._cache_key("news", 1, 12)] == public_data.SOURCE_TTL_SECONDS["news"]
+
+
+def test_cache_outage_falls_through_to_compute(db, monkeypatch):
+    class DownRedis:
+        def __getattr__(self, name):
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(celery_app, "redis_client", DownRedis())
+    monkeypatch.setattr(public_data, "search_local_filings", lambda session, name: [])
+
+    result = public_data.cached_corporate_filings("Acme Corp", db)
+    assert result["filings"] == []
+    assert result["reference_url"]
+
+
+def test_cold_process_reads_the_sanctions_version_from_redis(cache, monkeypatch):
+    downloads = []
+
+    def loader(key):
+        def load():
+            downloads.append(key)
+            return [{"name": f"{key} target", "normalized": f"{key} target"}]
+        return load
+
+    monkeypatch.setattr(public_data, "_list_cache", {})
+    for key in ("ofac", "bis", "eu"):
+        monkeypatch.setattr(public_data, f"_load_{key}", loader(key))
+
+    # First process downloads the lists and publishes their digests
+    version = public_data.sanctions_snapshot_version()
+    assert downloads == ["ofac", "bis", "eu"]
+    assert cache.ttls[public_data._list_version_key("ofac")] == public_data.SANCTIONS_LIST_TTL_SECONDS
+
+    # A cold process answers a cached lookup without downloading anything
+    monkeypatch.setattr(public_data, "_list_cache", {})
+    cache.set(public_data._cache_key("sanctions", version, "acme corp"), json.dumps({"hits": []}))
+
+    assert public_data.cached_sanctions("Acme Corp") == {"hits": []}
+    assert downloads == ["ofac", "bis", "eu"]
@@ -0,0 +1,135 @@
+from app.nlp.entity_extractor import entities_from_doc
+from app.nlp.relationship_extractor import relationships_from_doc
+
+
+# =====================================================
+# MINIMAL spaCy Doc STAND-IN
+# =====================================================
+# Only what the extractor reads: token index / text / pos_ / dep_ /
+# children / subtree, and entity spans with label_ and offsets.
+
+class Token:
+    def __init__(self, doc, i, text, pos, dep, head):
+        self.doc, self.i, self.text, self.pos_, self.dep_, self.head_i = doc, i, text, pos, dep, head
+
+    @property
+    def children(self):
+        return [t for t in self.doc.tokens if t.head_i == self.i and t.i != self.i]
+
+    @property
+    def subtree(self):
+        nodes = [self]
+        for child in self.children:
+            nodes.extend(child.subtree)
+        return sorted(nodes, key=lambda t: t.i)
+
+
+class Span:
+    def __init__(self, doc, start, end, label):
+        self.doc, self.start, self.end, self.label_ = doc, start, end, label
+
+    def __iter__(self):
+        return iter(self.doc.tokens[self.start:self.end])
+
+    @property
+    def text(self):
+        return " ".join(t.text for t in self)
+
+    @property
+    def start_char(self):
+        return self.doc.offsets[self.start]
+
+    @property
+    def end_char(self):
+        return self.start_char + len(self.text)
+
+
+class Doc:
+    def __init__(self, tokens, ents):
+        self.tokens = [Token(self, i, *spec) for i, spec in enumerate(tokens)]
+        self.offsets = []
+        position = 0
+        for token in self.tokens:
+            self.offsets.append(position)
+            position += len(token.text) + 1
+        self.ents = [Span(self, start, end, label) for start, end, label in ents]
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+
+def triples(doc):
+    return [(r["subject"], r["relationship"], r["object"]) for r in relationships_from_doc(doc)]
+
+
+# =====================================================
+# ARGUMENTS ALIGNED TO NER SPANS
+# =====================================================
+
+def test_active_voice_uses_full_spans():
+    # Acme Holdings acquired Beta Corp
+    doc = Doc(
+        [("Acme", "PROPN", "compound", 1), ("Holdings", "PROPN", "nsubj", 2),
+         ("acquired", "VERB", "ROOT", 2),
+         ("Beta", "PROPN", "compound", 4), ("Corp", "PROPN", "dobj", 2)],
+        [(0, 2, "ORG"), (3, 5, "ORG")],
+    )
+
+    [relationship] = relationships_from_doc(doc)
+    assert relationship == {
+        "subject": "Acme Holdings",
+        "subject_label": "ORG",
+        "relationship": "acquired",
+        "object": "Beta Corp",
+        "object_label": "ORG",
+        "confidence": 0.95,
+    }
+
+    # Arguments are the same strings entity extraction returns for the Doc
+    entity_texts = {e["text"] for e in entities_from_doc(doc)}
+    assert {relationship["subject"], relationship["object"]} <= entity_texts
+
+
+def test_passive_voice_is_turned_around():
+    # Beta Corp was acquired by Acme Holdings
+    doc = Doc(
+        [("Beta", "PROPN", "compound", 1), ("Corp", "PROPN", "nsubjpass", 3),
+         ("was", "AUX", "auxpass", 3), ("acquired", "VERB", "ROOT", 3),
+         ("by", "ADP", "agent", 3),
+         ("Acme", "PROPN", "compound", 6), ("Holdings", "PROPN", "pobj", 4)],
+        [(0, 2, "ORG"), (5, 7, "ORG")],
+    )
+
+    assert triples(doc) == [("Acme Holdings", "acquired", "Beta Corp")]
+
+
+def test_head_outside_span_aligns_to_entity_in_its_phrase():
+    # The parent of Acme Holdings partnered with Beta Corp
+    doc = Doc(
+        [("The", "DET", "det", 1), ("parent", "NOUN", "nsubj", 5),
+         ("of", "ADP", "prep", 1),
+         ("Acme", "PROPN", "compound", 4), ("Holdings", "PROPN", "pobj", 2),
+         ("partnered", "VERB", "ROOT", 5), ("with", "ADP", "prep", 5),
+         ("Beta", "PROPN", "compound", 8), ("Corp", "PROPN", "pobj", 6)],
+        [(3, 5, "ORG"), (7, 9, "ORG")],
+    )
+
+    assert triples(doc) == [("Acme Holdings", "partnered", "Beta Corp")]
+
+
+def test_unaligned_arguments_are_dropped():
+    # Acme Holdings owns it  (object is no entity)
+    doc = Doc(
+        [("Acme", "PROPN", "compound", 1), ("Holdings", "PROPN", "nsubj", 2),
+         ("owns", "VERB", "ROOT", 2), ("it", "PRON", "dobj", 2),
+         ("Paris", "PROPN", "npadvmod", 2)],
+        [(0, 2, "ORG"), (4, 5, "GPE")],
+    )
+    assert triples(doc) == []
+
+    # Ignored labels don't count as entities
+    doc = Doc(
+        [("Acme", "PROPN", "nsubj", 1), ("paid", "VERB", "ROOT", 1), ("millions", "NOUN", "dobj", 1)],
+        [(0, 1, "ORG"), (2, 3, "MONEY")],
+    )
+    assert triples(doc) == []
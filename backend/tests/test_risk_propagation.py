@@ -0,0 +1,285 @@
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from app.graph import dirty_tracker, risk_propagation
+from app.graph.graph_engine import RelationGraph, propagate_exposure, exposure_to_score
+from app.graph.supplier_graph_service import MAX_DEPTH
+
+
+# =====================================================
+# IN-MEMORY STAND-INS FOR THE NEO4J LOADERS
+# =====================================================
+
+def make_graph(names, sanctioned, edges):
+    index = {name: i for i, name in enumerate(names)}
+    return RelationGraph(
+        names,
+        [name in sanctioned for name in names],
+        [index[a] for a, b, _, _ in edges],
+        [index[b] for a, b, _, _ in edges],
+        [rel_type for _, _, rel_type, _ in edges],
+        [confidence for _, _, _, confidence in edges],
+    )
+
+
+def edge_list(graph):
+    return [
+        (graph.names[s], graph.names[d], t, c)
+        for s, d, t, c in zip(graph.edge_src, graph.edge_dst, graph.edge_types, graph.edge_confidence)
+    ]
+
+
+def upstream(graph, names, depth):
+    reached = {name for name in names if name in graph.index}
+    frontier = set(reached)
+    for _ in range(depth):
+        frontier = {a for a, b, _, _ in edge_list(graph) if b in frontier} - reached
+        reached |= frontier
+    return reached
+
+
+def downstream_ball(graph, names, depth):
+    reached = {name for name in names if name in graph.index}
+    frontier = set(reached)
+    for _ in range(depth):
+        frontier = {b for a, b, _, _ in edge_list(graph) if a in frontier} - reached
+        reached |= frontier
+
+    ball = [name for name in graph.names if name in reached]
+    sanctioned = {name for name in ball if graph.sanctioned[graph.index[name]]}
+    edges = [e for e in edge_list(graph) if e[0] in reached and e[1] in reached]
+    return make_graph(ball, sanctioned, edges)
+
+
+class LiveGraph:
+    """Neo4j double: the current graph plus the stored risk_exposure."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.exposure = dict(zip(graph.names, propagate_exposure(graph)))
+
+    def write(self, session, rows):
+        for row in rows:
+            self.exposure[row["name"]] = row["exposure"]
+
+
+@pytest.fixture
+def live(monkeypatch, fake_redis):
+    state = {}
+    monkeypatch.setattr(dirty_tracker, "redis_client", fake_redis)
+
+    @contextmanager
+    def fake_session():
+        yield object()
+
+    monkeypatch.setattr(risk_propagation, "get_session", fake_session)
+    monkeypatch.setattr(risk_propagation, "has_full_propagation", lambda: True)
+    monkeypatch.setattr(risk_propagation, "ack_events", lambda count: None)
+
+    def claim_events(limit):
+        events = state.pop("events", [])
+        return len(events), events
+
+    monkeypatch.setattr(risk_propagation, "claim_events", claim_events)
+    monkeypatch.setattr(risk_propagation, "_affected_supplier_names", lambda session, names: [])
+    monkeypatch.setattr(risk_propagation, "_refresh_affected_suppliers", lambda names: 0)
+    monkeypatch.setattr(
+        risk_propagation, "upstream_entity_names",
+        lambda session, names, depth: upstream(state["live"].graph, names, depth),
+    )
+    monkeypatch.setattr(
+        risk_propagation, "load_downstream_ball",
+        lambda session, names, depth: downstream_ball(state["live"].graph, names, depth),
+    )
+    monkeypatch.setattr(
+        risk_propagation, "write_risk_scores",
+        lambda session, rows: state["live"].write(session, rows),
+    )
+
+    def setup(graph, events=None):
+        state["live"] = LiveGraph(graph)
+        return state["live"]
+
+    def change(graph, events):
+        # The live graph already holds every queued change
+        state["live"].graph = graph
+        state["events"] = events
+
+    setup.change = change
+    return setup
+
+
+def edge_event(source, target, confidence, previous=None):
+    return {
+        "kind": "edge",
+        "source": source,
+        "target": target,
+        "type": "OWNS",
+        "previous_confidence": previous,
+        "confidence": confidence,
+    }
+
+
+def assert_matches_full_run(live_graph):
+    expected = propagate_exposure(live_graph.graph)
+    for name, value in zip(live_graph.graph.names, expected):
+        assert live_graph.exposure[name] == pytest.approx(value), name
+
+
+# =====================================================
+# INCREMENTAL == WHOLE-GRAPH RESULT
+# =====================================================
+
+NAMES = ["A", "B", "C", "D", "S", "X"]
+
+
+def test_two_chained_new_edges_match_full_propagation(live):
+    before = make_graph(NAMES, {"S"}, [
+        ("C", "S", "OWNS", 0.9),
+        ("D", "A", "SUPPLIES", 0.8),
+        ("X", "D", "OWNS", 0.7),
+    ])
+    live_graph = live(before)
+
+    after = make_graph(NAMES, {"S"}, edge_list(before) + [
+        ("A", "B", "OWNS", 0.9),
+        ("B", "C", "OWNS", 0.8),
+    ])
+    live.change(after, [edge_event("A", "B", 0.9), edge_event("B", "C", 0.8)])
+
+    result = risk_propagation.apply_incremental_propagation()
+
+    assert result["events"] == 2
+    assert live_graph.exposure["A"] > 0
+    assert_matches_full_run(live_graph)
+
+
+def test_new_edge_and_new_sanction_in_one_batch(live):
+    before = make_graph(NAMES, set(), [
+        ("A", "B", "OWNS", 0.9),
+        ("X", "A", "OWNS", 0.6),
+    ])
+    live_graph = live(before)
+
+    after = make_graph(NAMES, {"C"}, edge_list(before) + [("B", "C", "CONTROLS", 1.0)])
+    live.change(after, [edge_event("B", "C", 1.0), {"kind": "sanction", "entity": "C"}])
+
+    risk_propagation.apply_incremental_propagation()
+
+    assert_matches_full_run(live_graph)
+
+
+def test_reweighted_edge_and_repeated_runs_do_not_drift(live):
+    before = make_graph(NAMES, {"S"}, [
+        ("A", "B", "OWNS", 0.5),
+        ("B", "S", "OWNS", 0.9),
+        ("B", "A", "OWNS", 0.4),
+    ])
+    live_graph = live(before)
+
+    after = make_graph(NAMES, {"S"}, [
+        ("A", "B", "OWNS", 1.0),
+        ("B", "S", "OWNS", 0.9),
+        ("B", "A", "OWNS", 0.4),
+    ])
+    event = edge_event("A", "B", 1.0, previous=0.5)
+
+    for _ in range(3):
+        live.change(after, [event])
+        risk_propagation.apply_incremental_propagation()
+
+    assert_matches_full_run(live_graph)
+
+
+def test_affected_entities_cover_exactly_the_upstream_window(live):
+    chain = [str(i) for i in range(MAX_DEPTH + 2)]
+    edges = [(a, b, "OWNS", 1.0) for a, b in zip(chain, chain[1:])]
+    live_graph = live(make_graph(chain, {chain[-1]}, edges))
+
+    affected = risk_propagation._affected_entities(None, [{"kind": "sanction", "entity": chain[-1]}])
+
+    # Entity 0 sits MAX_DEPTH + 1 hops away: out of reach, not rescored
+    assert affected == set(chain[1:])
+    assert live_graph.exposure[chain[0]] == pytest.approx(0.0)
+
+
+def test_recomputed_scores_use_the_batch_score_scale(live):
+    graph = make_graph(["A", "S"], {"S"}, [("A", "S", "OWNS", 1.0)])
+    live(graph)
+
+    rows = risk_propagation._recompute_exposure(None, {"A", "S"})
+
+    expected = exposure_to_score(propagate_exposure(graph))
+    by_name = {row["name"]: row["score"] for row in rows}
+    assert by_name == {"A": expected[0], "S": expected[1]}
+    assert np.isclose(by_name["S"], 100.0)
+
+
+# =====================================================
+# BATCH vs INCREMENTAL (SHARED QUEUE AND LOCK)
+# =====================================================
+
+@pytest.fixture
+def queue(monkeypatch, fake_redis):
+    """Real dirty-set on a fake Redis; Neo4j reads / writes stubbed."""
+    monkeypatch.setattr(dirty_tracker, "redis_client", fake_redis)
+
+    @contextmanager
+    def fake_session(*args):
+        yield object()
+
+    processed = []
+
+    def affected(session, events):
+        processed.append(events)
+        return set()
+
+    monkeypatch.setattr(risk_propagation, "get_session", fake_session)
+    monkeypatch.setattr(risk_propagation, "get_read_session", fake_session)
+    monkeypatch.setattr(risk_propagation, "write_risk_scores", lambda session, rows: None)
+    monkeypatch.setattr(risk_propagation, "_affected_entities", affected)
+    monkeypatch.setattr(risk_propagation, "_recompute_exposure", lambda session, names: [])
+    monkeypatch.setattr(risk_propagation, "_affected_supplier_names", lambda session, names: [])
+    monkeypatch.setattr(risk_propagation, "_refresh_affected_suppliers", lambda names: 0)
+    return processed
+
+
+def test_event_recorded_after_export_survives_the_batch_run(queue, monkeypatch):
+    graph = make_graph(["A", "S"], {"S"}, [("A", "S", "OWNS", 1.0)])
+
+    def export(session, include_suppliers):
+        # Lands while the batch job is already reading the graph
+        dirty_tracker.record_edge_change("B", "S", "OWNS", None, 0.9)
+        return graph
+
+    monkeypatch.setattr(risk_propagation, "load_relation_graph", export)
+
+    dirty_tracker.record_sanction_change("S")
+    dirty_tracker.claim_events()                      # orphaned by a dead incremental run
+    dirty_tracker.record_edge_change("A", "S", "OWNS", None, 1.0)
+
+    shared = []
+    risk_propagation.run_batch_risk_propagation(with_graph=shared.append)
+    assert shared == [graph]
+
+    result = risk_propagation.apply_incremental_propagation()
+
+    assert result["events"] == 1
+    assert queue == [[edge_event("B", "S", 0.9)]]
+    assert dirty_tracker.pending_event_count() == 0
+
+
+def test_runs_skip_while_another_holds_the_lock(queue, monkeypatch):
+    monkeypatch.setattr(risk_propagation, "load_relation_graph", lambda session, include_suppliers: None)
+    dirty_tracker.mark_full_propagation(1.0)
+    dirty_tracker.record_sanction_change("S")
+
+    with dirty_tracker.propagation_lock() as acquired:
+        assert acquired
+        assert risk_propagation.apply_incremental_propagation()["skipped"] == "propagation running"
+        assert risk_propagation.run_batch_risk_propagation() == {"skipped": "propagation running"}
+
+    assert dirty_tracker.pending_event_count() == 1
+    assert risk_propagation.apply_incremental_propagation()["events"] == 1
@@ -0,0 +1,150 @@
+from contextlib import contextmanager
+
+import pytest
+
+from app.graph import sanction_exposure_index as exposure_index
+from app.graph.graph_engine import RelationGraph
+from app.models import GlobalEntity, SanctionExposure, Supplier
+from app.services import sanctions_service
+
+# Acme -> a1 -OWNS-> s1 (sanctioned)
+#      -> a2 -MENTIONED_WITH-> b -OWNS-> s1 / -PARTNER_OF-> s2 (sanctioned)
+#                              b -CONTROLS-> c -OWNS-> s3 (4 hops incl. RESOLVES_TO)
+# Globex resolves straight onto a sanctioned entity
+NAMES = ["a1", "a2", "b", "c", "s1", "s2", "s3", "s4"]
+SANCTIONED = {"s1", "s2", "s3", "s4"}
+EDGES = [
+    ("a1", "s1", "OWNS"),
+    ("a2", "b", "MENTIONED_WITH"),
+    ("b", "s1", "OWNS"),
+    ("b", "s2", "PARTNER_OF"),
+    ("b", "c", "CONTROLS"),
+    ("c", "s3", "OWNS"),
+]
+RESOLVES = [("Acme", "a1"), ("Acme", "a2"), ("Globex", "s4")]
+
+
+def make_graph(edges=EDGES, resolves=RESOLVES):
+    index = {name: i for i, name in enumerate(NAMES)}
+    suppliers = list(dict.fromkeys(s for s, _ in resolves))
+    return RelationGraph(
+        NAMES,
+        [name in SANCTIONED for name in NAMES],
+        [index[a] for a, _, _ in edges],
+        [index[b] for _, b, _ in edges],
+        [rel_type for _, _, rel_type in edges],
+        [1.0] * len(edges),
+        supplier_names=suppliers,
+        resolves_supplier=[suppliers.index(s) for s, _ in resolves],
+        resolves_entity=[index[e] for _, e in resolves],
+        resolves_confidence=[1.0] * len(resolves),
+    )
+
+
+# =====================================================
+# BFS
+# =====================================================
+
+def test_nearest_sanctioned_shortest_paths():
+    exposures = exposure_index.nearest_sanctioned(make_graph(), "Acme", depth=3)
+
+    assert exposures == [
+        {"sanctioned_entity": "s1", "distance": 2, "path": ["a1", "s1"], "strongest_relation": "OWNS"},
+        {"sanctioned_entity": "s2", "distance": 3, "path": ["a2", "b", "s2"],
+         "strongest_relation": "PARTNER_OF"},
+    ]
+
+
+def test_depth_bounds_the_search():
+    graph = make_graph()
+
+    assert [e["sanctioned_entity"] for e in exposure_index.nearest_sanctioned(graph, "Acme", depth=4)] == [
+        "s1", "s2", "s3",
+    ]
+    assert [e["sanctioned_entity"] for e in exposure_index.nearest_sanctioned(graph, "Acme", depth=1)] == []
+
+
+def test_sanctioned_root_is_one_hop_away():
+    assert exposure_index.nearest_sanctioned(make_graph(), "Globex") == [
+        {"sanctioned_entity": "s4", "distance": 1, "path": ["s4"], "strongest_relation": "RESOLVES_TO"},
+    ]
+    assert exposure_index.nearest_sanctioned(make_graph(), "Unknown") == []
+
+
+def test_exposures_are_capped(monkeypatch):
+    monkeypatch.setattr(exposure_index, "MAX_EXPOSURES_PER_SUPPLIER", 1)
+    exposures = exposure_index.nearest_sanctioned(make_graph(), "Acme", depth=4)
+    assert [e["sanctioned_entity"] for e in exposures] == ["s1"]
+
+
+# =====================================================
+# STORED INDEX
+# =====================================================
+
+def test_rebuild_then_read(db):
+    result = exposure_index.rebuild_exposure_index(db, make_graph())
+
+    assert exposure_index.EXPOSURE_DEPTH == 4
+    assert result == {"suppliers": 2, "exposures": 4}
+    assert exposure_index.get_supplier_exposure(db, "Acme") == (
+        exposure_index.nearest_sanctioned(make_graph(), "Acme")
+    )
+
+
+def test_refresh_replaces_only_the_given_suppliers(db, monkeypatch):
+    exposure_index.rebuild_exposure_index(db, make_graph())
+
+    # Acme's a1 -> s1 edge goes away
+    live = make_graph(edges=EDGES[1:])
+    loaded = []
+
+    @contextmanager
+    def fake_read_session():
+        yield None
+
+    def fake_neighbourhood(session, supplier_name, depth):
+        loaded.append((supplier_name, depth))
+        return live
+
+    monkeypatch.setattr(exposure_index, "get_read_session", fake_read_session)
+    monkeypatch.setattr(exposure_index, "load_supplier_neighbourhood", fake_neighbourhood)
+
+    assert exposure_index.refresh_supplier_exposure(db, ["Acme", "Acme"]) == 3
+    # The RESOLVES_TO hop is not part of the exported RELATION depth
+    assert loaded == [("Acme", exposure_index.EXPOSURE_DEPTH - 1)]
+
+    assert [e["path"] for e in exposure_index.get_supplier_exposure(db, "Acme")] == [
+        ["a2", "b", "s1"], ["a2", "b", "s2"], ["a2", "b", "c", "s3"],
+    ]
+    assert db.query(SanctionExposure).filter_by(supplier_name="Globex").count() == 1
+
+
+# =====================================================
+# ASSESSMENT READ
+# =====================================================
+
+def test_check_sanctions_reports_exposure_without_failing(db, monkeypatch):
+    supplier = Supplier(id=1, name="Acme", normalized_name="acme", organization_id=1)
+    entity = GlobalEntity(id=1, canonical_name="Acme", normalized_name="acme")
+    db.add_all([supplier, entity])
+    db.commit()
+    exposure_index.rebuild_exposure_index(db, make_graph())
+
+    screened = []
+
+    def screen(name, country):
+        screened.append(name)
+        return {"flagged": False}
+
+    monkeypatch.setattr(sanctions_service, "resolve_supplier_entity", lambda supplier, db: entity)
+    monkeypatch.setattr(sanctions_service, "check_sanctions_lists", screen)
+
+    result = sanctions_service.check_sanctions(1, db)
+
+    # s1 is two hops away over OWNS: reported, scored by propagation, not a FAIL
+    assert result["overall_status"] == "PASS"
+    assert result["matches"] == []
+    assert result["graph_exposure"] == exposure_index.get_supplier_exposure(db, "Acme")
+    assert result["graph_exposure"][0]["sanctioned_entity"] == "s1"
+    # Only the supplier itself is screened live
+    assert screened == ["Acme"]
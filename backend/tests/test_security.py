@@ -0,0 +1,186 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from starlette.requests import Request
+
+from app.core import security
+from app.models import Organization, User
+from app.worker import celery_app
+
+
+@pytest.fixture
+def auth_env(monkeypatch, fake_redis):
+    monkeypatch.setattr(celery_app, "redis_client", fake_redis)
+    return fake_redis
+
+
+@pytest.fixture
+def user(db):
+    db.add(Organization(id=1, name="acme_org"))
+    account = User(id=7, username="analyst", hashed_password="x", role="ADMIN", organization_id=1)
+    db.add(account)
+    db.commit()
+    return account
+
+
+def request_with(token: str) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(b"cookie", f"access_token={token}".encode())],
+    })
+
+
+def authenticate(db, account):
+    token = security.create_access_token(security.user_claims(account))
+    return security.get_current_user(request_with(token), db)
+
+
+def count_user_queries(db):
+    statements = []
+
+    @event.listens_for(db.bind, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+def test_claims_carry_the_token_version(user):
+    assert security.user_claims(user)["ver"] == 0
+
+
+def test_hot_path_authorizes_from_claims(db, user, auth_env):
+    authenticate(db, user)
+    queries = count_user_queries(db)
+
+    current = authenticate(db, user)
+
+    assert (current.id, current.role, current.organization_id) == (7, "ADMIN", 1)
+    assert queries == []
+
+
+def test_role_change_revokes_outstanding_tokens_immediately(db, user, auth_env):
+    old_token = security.create_access_token(security.user_claims(user))
+    security.get_current_user(request_with(old_token), db)
+
+    user.role = "VIEWER"
+    security.revoke_user_tokens(db, user)
+
+    with pytest.raises(HTTPException) as exc:
+        security.get_current_user(request_with(old_token), db)
+    assert exc.value.detail == "Token revoked"
+
+    # A token issued after the change (login / refresh) carries the new role
+    assert authenticate(db, user).role == "VIEWER"
+
+
+def test_version_bumped_outside_the_app_is_read_from_the_column(db, user, auth_env):
+    token = security.create_access_token(security.user_claims(user))
+
+    # e.g. a SQL script; nothing cached in Redis yet
+    db.query(User).filter(User.id == 7).update({User.token_version: 3})
+    db.commit()
+
+    with pytest.raises(HTTPException):
+        security.get_current_user(request_with(token), db)
+    assert auth_env.get(security.TOKEN_VERSION_KEY.format(user_id=7)) == "3"
+
+
+def test_redis_outage_falls_back_to_the_database(db, user, monkeypatch):
+    class DownRedis:
+        def __getattr__(self, name):
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(celery_app, "redis_client", DownRedis())
+    token = security.create_access_token(security.user_claims(user))
+
+    user.role = "VIEWER"
+    security.revoke_user_tokens(db, user)
+
+    with pytest.raises(HTTPException):
+        security.get_current_user(request_with(token), db)
+
+
+def test_deleted_user_is_rejected(db, user, auth_env):
+    token = security.create_access_token(security.user_claims(user))
+
+    security.revoke_user_tokens(db, user)
+    db.delete(user)
+    db.commit()
+    auth_env.delete(security.TOKEN_VERSION_KEY.format(user_id=7))
+
+    with pytest.raises(HTTPException) as exc:
+        security.get_current_user(request_with(token), db)
+    assert exc.value.detail == "User not found"
+
+
+def test_tokens_without_version_claim_match_version_zero(db, user, auth_env):
+    claims = security.user_claims(user)
+    del claims["ver"]
+
+    token = security.create_access_token(claims)
+
+    assert security.get_current_user(request_with(token), db).id == 7
+
+
+# =====================================================
+# REFRESH TOKENS
+# =====================================================
+
+def refresh_with(db, refresh_token):
+    from starlette.responses import Response
+    from app.api import auth
+
+    request = Request({
+        "type": "http",
+        "headers": [(b"cookie", f"refresh_token={refresh_token}".encode())],
+    })
+    response = Response()
+    auth.refresh(request, response, db)
+    return response
+
+
+def test_refresh_issues_current_claims(db, user, auth_env):
+    refresh_token = security.create_refresh_token(security.refresh_claims(user))
+
+    user.role = "VIEWER"
+    db.commit()
+
+    response = refresh_with(db, refresh_token)
+
+    cookie = response.headers["set-cookie"]
+    access = cookie.split("access_token=", 1)[1].split(";", 1)[0]
+    assert security.verify_token(access, "access")["role"] == "VIEWER"
+
+
+def test_revoked_user_cannot_refresh(db, user, auth_env):
+    refresh_token = security.create_refresh_token(security.refresh_claims(user))
+
+    security.revoke_user_tokens(db, user)
+
+    with pytest.raises(HTTPException) as exc:
+        refresh_with(db, refresh_token)
+    assert exc.value.detail == "Token revoked"
+
+    # A token issued after the revocation works again
+    refresh_with(db, security.create_refresh_token(security.refresh_claims(user)))
+
+
+def test_access_changes_revoke_tokens(db, user, auth_env):
+    access = security.create_access_token(security.user_claims(user))
+    refresh_token = security.create_refresh_token(security.refresh_claims(user))
+
+    # No-op change: tokens stay valid
+    assert not security.update_user_access(db, user, role="ADMIN", organization_id=1)
+    assert security.get_current_user(request_with(access), db).role == "ADMIN"
+
+    db.add(Organization(id=2, name="other_org"))
+    assert security.update_user_access(db, user, organization_id=2)
+
+    with pytest.raises(HTTPException):
+        security.get_current_user(request_with(access), db)
+    with pytest.raises(HTTPException):
+        refresh_with(db, refresh_token)
+
+    assert authenticate(db, user).organization_id == 2
@@ -0,0 +1,194 @@
+import pytest
+
+from app.core.normalization import normalize
+from app.models import Supplier
+from app.services import supplier_autocomplete as autocomplete
+from app.worker import celery_app
+
+ORG = 1
+OTHER_ORG = 2
+
+
+@pytest.fixture
+def index_env(monkeypatch, fake_redis):
+    monkeypatch.setattr(autocomplete, "_indexes", {})
+    monkeypatch.setattr(celery_app, "redis_client", fake_redis)
+    return fake_redis
+
+
+def add_supplier(db, supplier_id, name, organization_id=ORG, is_global=False):
+    supplier = Supplier(
+        id=supplier_id,
+        name=name,
+        normalized_name=normalize(name),
+        organization_id=None if is_global else organization_id,
+        is_global=is_global,
+    )
+    db.add(supplier)
+    db.commit()
+    return supplier
+
+
+def expire_checks():
+    for index in autocomplete._indexes.values():
+        index.checked_at = 0.0
+
+
+def names(results):
+    return [s["name"] for s in results]
+
+
+# =====================================================
+# PREFIX INDEX
+# =====================================================
+
+def prefix_matches(index, prefix):
+    return sorted(
+        (supplier_id, name_start)
+        for name_start, _, keys, start, end in index.prefix_ranges(prefix)
+        for _, supplier_id in keys[start:end]
+    )
+
+
+def test_prefix_ranges_cover_every_bucket():
+    index = autocomplete.PrefixIndex()
+    index.add_many([(1, "Acme Steel", None), (2, "Steel Works", None), (3, "Stellar Labs", None)])
+
+    assert prefix_matches(index, "ste") == [(1, False), (2, True), (3, True)]
+    assert prefix_matches(index, "steel w") == [(2, True)]
+    assert prefix_matches(index, "zzz") == []
+
+
+def test_remove_drops_every_word_key():
+    index = autocomplete.PrefixIndex()
+    index.add(1, "Acme Steel Works")
+    index.add(2, "Steel Dynamics")
+
+    index.remove(1)
+
+    assert prefix_matches(index, "steel") == [(2, True)]
+    assert prefix_matches(index, "works") == []
+    assert 1 not in index.suppliers
+    assert all(keys for keys in index.buckets.values())
+
+
+# =====================================================
+# RANKED LOOKUP
+# =====================================================
+
+def test_top_result_is_the_real_best_beyond_lexicographic_order(db, index_env):
+    # 300 long names sort before the one short, best-scoring match
+    for i in range(300):
+        add_supplier(db, i + 1, f"Global Aaa Logistics Holdings {i:03d}", is_global=True)
+    add_supplier(db, 1000, "Global Zeta", is_global=True)
+
+    results = autocomplete.autocomplete_suppliers(db, ORG, "global", limit=3)
+
+    assert results[0]["name"] == "Global Zeta"
+    assert len(results) == 3
+    assert results[0]["confidence"] >= results[1]["confidence"] >= results[2]["confidence"]
+
+
+def test_lookup_stops_after_limit_hits(db, index_env, monkeypatch):
+    for i in range(300):
+        add_supplier(db, i + 1, f"Global Aaa Logistics Holdings {i:03d}", is_global=True)
+    autocomplete.autocomplete_suppliers(db, ORG, "global")
+
+    visited = []
+    walk = autocomplete._walk
+
+    def counting_walk(keys, start, end, index):
+        for hit in walk(keys, start, end, index):
+            visited.append(hit)
+            yield hit
+
+    monkeypatch.setattr(autocomplete, "_walk", counting_walk)
+
+    results = autocomplete.autocomplete_suppliers(db, ORG, "global", limit=5)
+
+    assert names(results) == [f"Global Aaa Logistics Holdings {i:03d}" for i in range(5)]
+    assert len(visited) <= 5 + 1
+
+
+def test_name_start_ranks_above_later_word(db, index_env):
+    add_supplier(db, 1, "Pacific Steel")
+    add_supplier(db, 2, "Steel Pacific")
+
+    assert names(autocomplete.autocomplete_suppliers(db, ORG, "steel")) == ["Steel Pacific", "Pacific Steel"]
+
+
+def test_tenant_sees_own_and_global_suppliers_only(db, index_env):
+    add_supplier(db, 1, "Nova Metals", organization_id=ORG)
+    add_supplier(db, 2, "Nova Plastics", organization_id=OTHER_ORG)
+    add_supplier(db, 3, "Nova Global", is_global=True)
+
+    assert sorted(names(autocomplete.autocomplete_suppliers(db, ORG, "nova"))) == ["Nova Global", "Nova Metals"]
+
+
+# =====================================================
+# RENAMES, DELETES, SCOPE MOVES
+# =====================================================
+
+def test_rename_replaces_the_old_keys(db, index_env):
+    supplier = add_supplier(db, 1, "Old Name Trading")
+    autocomplete.autocomplete_suppliers(db, ORG, "old")
+
+    supplier.name = "Fresh Name Trading"
+    db.commit()
+    autocomplete.update_supplier_in_index(supplier)
+
+    assert autocomplete.autocomplete_suppliers(db, ORG, "old") == []
+    assert names(autocomplete.autocomplete_suppliers(db, ORG, "fresh")) == ["Fresh Name Trading"]
+
+
+def test_supplier_made_global_moves_scope(db, index_env):
+    supplier = add_supplier(db, 1, "Alpha Defense Systems", organization_id=ORG)
+    assert names(autocomplete.autocomplete_suppliers(db, ORG, "alpha")) == ["Alpha Defense Systems"]
+    assert autocomplete.autocomplete_suppliers(db, OTHER_ORG, "alpha") == []
+
+    supplier.is_global = True
+    supplier.organization_id = None
+    db.commit()
+    autocomplete.update_supplier_in_index(supplier, previous_scope=ORG)
+
+    assert 1 not in autocomplete._indexes[ORG].suppliers
+    assert names(autocomplete.autocomplete_suppliers(db, ORG, "alpha")) == ["Alpha Defense Systems"]
+    assert names(autocomplete.autocomplete_suppliers(db, OTHER_ORG, "alpha")) == ["Alpha Defense Systems"]
+
+
+def test_deleted_supplier_disappears(db, index_env):
+    supplier = add_supplier(db, 1, "Gone Industries")
+    autocomplete.autocomplete_suppliers(db, ORG, "gone")
+
+    db.delete(supplier)
+    db.commit()
+    autocomplete.remove_supplier_from_index(1, ORG)
+
+    assert autocomplete.autocomplete_suppliers(db, ORG, "gone") == []
+
+
+def test_generation_bump_rebuilds_other_processes(db, index_env):
+    supplier = add_supplier(db, 1, "Kilo Components")
+    autocomplete.autocomplete_suppliers(db, ORG, "kilo")
+
+    # Renamed by another process, which bumps the scope generation
+    supplier.name = "Lima Components"
+    db.commit()
+    index_env.incr(autocomplete._generation_key(ORG))
+    expire_checks()
+
+    assert autocomplete.autocomplete_suppliers(db, ORG, "kilo") == []
+    assert names(autocomplete.autocomplete_suppliers(db, ORG, "lima")) == ["Lima Components"]
+
+
+def test_new_rows_are_topped_up_on_version_bump(db, index_env):
+    add_supplier(db, 1, "Mike Metals")
+    autocomplete.autocomplete_suppliers(db, ORG, "mike")
+    index = autocomplete._indexes[ORG]
+
+    add_supplier(db, 2, "Mike Motors")
+    index_env.incr(autocomplete._version_key(ORG))
+    expire_checks()
+
+    assert len(autocomplete.autocomplete_suppliers(db, ORG, "mike")) == 2
+    assert autocomplete._indexes[ORG] is index
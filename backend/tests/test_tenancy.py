@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.pagination import keyset_page
+from app.core.tenancy import get_visible_supplier, tenant_suppliers
+from app.models import Supplier
+
+SUPPLIERS = [
+    # (id, organization_id, is_global)
+    (1, 1, False),
+    (2, 2, False),
+    (3, None, True),    # catalog row with no owner
+    (4, 1, True),       # org 1 published it: must not show twice
+    (5, 2, True),
+    (6, None, False),
+    (7, 1, False),
+]
+
+
+@pytest.fixture
+def suppliers(db):
+    db.add_all([
+        Supplier(id=i, name=f"Supplier {i}", normalized_name=f"supplier {i}", country="US" if i % 2 else "DE",
+                 organization_id=org, is_global=is_global)
+        for i, org, is_global in SUPPLIERS
+    ])
+    db.commit()
+
+
+def visible_ids(organization_id):
+    return sorted(
+        i for i, org, is_global in SUPPLIERS
+        if is_global or org == organization_id
+    )
+
+
+@pytest.mark.parametrize("organization_id", [1, 2, 3, None])
+def test_union_all_matches_the_or_predicate(db, suppliers, organization_id):
+    scoped = tenant_suppliers(organization_id)
+    ids = [s.id for s in db.query(scoped).all()]
+
+    assert sorted(ids) == visible_ids(organization_id)
+    assert len(ids) == len(set(ids))
+
+
+def test_filters_and_keyset_pages_over_the_scoped_rows(db, suppliers):
+    scoped = tenant_suppliers(1)
+    query = db.query(scoped).filter(scoped.country == "US")
+
+    first, cursor = keyset_page(query, scoped.id, scoped.id, limit=2)
+    rest, last = keyset_page(query, scoped.id, scoped.id, cursor=cursor, limit=2)
+
+    assert [s.id for s in first + rest] == [7, 5, 3, 1]
+    assert last is None
+    assert all(isinstance(s, Supplier) for s in first)
+
+
+def test_get_visible_supplier(db, suppliers):
+    assert get_visible_supplier(db, 1, 1).id == 1
+    assert get_visible_supplier(db, 5, 1).id == 5
+    assert get_visible_supplier(db, 2, 1) is None
+    assert get_visible_supplier(db, 6, 1) is None
+    assert get_visible_supplier(db, 999, 1) is None
@@ -0,0 +1,169 @@
+from datetime import datetime
+
+import pytest
+
+from app.models import TradeStat
+from app.services import public_data_service, trade_stats_service as trade_stats
+from app.worker import celery_app
+
+
+def stat(country, chapter, period, general, consumption=0):
+    return TradeStat(country_code="5700", country_name=country, hs_chapter=chapter, period=period,
+                     general_value=general, consumption_value=consumption)
+
+
+# =====================================================
+# PERIOD HELPERS
+# =====================================================
+
+@pytest.mark.parametrize("period, months, expected", [
+    ("2026-05", 0, "2026-05"),
+    ("2026-05", 7, "2026-12"),
+    ("2026-12", 1, "2027-01"),
+    ("2026-01", -1, "2025-12"),
+    ("2026-03", -27, "2023-12"),
+    ("2026-03", 24, "2028-03"),
+])
+def test_shift(period, months, expected):
+    assert trade_stats._shift(period, months) == expected
+
+
+def test_periods_are_inclusive_across_years():
+    assert list(trade_stats._periods("2025-11", "2026-02")) == ["2025-11", "2025-12", "2026-01", "2026-02"]
+    assert list(trade_stats._periods("2026-02", "2026-01")) == []
+
+
+# =====================================================
+# LOCAL LOOKUPS
+# =====================================================
+
+@pytest.fixture
+def china(db):
+    db.add_all([
+        stat("CHINA", "85", "2025-12", 100, 90),
+        stat("CHINA", "85", "2026-01", 200, 150),
+        stat("CHINA", "84", "2026-01", 300, 250),
+        stat("CHINA", "94", "2026-02", 50, 40),
+        stat("CHINA", "85", "2026-02", 10, 5),
+        stat("MEXICO", "87", "2026-03", 999, 999),
+    ])
+    db.commit()
+
+
+def test_window_ends_at_latest_loaded_month_of_the_country(db, china):
+    window = trade_stats.trade_window(db, " china ", months=2)
+
+    assert (window["start_period"], window["end_period"]) == ("2026-01", "2026-02")
+    assert window["monthly"] == [
+        {"country": "CHINA", "general_value": 60, "consumption_value": 45, "period": "2026-02"},
+        {"country": "CHINA", "general_value": 500, "consumption_value": 400, "period": "2026-01"},
+    ]
+    assert window["top_chapters"] == [
+        {"hs_chapter": "84", "general_value": 300},
+        {"hs_chapter": "85", "general_value": 210},
+        {"hs_chapter": "94", "general_value": 50},
+    ]
+
+
+def test_window_with_explicit_end_and_unknown_country(db, china):
+    window = trade_stats.trade_window(db, "CHINA", months=1, end_period="2025-12")
+    assert [m["period"] for m in window["monthly"]] == ["2025-12"]
+
+    assert trade_stats.trade_window(db, "ATLANTIS") == {
+        "monthly": [], "top_chapters": [], "start_period": None, "end_period": None,
+    }
+
+
+# =====================================================
+# MONTHLY LOADER
+# =====================================================
+
+@pytest.fixture
+def census(monkeypatch, fake_redis):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return cls(2026, 6, 15)
+
+    monkeypatch.setattr(trade_stats, "datetime", FrozenDatetime)
+    monkeypatch.setattr(trade_stats.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(celery_app, "redis_client", fake_redis)
+
+    published = {}
+    requested = []
+
+    def fetch(period):
+        requested.append(period)
+        return [
+            {"country_code": "5700", "country_name": "CHINA", "hs_chapter": chapter, "period": period,
+             "general_value": value, "consumption_value": value, "updated_at": FrozenDatetime.utcnow()}
+            for chapter, value in published.get(period, {}).items()
+        ]
+
+    monkeypatch.setattr(trade_stats, "_fetch_month", fetch)
+    return published, requested
+
+
+def test_refresh_reloads_latest_month_then_stops_at_first_unpublished(db, census):
+    published, requested = census
+    db.add(stat("CHINA", "85", "2026-03", 100))
+    db.commit()
+
+    published["2026-03"] = {"85": 120}          # revised
+    published["2026-04"] = {"85": 80, "84": 40}
+
+    assert trade_stats.refresh_trade_stats(db) == 3
+    assert requested == ["2026-03", "2026-04", "2026-05"]
+
+    values = {(r.period, r.hs_chapter): r.general_value for r in db.query(TradeStat)}
+    assert values == {("2026-03", "85"): 120, ("2026-04", "85"): 80, ("2026-04", "84"): 40}
+    assert trade_stats.trade_stats_version() == "1"
+
+
+def test_backfill_skips_early_gaps(db, census, monkeypatch):
+    published, requested = census
+    monkeypatch.setattr(trade_stats, "TRADE_BACKFILL_MONTHS", 6)
+    published["2026-02"] = {"85": 1}
+    published["2026-03"] = {"85": 2}
+
+    assert trade_stats.refresh_trade_stats(db) == 2
+    # 2025-12 / 2026-01 are gaps before data; 2026-04 is past the newest release
+    assert requested == ["2025-12", "2026-01", "2026-02", "2026-03", "2026-04"]
+
+
+def test_nothing_new_keeps_the_version(db, census):
+    db.add(stat("CHINA", "85", "2026-05", 1))
+    db.commit()
+
+    assert trade_stats.refresh_trade_stats(db) == 0
+    assert trade_stats.trade_stats_version() == "0"
+
+
+class FakeCensusResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def test_fetch_month_keeps_real_countries_only(monkeypatch):
+    census_rows = [
+        ["CTY_CODE", "CTY_NAME", "I_COMMODITY", "GEN_VAL_MO", "CON_VAL_MO", "COMM_LVL", "time"],
+        ["-", "TOTAL FOR ALL COUNTRIES", "85", "9000", "8000", "HS2", "2026-04"],
+        ["0003", "EUROPEAN UNION", "85", "700", "650", "HS2", "2026-04"],
+        ["5XXX", "ASIA", "85", "2500", "2400", "HS2", "2026-04"],
+        ["5700", "China", "85", "1200", "1100", "HS2", "2026-04"],
+        ["4280", "GERMANY", "84", "300", "", "HS2", "2026-04"],
+    ]
+    monkeypatch.setattr(public_data_service, "_safe_get",
+                        lambda url, params=None, timeout=20: FakeCensusResponse(census_rows))
+
+    rows = trade_stats._fetch_month("2026-04")
+
+    assert [(r["country_code"], r["country_name"], r["general_value"], r["consumption_value"]) for r in rows] == [
+        ("5700", "CHINA", 1200, 1100),
+        ("4280", "GERMANY", 300, 0),
+    ]
@@ -1,8 +1,7 @@
 from app.database import SessionLocal
 from app.models import User, Supplier
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.security import update_user_access
+from app.services.supplier_autocomplete import GLOBAL_SCOPE, update_supplier_in_index
 
 def finalize_env():
     db = SessionLocal()
@@ -10,8 +9,7 @@ def finalize_env():
         # User config
         user = db.query(User).filter(User.username == "Bruce Wayne").first()
         if user:
-            user.hashed_password = pwd_context.hash("Batman")
-            db.commit()
+            update_user_access(db, user, password="Batman")
             print(f"User 'Bruce Wayne' password set to 'Batman'.")
         else:
             print("User 'Bruce Wayne' not found.")
@@ -19,8 +17,10 @@ def finalize_env():
         # Supplier config
         s = db.query(Supplier).filter(Supplier.name.ilike("%Alpha Defense%")).first()
         if s:
+            previous_scope = GLOBAL_SCOPE if s.is_global else s.organization_id
             s.is_global = True
             db.commit()
+            update_supplier_in_index(s, previous_scope)
             print(f"Supplier '{s.name}' (ID: {s.id}) is now GLOBAL.")
         else:
             print("Alpha Defense Systems not found")
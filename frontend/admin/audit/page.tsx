@@ -20,7 +20,7 @@ export default function AuditPage() {
     useEffect(() => {
         auditAPI
             .list({ resource_type: "Supplier" })
-            .then((res) => setLogs(res.data))
+            .then((res) => setLogs(res.data.items))
             .catch((err) => console.error("Audit fetch failed:", err))
             .finally(() => setLoading(false));
     }, []);
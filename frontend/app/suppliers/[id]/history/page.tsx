@@ -30,25 +30,39 @@ type DeltaResponse = {
 export default function SupplierHistoryPage() {
   const { id } = useParams();
   const [history, setHistory] = useState<Assessment[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selected, setSelected] = useState<number[]>([]);
   const [delta, setDelta] = useState<DeltaResponse | null>(null);
 
+  // Pages arrive newest first; later pages are appended
+  const fetchHistory = async (cursor?: string) => {
+    const res = await api.get(`/suppliers/${id}/history`, {
+      params: { cursor },
+    });
+    setHistory((prev) => (cursor ? [...prev, ...res.data.items] : res.data.items));
+    setNextCursor(res.data.next_cursor ?? null);
+  };
+
   useEffect(() => {
     if (!id) return;
 
-    api
-      .get(`/suppliers/${id}/history`)
-      .then((res) => {
-        const sorted = [...res.data].sort(
-          (a, b) =>
-            new Date(b.created_at).getTime() -
-            new Date(a.created_at).getTime()
-        );
-        setHistory(sorted);
-      })
-      .catch(console.error);
+    fetchHistory().catch(console.error);
   }, [id]);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      await fetchHistory(nextCursor);
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const latestVersion = history[0]?.scoring_version;
 
   const toggleSelect = (assessmentId: number) => {
@@ -164,6 +178,16 @@ export default function SupplierHistoryPage() {
 
         </div>
 
+        {nextCursor && (
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="px-5 py-2 text-sm border border-zinc-700 rounded-md hover:border-white transition disabled:opacity-50"
+          >
+            {loadingMore ? "Loading..." : "Load Older Assessments"}
+          </button>
+        )}
+
         {selected.length === 2 && (
           <button
             onClick={compareSelected}
@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useMemo, useState } from "react";
-import api from "@/lib/api";
+import api, { supplierAPI } from "@/lib/api";
 import { useRouter } from "next/navigation";
 
 type Supplier = {
@@ -15,6 +15,7 @@ type Supplier = {
 
 export default function SuppliersPage() {
   const [suppliers, setSuppliers] = useState<Supplier[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [selected, setSelected] = useState<number[]>([]);
   const [search, setSearch] = useState("");
   const [selectedCountry, setSelectedCountry] = useState("");
@@ -26,7 +27,8 @@ export default function SuppliersPage() {
 
   const router = useRouter();
 
-  const fetchSuppliers = async () => {
+  // Pass the previous page's next_cursor to append the following page
+  const fetchSuppliers = async (cursor?: string) => {
     setIsSearching(true);
     try {
       let res;
@@ -35,17 +37,22 @@ export default function SuppliersPage() {
           params: {
             ...(search.trim().length >= 2 ? { query: search.trim() } : {}),
             country: selectedCountry || undefined,
-            industry: selectedIndustry || undefined
+            industry: selectedIndustry || undefined,
+            cursor
           }
         });
-        setSuppliers(res.data.map((r: any) => r[0] || r));
       } else {
-        res = await api.get("/suppliers/with-status");
-        setSuppliers(Array.isArray(res.data) ? res.data : []);
+        res = await supplierAPI.listWithStatus(cursor);
       }
+      const items: Supplier[] = res.data.items ?? [];
+      setSuppliers(prev => (cursor ? [...prev, ...items] : items));
+      setNextCursor(res.data.next_cursor ?? null);
     } catch (err) {
       console.error("Failed to fetch suppliers:", err);
-      setSuppliers([]);
+      if (!cursor) {
+        setSuppliers([]);
+        setNextCursor(null);
+      }
     } finally {
       setIsSearching(false);
     }
@@ -245,6 +252,18 @@ export default function SuppliersPage() {
           })}
         </div>
 
+        {nextCursor && (
+          <div className="flex justify-center">
+            <button
+              onClick={() => fetchSuppliers(nextCursor)}
+              disabled={isSearching}
+              className="px-6 py-2 text-xs tracking-widest uppercase border border-zinc-700 hover:border-white transition disabled:opacity-50"
+            >
+              {isSearching ? "Loading..." : "Load More"}
+            </button>
+          </div>
+        )}
+
         {selected.length > 1 && (
           <div className="flex justify-end">
             <button
@@ -90,8 +90,8 @@ export const supplierAPI = {
   create: (payload: any) =>
     api.post("/suppliers", payload),
 
-  listWithStatus: () =>
-    api.get("/suppliers/with-status"),
+  listWithStatus: (cursor?: string) =>
+    api.get("/suppliers/with-status", { params: { cursor } }),
 
   assessment: (id: string) =>
     api.get(`/suppliers/${id}/assessment`),
@@ -99,7 +99,7 @@ export const supplierAPI = {
   resolveIdentity: (name: string) =>
     api.post("/suppliers/resolve", { name }),
 
-  search: (params: { query: string; country?: string; industry?: string }) =>
+  search: (params: { query: string; country?: string; industry?: string; cursor?: string }) =>
     api.get("/suppliers/search", { params }),
 };
 
@@ -119,6 +119,7 @@ export const auditAPI = {
     user_id?: number;
     action?: string;
     resource_type?: string;
+    cursor?: string;
   }) =>
     api.get("/audit", { params }),
 };
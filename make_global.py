@@ -1,13 +1,16 @@
 from app.database import SessionLocal
 from app.models import Supplier
+from app.services.supplier_autocomplete import GLOBAL_SCOPE, update_supplier_in_index
 
 def make_global():
     db = SessionLocal()
     try:
         s = db.query(Supplier).filter(Supplier.name == "Alpha Defense Systems").first()
         if s:
+            previous_scope = GLOBAL_SCOPE if s.is_global else s.organization_id
             s.is_global = True
             db.commit()
+            update_supplier_in_index(s, previous_scope)
             print(f"Supplier '{s.name}' (ID: {s.id}) is now GLOBAL.")
         else:
             print("Supplier 'Alpha Defense Systems' not found.")
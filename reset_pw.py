@@ -1,16 +1,13 @@
 from app.database import SessionLocal
 from app.models import User
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.security import update_user_access
 
 def reset_password():
     db = SessionLocal()
     try:
         user = db.query(User).filter(User.username == "Bruce W").first()
         if user:
-            user.hashed_password = pwd_context.hash("password123")
-            db.commit()
+            update_user_access(db, user, password="password123")
             print("Password for 'Bruce W' reset to 'password123'")
         else:
             print("User 'Bruce W' not found")